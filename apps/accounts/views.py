@@ -3,11 +3,9 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import authenticate, get_user_model, login, logout
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import EmailMultiAlternatives
+from django.db import transaction
 from django.shortcuts import get_object_or_404, redirect, render
-from django.template.loader import render_to_string
 from django.utils.encoding import force_bytes, force_str
-from django.utils.html import strip_tags
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from django.views.generic import View
 
@@ -17,17 +15,20 @@ from apps.accounts.forms import (
     ResetPasswordForm,
     SignupForm,
 )
-from apps.core.models import TokenRecord
+from apps.core.emails import build_email
+from apps.core.mixins import ExplicitTransactionMixin
+from apps.core.models import Organization, TokenRecord
 
 # User Model
 User = get_user_model()
 
 
 # Signup View
-class SignupView(View):
+class SignupView(ExplicitTransactionMixin, View):
     """User Signup View with Email Verification.
 
     Inherits:
+        ExplicitTransactionMixin
         View
 
     Methods:
@@ -61,37 +62,40 @@ class SignupView(View):
             # Set the user as inactive
             user.is_active = False
 
-            # Save the user
-            user.save()
+            # Add the user to the default organization, if there is one
+            user.organization = Organization.objects.filter(
+                slug=settings.DEFAULT_ORGANIZATION_SLUG, is_active=True
+            ).first()
 
-            # Create new token and uid
-            token = default_token_generator.make_token(user)
-            uid = urlsafe_base64_encode(force_bytes(user.pk))
+            # Save the user and the token record in a single transaction
+            with transaction.atomic():
+                # Save the user
+                user.save()
 
-            # Create user activation link
-            activation_link = request.build_absolute_uri(
-                f"/accounts/activate/{uid}/{token}/"
-            )
+                # Create new token and uid
+                token = default_token_generator.make_token(user)
+                uid = urlsafe_base64_encode(force_bytes(user.pk))
 
-            # Prepare the email data
-            subject = "Activate Your Account"
-            html_content = render_to_string(
-                "accounts/emails/activation_email.html",
-                {"user": user, "activation_link": activation_link},
-            )
-            text_content = strip_tags(html_content)
+                # Create user activation link
+                activation_link = request.build_absolute_uri(
+                    f"/accounts/activate/{uid}/{token}/"
+                )
 
-            # Create the email
-            email = EmailMultiAlternatives(
-                subject, text_content, settings.DEFAULT_FROM_EMAIL, [user.email]
-            )
-            email.attach_alternative(html_content, "text/html")
+                # Create the email from its text and HTML templates
+                email = build_email(
+                    "Activate Your Account",
+                    "accounts/emails/activation_email",
+                    {"user": user, "activation_link": activation_link},
+                    [user.email],
+                )
 
-            # Send the email
-            email.send()
+                # Send the email once the transaction is committed
+                transaction.on_commit(email.send)
 
-            # Create a new token record
-            TokenRecord.objects.create(user=user, token_type="activation", token=token)
+                # Create a new token record
+                TokenRecord.objects.create(
+                    user=user, token_type="activation", token=token
+                )
 
             # Add success message
             messages.success(
@@ -115,10 +119,11 @@ class SignupView(View):
 
 
 # User Activation View
-class ActivateView(View):
+class ActivateView(ExplicitTransactionMixin, View):
     """User Activation View.
 
     Inherits:
+        ExplicitTransactionMixin
         View
 
     Methods:
@@ -184,13 +189,15 @@ class ActivateView(View):
 
         # Check if the token is valid
         if default_token_generator.check_token(user, token):
-            # Activate the user and save
-            user.is_active = True
-            user.save()
+            # Activate the user and use up the token in a single transaction
+            with transaction.atomic():
+                # Activate the user and save
+                user.is_active = True
+                user.save()
 
-            # Update and save the token record
-            token_record.is_used = True
-            token_record.save()
+                # Update and save the token record
+                token_record.is_used = True
+                token_record.save()
 
             # Add success message
             messages.success(
@@ -208,10 +215,11 @@ class ActivateView(View):
 
 
 # User Login View
-class LoginView(View):
+class LoginView(ExplicitTransactionMixin, View):
     """User Login View.
 
     Inherits:
+        ExplicitTransactionMixin
         View
 
     Methods:
@@ -277,10 +285,11 @@ class LoginView(View):
 
 
 # User Logout View
-class LogoutView(View):
+class LogoutView(ExplicitTransactionMixin, View):
     """User Logout View.
 
     Inherits:
+        ExplicitTransactionMixin
         View
 
     Methods:
@@ -300,10 +309,11 @@ class LogoutView(View):
 
 
 # Forgot Password View
-class ForgotPasswordView(View):
+class ForgotPasswordView(ExplicitTransactionMixin, View):
     """Forgot Password View.
 
     Inherits:
+        ExplicitTransactionMixin
         View
 
     Methods:
@@ -339,36 +349,32 @@ class ForgotPasswordView(View):
 
             # Check if the user exists
             if user:
-                # Create new token and uid
-                token = default_token_generator.make_token(user)
-                uid = urlsafe_base64_encode(force_bytes(user.pk))
-
-                # Create user activation link
-                reset_link = request.build_absolute_uri(
-                    f"/accounts/reset-password/{uid}/{token}/"
-                )
-
-                # Prepare the email data
-                subject = "Reset Your Password"
-                html_content = render_to_string(
-                    "accounts/emails/reset_password_email.html",
-                    {"user": user, "reset_link": reset_link},
-                )
-                text_content = strip_tags(html_content)
-
-                # Create the email
-                email = EmailMultiAlternatives(
-                    subject, text_content, settings.DEFAULT_FROM_EMAIL, [user.email]
-                )
-                email.attach_alternative(html_content, "text/html")
-
-                # Send the email
-                email.send()
-
-                # Create a new token record
-                TokenRecord.objects.create(
-                    user=user, token_type="reset_password", token=token
-                )
+                # Create the token record in a transaction
+                with transaction.atomic():
+                    # Create new token and uid
+                    token = default_token_generator.make_token(user)
+                    uid = urlsafe_base64_encode(force_bytes(user.pk))
+
+                    # Create user activation link
+                    reset_link = request.build_absolute_uri(
+                        f"/accounts/reset-password/{uid}/{token}/"
+                    )
+
+                    # Create the email from its text and HTML templates
+                    email = build_email(
+                        "Reset Your Password",
+                        "accounts/emails/reset_password_email",
+                        {"user": user, "reset_link": reset_link},
+                        [user.email],
+                    )
+
+                    # Send the email once the transaction is committed
+                    transaction.on_commit(email.send)
+
+                    # Create a new token record
+                    TokenRecord.objects.create(
+                        user=user, token_type="reset_password", token=token
+                    )
 
                 # Add success message
                 messages.success(
@@ -388,10 +394,11 @@ class ForgotPasswordView(View):
 
 
 # Reset Password View
-class ResetPasswordView(View):
+class ResetPasswordView(ExplicitTransactionMixin, View):
     """Reset Password View.
 
     Inherits:
+        ExplicitTransactionMixin
         View
 
     Methods:
@@ -470,13 +477,17 @@ class ResetPasswordView(View):
 
             # Check if the token is valid
             if default_token_generator.check_token(user, token):
-                # Set the new password and save
+                # Hash the new password outside of the transaction
                 user.set_password(form.cleaned_data.get("password1"))
-                user.save()
 
-                # Update and save the token record and set as used
-                token_record.is_used = True
-                token_record.save()
+                # Save the password and use up the token in a single transaction
+                with transaction.atomic():
+                    # Save the user
+                    user.save()
+
+                    # Update and save the token record and set as used
+                    token_record.is_used = True
+                    token_record.save()
 
                 # Add success message
                 messages.success(
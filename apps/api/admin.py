@@ -0,0 +1,108 @@
+# Imports
+from django.contrib import admin, messages
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+
+from apps.api.models import ApiKey
+
+
+# Register the ApiKey model
+@admin.register(ApiKey)
+class ApiKeyAdmin(admin.ModelAdmin):
+    """API Key Admin
+
+    API Key Admin for the ApiKey model. The raw key is shown once, right after
+    the key is created.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        list_filter (list[str]): The list of fields to filter.
+        search_fields (list[str]): The list of fields to search.
+        ordering (list[str]): The list of fields to order by.
+        fields (list[str]): The fields of the form.
+        readonly_fields (list[str]): The list of read only fields.
+        raw_id_fields (list[str]): The list of raw id fields.
+        actions (list[str]): The list of actions.
+
+    Methods:
+        save_model: Generate the secret of a new key and show it once.
+        revoke_keys: Revoke the selected keys.
+    """
+
+    # Set model
+    model = ApiKey
+
+    # List display
+    list_display = [
+        "name",
+        "prefix",
+        "user",
+        "role",
+        "created_at",
+        "expires_at",
+        "revoked_at",
+    ]
+
+    # List filter
+    list_filter = ["role"]
+
+    # Search fields
+    search_fields = ["name", "prefix", "user__email"]
+
+    # Ordering
+    ordering = ["-created_at"]
+
+    # Fields
+    fields = [
+        "user",
+        "name",
+        "role",
+        "prefix",
+        "created_at",
+        "expires_at",
+        "revoked_at",
+    ]
+
+    # Set readonly fields
+    readonly_fields = ["prefix", "created_at", "revoked_at"]
+
+    # Set raw id fields
+    raw_id_fields = ["user"]
+
+    # Actions
+    actions = ["revoke_keys"]
+
+    # Method to save the key
+    def save_model(self, request, obj, form, change):
+        # If the key is edited, save it and drop its cached record once committed
+        if change:
+            super().save_model(request, obj, form, change)
+            transaction.on_commit(obj.invalidate)
+            return
+
+        # Generate the secret and save the key
+        raw_key = obj.set_secret()
+        super().save_model(request, obj, form, change)
+
+        # Show the raw key once
+        self.message_user(
+            request,
+            _("Copy the API key now, it is not shown again: %s") % raw_key,
+            messages.WARNING,
+        )
+
+    # Method to revoke the selected keys
+    @admin.action(description=_("Revoke the selected API keys"))
+    def revoke_keys(self, request, queryset):
+        # Traverse through the active keys
+        api_keys = list(queryset.filter(revoked_at__isnull=True))
+        for api_key in api_keys:
+            api_key.revoke()
+
+        # Show a message
+        self.message_user(
+            request, _("%d API key(s) revoked.") % len(api_keys), messages.SUCCESS
+        )
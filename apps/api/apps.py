@@ -0,0 +1,31 @@
+# Imports
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+# ApiConfig Class
+class ApiConfig(AppConfig):
+    """ApiConfig
+
+    ApiConfig class is used to configure the API app.
+
+    Inherits:
+        AppConfig
+
+    Attributes:
+        name (str): The name of the app.
+        verbose_name (str): The verbose name of the app.
+
+    Methods:
+        ready: Register the outbox consumers and signal handlers of the app.
+    """
+
+    # Attributes
+    name = "apps.api"
+    verbose_name = _("API")
+
+    # Method to register the outbox consumers and signal handlers
+    def ready(self):
+        # Import the modules that register outbox consumers and signal handlers
+        import apps.api.consumers  # noqa: F401
+        import apps.api.signals  # noqa: F401
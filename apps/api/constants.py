@@ -0,0 +1,46 @@
+# Fields of the users by name and lookup
+USER_FIELDS = {
+    "id": "id",
+    "username": "username",
+    "email": "email",
+    "first_name": "first_name",
+    "last_name": "last_name",
+    "role": "role",
+    "date_joined": "date_joined",
+    "updated_at": "updated_at",
+}
+
+# Fields of the leads by name and lookup
+LEAD_FIELDS = {
+    "id": "id",
+    "owner": "owner__id",
+    "first_name": "first_name",
+    "last_name": "last_name",
+    "email": "email",
+    "phone": "phone",
+    "company": "company",
+    "status": "status",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+# Fields of the activities by name and lookup
+ACTIVITY_FIELDS = {
+    "id": "id",
+    "lead": "lead__id",
+    "user": "user__id",
+    "kind": "kind",
+    "subject": "subject",
+    "note": "note",
+    "occurred_at": "occurred_at",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+# Roles an API key can be issued for, by the role of its user
+API_KEY_ROLES = {
+    "admin": ("admin", "manager", "sales", "support"),
+    "manager": ("manager", "sales", "support"),
+    "sales": ("sales",),
+    "support": ("support",),
+}
@@ -0,0 +1,24 @@
+# Imports
+from django.core.cache import cache
+
+from apps.api.models import ApiKey, api_key_cache_key
+from apps.core.models import OutboxEvent
+from apps.core.outbox import consumer
+
+
+# Consumer to drop the cached API keys of the changed users
+@consumer("core.user")
+def invalidate_user_api_keys(events: list[OutboxEvent]):
+    """Drop the cached keys of changed users, so deactivations and role changes apply.
+
+    Args:
+        events (list[OutboxEvent]): The outbox events of the users.
+    """
+
+    # Get the prefixes of the keys
+    prefixes = ApiKey.objects.filter(
+        user_id__in=[event.entity_id for event in events]
+    ).values_list("prefix", flat=True)
+
+    # Delete the records
+    cache.delete_many([api_key_cache_key(prefix) for prefix in prefixes])
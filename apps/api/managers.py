@@ -0,0 +1,70 @@
+# Imports
+import hashlib
+
+from django.db import models
+
+# Prefix of every API key, so leaked keys are easy to recognise
+API_KEY_PREFIX = "lt"
+
+
+# Function to hash the secret of an API key
+def hash_secret(secret: str) -> str:
+    """Hash the secret of an API key.
+
+    The secrets are random 256 bit tokens, so a single SHA-256 is enough and
+    verifying a key does not pay for a password hasher.
+
+    Args:
+        secret (str): The secret.
+
+    Returns:
+        str: The hex digest.
+    """
+
+    # Return the digest
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+
+# ApiKeyQuerySet Class
+class ApiKeyQuerySet(models.QuerySet):
+    """ApiKeyQuerySet
+
+    ApiKeyQuerySet class for the ApiKey model.
+
+    Inherits:
+        models.QuerySet
+
+    Methods:
+        issue: Create an API key and return it with its raw value.
+    """
+
+    # issue Method
+    def issue(self, user, name: str, role: str | None = None, **kwargs):
+        """issue
+
+        Creates an API key for a user. Only the prefix and the hash of the
+        secret are stored, the raw key is returned once.
+
+        Args:
+            user (User): The user the key acts for.
+            name (str): The name of the key.
+            role (str | None): The role of the key, the role of the user by default.
+            **kwargs: The other fields of the key.
+
+        Returns:
+            tuple[ApiKey, str]: The key and its raw value.
+
+        Raises:
+            ValidationError: If the user can not issue keys for the role.
+        """
+
+        # Create the key with a new secret
+        api_key = self.model(user=user, name=name, role=role or user.role, **kwargs)
+        raw_key = api_key.set_secret()
+
+        # Validate and save the key
+        api_key.full_clean()
+        api_key.save(using=self.db)
+
+        # Return the key and its raw value
+        return api_key, raw_key
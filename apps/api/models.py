@@ -0,0 +1,153 @@
+# Imports
+import secrets
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.api.constants import API_KEY_ROLES
+from apps.api.managers import API_KEY_PREFIX, ApiKeyQuerySet, hash_secret
+from apps.core.constants import ROLE_CHOICES
+
+
+# Function to get the cache key of an API key
+def api_key_cache_key(prefix: str) -> str:
+    """Get the cache key of the verification record of an API key.
+
+    Args:
+        prefix (str): The prefix of the API key.
+
+    Returns:
+        str: The cache key.
+    """
+
+    # Return the key
+    return f"api:key:{prefix}"
+
+
+# API Key Model
+class ApiKey(models.Model):
+    """API Key Model
+
+    API key model for the integrations calling the API without a session. A
+    key acts for its user with its own role, never above the role of the user.
+
+    Inherits:
+        models.Model
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the API key.
+        id (models.UUIDField): The UUID of the API key.
+        user (models.ForeignKey): The user the API key acts for.
+        name (models.CharField): The name of the API key.
+        role (models.CharField): The role the API key acts with.
+        prefix (models.CharField): The public prefix identifying the API key.
+        key_hash (models.CharField): The SHA-256 of the secret of the API key.
+        created_at (models.DateTimeField): The created date of the API key.
+        expires_at (models.DateTimeField): The expiry date of the API key.
+        revoked_at (models.DateTimeField): The revoked date of the API key.
+
+    Managers:
+        objects (ApiKeyQuerySet): The object manager of the API key.
+
+    Meta:
+        verbose_name (str): The verbose name of the API key.
+        verbose_name_plural (str): The verbose name of the API key in plural.
+        ordering (list[str]): The ordering of the API key.
+
+    Properties:
+        is_active (bool): Whether the API key can be used.
+
+    Methods:
+        set_secret: Generate the prefix and the secret of the API key.
+        clean: Validate the role of the API key.
+        revoke: Revoke the API key.
+        invalidate: Drop the cached verification record of the API key.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="api_keys"
+    )
+    name = models.CharField(_("name"), max_length=64)
+    role = models.CharField(_("role"), max_length=24, choices=ROLE_CHOICES)
+    prefix = models.CharField(_("prefix"), max_length=16, unique=True, editable=False)
+    key_hash = models.CharField(_("key hash"), max_length=64, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(_("expires at"), null=True, blank=True)
+    revoked_at = models.DateTimeField(_("revoked at"), null=True, blank=True)
+
+    # Set object manager
+    objects = ApiKeyQuerySet.as_manager()
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("API Key")
+        verbose_name_plural = _("API Keys")
+        ordering = ["-created_at"]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return f"{self.name} ({self.prefix})"
+
+    # Property to check if the key can be used
+    @property
+    def is_active(self) -> bool:
+        """Check if the API key can be used.
+
+        Returns:
+            bool: True if the key is neither revoked nor expired.
+        """
+        return self.revoked_at is None and (
+            self.expires_at is None or self.expires_at > timezone.now()
+        )
+
+    # Method to generate the prefix and the secret
+    def set_secret(self) -> str:
+        """Generate the prefix and the secret of the API key.
+
+        Only the prefix and the hash of the secret are stored, the raw key is
+        shown once.
+
+        Returns:
+            str: The raw key.
+        """
+
+        # Generate the prefix and the secret
+        self.prefix = secrets.token_hex(6)
+        secret = secrets.token_urlsafe(32)
+        self.key_hash = hash_secret(secret)
+
+        # Return the raw key
+        return f"{API_KEY_PREFIX}_{self.prefix}_{secret}"
+
+    # Method to validate the role of the key
+    def clean(self):
+        # If the user can not issue keys for the role
+        if self.user_id and self.role not in API_KEY_ROLES.get(self.user.role, ()):
+            raise ValidationError(
+                {"role": _("The role of an API key can not exceed the user role.")}
+            )
+
+    # Method to revoke the key
+    def revoke(self):
+        """Revoke the API key, effective on the next request."""
+
+        # Revoke the key and drop its cached record once committed
+        self.revoked_at = timezone.now()
+        self.save(update_fields=["revoked_at"])
+        transaction.on_commit(self.invalidate)
+
+    # Method to drop the cached verification record
+    def invalidate(self):
+        """Drop the cached verification record of the API key."""
+
+        # Delete the record
+        cache.delete(api_key_cache_key(self.prefix))
@@ -0,0 +1,15 @@
+# Imports
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from apps.api.models import ApiKey
+
+
+# Signal handler to drop the cached record of a deleted API key
+@receiver(post_delete, sender=ApiKey)
+def invalidate_deleted_api_key(sender, instance: ApiKey, using: str, **kwargs):
+    """Drop the cached verification record of a deleted key once committed."""
+
+    # Drop the record once committed
+    transaction.on_commit(instance.invalidate, using=using)
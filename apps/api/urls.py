@@ -0,0 +1,27 @@
+# Imports
+from django.urls import path
+
+from apps.api.views import (
+    ActivityResourceView,
+    LeadResourceView,
+    LeadSyncView,
+    UserResourceView,
+)
+
+# Set app name
+app_name = "api"
+
+# URL Patterns
+urlpatterns = [
+    path("users/", UserResourceView.as_view(), name="user-list"),
+    path("users/<uuid:id>/", UserResourceView.as_view(), name="user-detail"),
+    path("leads/", LeadResourceView.as_view(), name="lead-list"),
+    path("leads/<uuid:id>/", LeadResourceView.as_view(), name="lead-detail"),
+    path("sync/leads/", LeadSyncView.as_view(), name="lead-sync"),
+    path("activities/", ActivityResourceView.as_view(), name="activity-list"),
+    path(
+        "activities/<uuid:id>/",
+        ActivityResourceView.as_view(),
+        name="activity-detail",
+    ),
+]
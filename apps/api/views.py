@@ -0,0 +1,436 @@
+# Imports
+import hashlib
+from datetime import timedelta
+
+import orjson
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.db import router
+from django.db.models import Count, Exists, Max, OuterRef, QuerySet
+from django.http import Http404, HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.views.generic import View
+
+from apps.api.authentication import ApiKeyAuthenticationMixin
+from apps.api.constants import ACTIVITY_FIELDS, LEAD_FIELDS, USER_FIELDS
+from apps.core.mixins import ExplicitTransactionMixin
+from apps.core.routers import use_primary
+from apps.core.tenancy import get_current_organization_id
+from apps.leads.models import Activity, Lead, LeadTombstone, settled_version
+
+# Signer of the sync cursors
+cursor_signer = signing.TimestampSigner(salt="apps.api.sync")
+
+# User Model
+User = get_user_model()
+
+
+# Function to build a JSON response
+def json_response(data, status: int = 200) -> HttpResponse:
+    """Build a JSON response encoded with orjson.
+
+    orjson encodes UUIDs and datetimes natively, so rows from values_list()
+    are dumped as they come from the database.
+
+    Args:
+        data: The data of the response.
+        status (int): The status code of the response.
+
+    Returns:
+        HttpResponse: The response.
+    """
+
+    # Return the encoded data
+    return HttpResponse(
+        orjson.dumps(data), status=status, content_type="application/json"
+    )
+
+
+# API Error
+class ApiError(Exception):
+    """API Error
+
+    Raised for an invalid query parameter, answered with 400 by default.
+
+    Attributes:
+        errors (dict[str, list[str]]): The error messages by parameter.
+        status (int): The status code of the response.
+    """
+
+    # Constructor
+    def __init__(self, param: str, messages: list[str], status: int = 400):
+        # Set the attributes
+        super().__init__(param, messages)
+        self.errors = {param: messages}
+        self.status = status
+
+
+# Resource View
+class ResourceView(
+    ApiKeyAuthenticationMixin, LoginRequiredMixin, ExplicitTransactionMixin, View
+):
+    """Read only JSON view of a resource, as a list or a single object.
+
+    Rows are read with values_list() and encoded with orjson, no model is
+    instantiated. Clients pick the fields with ?fields=a,b. Every response
+    carries an ETag built from the count and the latest updated_at of the rows
+    it covers, so a conditional request is answered with 304 after a single
+    aggregate query. Integrations authenticate with an API key, browsers
+    with the session.
+
+    Inherits:
+        ApiKeyAuthenticationMixin
+        LoginRequiredMixin
+        ExplicitTransactionMixin
+        View
+
+    Attributes:
+        raise_exception (bool): Answer anonymous requests with 403.
+        fields (dict[str, str]): The lookups of the fields by name.
+        filters (dict[str, str]): The lookups of the filter parameters by name.
+        ordering (tuple[str]): The ordering of the list.
+
+    Methods:
+        get_queryset: Get the rows the user can access.
+        get_fields: Get the fields selected by the request.
+        filter_queryset: Apply the filter parameters of the request.
+        get_etag: Get the ETag of the rows.
+        get_page: Get the limit and offset of the list.
+        get_list: Get a page of the rows.
+        get_detail: Get a single row.
+        get: Method to handle get request
+    """
+
+    # Attributes
+    raise_exception = True
+    fields: dict[str, str] = {}
+    filters: dict[str, str] = {}
+    ordering: tuple[str, ...] = ("-pkid",)
+
+    # Method to get the rows the user can access
+    def get_queryset(self, request) -> QuerySet:
+        raise NotImplementedError
+
+    # Method to get the fields selected by the request
+    def get_fields(self, request) -> dict[str, str]:
+        # If the request selects no fields, return every field
+        param = request.GET.get("fields", "")
+        names = [name.strip() for name in param.split(",") if name.strip()]
+        if not names:
+            return self.fields
+
+        # If a field is unknown
+        unknown = [name for name in names if name not in self.fields]
+        if unknown:
+            raise ApiError("fields", [f"Unknown field: {name}." for name in unknown])
+
+        # Return the selected fields in the requested order
+        return {name: self.fields[name] for name in dict.fromkeys(names)}
+
+    # Method to apply the filter parameters
+    def filter_queryset(self, request, queryset: QuerySet) -> QuerySet:
+        # Traverse through the filter parameters
+        for param, lookup in self.filters.items():
+            # If the parameter is set, filter the rows
+            value = request.GET.get(param)
+            if value:
+                try:
+                    queryset = queryset.filter(**{lookup: value})
+                except ValidationError as error:
+                    raise ApiError(param, error.messages) from error
+
+        # Return the filtered rows
+        return queryset
+
+    # Method to get the ETag of the rows
+    def get_etag(self, request, queryset: QuerySet) -> str:
+        # Get the number of rows and the latest change
+        state = queryset.order_by().aggregate(
+            count=Count("pk"), updated_at=Max("updated_at")
+        )
+
+        # Hash the state with the user and the query
+        key = ":".join(
+            [
+                str(request.user.pk),
+                request.get_full_path(),
+                str(state["count"]),
+                str(state["updated_at"]),
+            ]
+        )
+
+        # Return the quoted ETag
+        return quote_etag(hashlib.sha256(key.encode()).hexdigest()[:32])
+
+    # Method to get the limit and offset of the list
+    def get_page(self, request) -> tuple[int, int]:
+        # Parse the parameters
+        page = {}
+        for param, default in (("limit", settings.API_PAGE_SIZE), ("offset", 0)):
+            try:
+                page[param] = int(request.GET.get(param, default))
+            except ValueError as error:
+                raise ApiError(param, ["Enter a whole number."]) from error
+
+        # Return the page, limited to API_MAX_PAGE_SIZE rows
+        limit = max(1, min(page["limit"], settings.API_MAX_PAGE_SIZE))
+        return limit, max(0, page["offset"])
+
+    # Method to get a page of the rows
+    def get_list(self, request, queryset: QuerySet, fields: dict[str, str]) -> dict:
+        # Fetch one row more than the page to know if there is a next one
+        limit, offset = self.get_page(request)
+        rows = queryset.order_by(*self.ordering).values_list(*fields.values())
+        results = [dict(zip(fields, row)) for row in rows[offset : offset + limit + 1]]
+
+        # If there is a next page, link it
+        next_url = None
+        if len(results) > limit:
+            results.pop()
+            query = request.GET.copy()
+            query["offset"] = offset + limit
+            next_url = request.build_absolute_uri(f"{request.path}?{query.urlencode()}")
+
+        # Return the page
+        return {"results": results, "next": next_url}
+
+    # Method to get a single row
+    def get_detail(self, queryset: QuerySet, fields: dict[str, str]) -> dict:
+        # Get the row or 404
+        row = queryset.values_list(*fields.values()).first()
+        if row is None:
+            raise Http404
+
+        # Return the row
+        return dict(zip(fields, row))
+
+    # Method to handle get request
+    def get(self, request, id=None):
+        try:
+            # Get the fields and the rows of the request
+            fields = self.get_fields(request)
+            queryset = self.filter_queryset(request, self.get_queryset(request))
+            if id is not None:
+                queryset = queryset.filter(id=id)
+
+            # If the client has the current version, answer with 304
+            etag = self.get_etag(request, queryset)
+            response = get_conditional_response(request, etag=etag)
+
+            # Otherwise render the rows
+            if response is None:
+                if id is None:
+                    data = self.get_list(request, queryset, fields)
+                else:
+                    data = self.get_detail(queryset, fields)
+                response = json_response(data)
+
+        # If a query parameter is invalid
+        except ApiError as error:
+            return json_response({"errors": error.errors}, status=error.status)
+
+        # Let the client revalidate with the ETag before every reuse
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+
+        # Return the response
+        return response
+
+
+# User Resource View
+class UserResourceView(ResourceView):
+    """Active users of the organization, filtered with ?role=.
+
+    Inherits:
+        ResourceView
+    """
+
+    # Attributes
+    fields = USER_FIELDS
+    filters = {"role": "role"}
+    ordering = ("-date_joined", "-pkid")
+
+    # Method to get the rows the user can access
+    def get_queryset(self, request) -> QuerySet:
+        # Get the active users
+        users = User.objects.filter(is_active=True)
+
+        # If the request acts for an organization, return its users
+        organization_id = get_current_organization_id()
+        if organization_id is not None:
+            users = users.filter(organization_id=organization_id)
+
+        # Return the users
+        return users
+
+
+# Lead Resource View
+class LeadResourceView(ResourceView):
+    """Leads the user can access, filtered with ?status= and ?owner=.
+
+    Inherits:
+        ResourceView
+    """
+
+    # Attributes
+    fields = LEAD_FIELDS
+    filters = {"status": "status", "owner": "owner__id"}
+    ordering = ("-created_at", "-pkid")
+
+    # Method to get the rows the user can access
+    def get_queryset(self, request) -> QuerySet:
+        # Return the visible leads
+        return Lead.objects.visible_to(request.user)
+
+
+# Activity Resource View
+class ActivityResourceView(ResourceView):
+    """Activities of the leads the user can access, filtered with ?lead= and ?kind=.
+
+    Inherits:
+        ResourceView
+    """
+
+    # Attributes
+    fields = ACTIVITY_FIELDS
+    filters = {"lead": "lead__id", "kind": "kind"}
+    ordering = ("-occurred_at", "-pkid")
+
+    # Method to get the rows the user can access
+    def get_queryset(self, request) -> QuerySet:
+        # Return the visible activities
+        return Activity.objects.visible_to(request.user)
+
+
+# Lead Sync View
+class LeadSyncView(ResourceView):
+    """Changes to the leads of the user since a sync cursor.
+
+    A client sends the cursor of its last sync and receives the leads saved
+    and the UUIDs of the leads deleted or taken away since then, in the order
+    of the change sequence. Pages hold up to ?limit= changes. The client calls
+    again with the returned cursor while has_more is true. Without a cursor
+    every lead is sent. A cursor is signed and expires after
+    LEADS_SYNC_CURSOR_MAX_AGE seconds, then the client answers a 410 with a
+    full sync.
+
+    Inherits:
+        ResourceView
+
+    Methods:
+        get_cursor: Get the version of the sync cursor.
+        get_cutoff: Get the last settled version.
+        get: Method to handle get request
+    """
+
+    # Attributes
+    fields = LEAD_FIELDS
+
+    # Method to get the version of the sync cursor
+    def get_cursor(self, request) -> int:
+        # If the client syncs for the first time
+        cursor = request.GET.get("cursor")
+        if not cursor:
+            return 0
+
+        # Return the version of the cursor
+        try:
+            return int(
+                cursor_signer.unsign(cursor, max_age=settings.LEADS_SYNC_CURSOR_MAX_AGE)
+            )
+        except signing.SignatureExpired as error:
+            raise ApiError(
+                "cursor", ["The cursor expired, sync again."], status=410
+            ) from error
+        except (signing.BadSignature, ValueError) as error:
+            raise ApiError("cursor", ["The cursor is invalid."]) from error
+
+    # Method to get the last settled version
+    def get_cutoff(self) -> int:
+        """Get the last version a cursor can stop at without skipping a change.
+
+        Versions are taken in order but commit in any order. On PostgreSQL the
+        cutoff sits below the first version still in flight. Elsewhere it is
+        the last version saved before the settle window.
+
+        Returns:
+            int: The version, 0 if no change settled yet.
+        """
+
+        # If the database tracks the versions in flight
+        version = settled_version(router.db_for_read(Lead))
+        if version is not None:
+            return version
+
+        # Get the last lead saved and the last lead removed before the window
+        settled = timezone.now() - timedelta(seconds=settings.LEADS_SYNC_SETTLE_SECONDS)
+        versions = [
+            Lead.objects.filter(updated_at__lte=settled)
+            .order_by("-version")
+            .values_list("version", flat=True)
+            .first(),
+            LeadTombstone.objects.filter(deleted_at__lte=settled)
+            .order_by("-version")
+            .values_list("version", flat=True)
+            .first(),
+        ]
+
+        # Return the later of both versions
+        return max(version or 0 for version in versions)
+
+    # Method to handle get request
+    def get(self, request):
+        try:
+            # Get the fields, the page size and the cursor of the request
+            fields = {"id": "id", **self.get_fields(request)}
+            limit, _ = self.get_page(request)
+            version = self.get_cursor(request)
+
+        # If a query parameter is invalid or the cursor expired
+        except ApiError as error:
+            return json_response({"errors": error.errors}, status=error.status)
+
+        # Read from the primary, a lagging replica could skip changes
+        with use_primary():
+            # Hold back the changes that may still have uncommitted predecessors
+            cutoff = self.get_cutoff()
+
+            # Get the saved leads, one more than the page to know if there are more
+            leads = Lead.objects.visible_to(request.user)
+            changed = list(
+                leads.filter(version__gt=version, version__lte=cutoff)
+                .order_by("version")
+                .values_list("version", *fields.values())[: limit + 1]
+            )
+
+            # Get the removed leads the user can no longer access
+            deleted = list(
+                LeadTombstone.objects.visible_to(request.user)
+                .filter(version__gt=version, version__lte=cutoff)
+                .exclude(Exists(leads.filter(id=OuterRef("lead_uuid"))))
+                .order_by("version")
+                .values_list("version", "lead_uuid")[: limit + 1]
+            )
+
+        # Merge both in the order of the change sequence and cut the page
+        changes = sorted(
+            [(row[0], dict(zip(fields, row[1:]))) for row in changed]
+            + [(row[0], row[1]) for row in deleted],
+            key=lambda change: change[0],
+        )
+        page = changes[:limit]
+
+        # Return the page and the cursor after it
+        return json_response(
+            {
+                "changed": [data for _, data in page if isinstance(data, dict)],
+                "deleted": [data for _, data in page if not isinstance(data, dict)],
+                "cursor": cursor_signer.sign(str(page[-1][0] if page else version)),
+                "has_more": len(changes) > limit,
+            }
+        )
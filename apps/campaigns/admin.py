@@ -0,0 +1,172 @@
+# Imports
+import uuid
+from functools import partial
+
+from django.contrib import admin, messages
+from django.db import transaction
+from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
+
+from apps.campaigns.models import Campaign, CampaignRecipient, Variant
+from apps.campaigns.tasks import start_campaign
+from apps.core.tenancy import use_organization
+
+
+# Function to start a campaign for its organization
+def start_campaign_for(
+    campaign_id: int, organization_id: int, owner_id: int, task_id: str
+):
+    """Queue the start of a campaign for the organization of the campaign."""
+
+    # Queue the task for the organization, its progress for the user starting it
+    with use_organization(organization_id):
+        start_campaign.apply_async(
+            (campaign_id,), {"owner_id": owner_id}, task_id=task_id
+        )
+
+
+# Variant Inline
+class VariantInline(admin.StackedInline):
+    """Variant Inline
+
+    Variant Inline for the Campaign Admin.
+
+    Inherits:
+        admin.StackedInline
+
+    Attributes:
+        model (Variant): The model of the inline.
+        extra (int): The number of empty forms.
+    """
+
+    # Attributes
+    model = Variant
+    extra = 1
+
+
+# Register the Campaign model
+@admin.register(Campaign)
+class CampaignAdmin(admin.ModelAdmin):
+    """Campaign Admin
+
+    Campaign Admin for the Campaign model.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        list_filter (list[str]): The list of fields to filter.
+        search_fields (list[str]): The list of fields to search.
+        ordering (list[str]): The list of fields to order by.
+        readonly_fields (list[str]): The list of read only fields.
+        inlines (list[admin.StackedInline]): The inlines of the campaign.
+        actions (list[str]): The actions of the campaign.
+
+    Methods:
+        send_campaigns: Start sending the selected draft campaigns.
+    """
+
+    # Set model
+    model = Campaign
+
+    # List display
+    list_display = [
+        "name",
+        "status",
+        "lead_status",
+        "created_by",
+        "started_at",
+        "finished_at",
+    ]
+
+    # List filter
+    list_filter = ["status"]
+
+    # Search fields
+    search_fields = ["name"]
+
+    # Ordering
+    ordering = ["-created_at"]
+
+    # Set readonly fields
+    readonly_fields = ["status", "created_at", "started_at", "finished_at"]
+
+    # Set raw id fields
+    raw_id_fields = ["created_by"]
+
+    # Inlines
+    inlines = [VariantInline]
+
+    # Actions
+    actions = ["send_campaigns"]
+
+    # Method to start sending the selected campaigns
+    @admin.action(description=_("Send the selected draft campaigns"))
+    def send_campaigns(self, request, queryset):
+        # Get the draft campaigns
+        campaigns = list(
+            queryset.filter(status="draft").values_list("pkid", "organization_id")
+        )
+
+        # Start the campaigns for their organizations once the transaction is committed
+        urls = []
+        for pkid, organization_id in campaigns:
+            task_id = str(uuid.uuid4())
+            transaction.on_commit(
+                partial(
+                    start_campaign_for, pkid, organization_id, request.user.pk, task_id
+                )
+            )
+            urls.append(reverse("core:task-progress", args=[task_id]))
+
+        # Show a message with the progress of the starts
+        self.message_user(
+            request,
+            _("%(count)d campaign(s) queued, progress: %(urls)s")
+            % {"count": len(campaigns), "urls": ", ".join(urls) or "-"},
+            messages.SUCCESS,
+        )
+
+
+# Register the CampaignRecipient model
+@admin.register(CampaignRecipient)
+class CampaignRecipientAdmin(admin.ModelAdmin):
+    """Campaign Recipient Admin
+
+    Campaign Recipient Admin for the CampaignRecipient model.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        list_filter (list[str]): The list of fields to filter.
+        search_fields (list[str]): The list of fields to search.
+        readonly_fields (list[str]): The list of read only fields.
+    """
+
+    # Set model
+    model = CampaignRecipient
+
+    # List display
+    list_display = ["email", "campaign", "variant", "status", "sent_at"]
+
+    # List filter
+    list_filter = ["status"]
+
+    # Search fields
+    search_fields = ["email", "domain"]
+
+    # Set readonly fields
+    readonly_fields = [
+        "campaign",
+        "variant",
+        "lead",
+        "email",
+        "domain",
+        "status",
+        "error",
+        "claimed_at",
+        "sent_at",
+    ]
@@ -0,0 +1,22 @@
+# Imports
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+# CampaignsConfig Class
+class CampaignsConfig(AppConfig):
+    """CampaignsConfig
+
+    CampaignsConfig class is used to configure the campaigns app.
+
+    Inherits:
+        AppConfig
+
+    Attributes:
+        name (str): The name of the app.
+        verbose_name (str): The verbose name of the app.
+    """
+
+    # Attributes
+    name = "apps.campaigns"
+    verbose_name = _("Campaigns")
@@ -0,0 +1,23 @@
+# Imports
+from django.utils.translation import gettext_lazy as _
+
+# Campaign Statuses
+CAMPAIGN_STATUSES = (
+    ("draft", _("Draft")),
+    ("sending", _("Sending")),
+    ("sent", _("Sent")),
+    ("cancelled", _("Cancelled")),
+)
+
+# Recipient Statuses
+RECIPIENT_STATUSES = (
+    ("pending", _("Pending")),
+    ("claimed", _("Claimed")),
+    ("sending", _("Sending")),
+    ("sent", _("Sent")),
+    ("failed", _("Failed")),
+    ("interrupted", _("Interrupted")),
+)
+
+# Fields of a lead that can be merged into a campaign as [[name]]
+MERGE_FIELDS = ("first_name", "last_name", "full_name", "email", "company")
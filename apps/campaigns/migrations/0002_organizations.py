@@ -0,0 +1,67 @@
+# Generated by Django 4.2.17 on 2026-10-19 19:37
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def set_organizations(apps, schema_editor):
+    # Give the existing rows to the default organization
+    Organization = apps.get_model('core', 'Organization')
+    using = schema_editor.connection.alias
+    organization, _ = Organization.objects.using(using).get_or_create(
+        slug=settings.DEFAULT_ORGANIZATION_SLUG, defaults={'name': 'Default'}
+    )
+    for model_name in ['campaign', 'variant', 'campaignrecipient']:
+        model = apps.get_model('campaigns', model_name)
+        model.objects.using(using).update(organization=organization)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_organizations'),
+        ('campaigns', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='campaignrecipient',
+            name='campaign_recipient_status_idx',
+        ),
+        migrations.AddField(
+            model_name='campaign',
+            name='organization',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AddField(
+            model_name='campaignrecipient',
+            name='organization',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AddField(
+            model_name='variant',
+            name='organization',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.RunPython(set_organizations, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='campaign',
+            name='organization',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AlterField(
+            model_name='variant',
+            name='organization',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AlterField(
+            model_name='campaignrecipient',
+            name='organization',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AddIndex(
+            model_name='campaignrecipient',
+            index=models.Index(fields=['organization', 'campaign', 'status', 'domain'], name='campaign_recipient_status_idx'),
+        ),
+    ]
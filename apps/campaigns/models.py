@@ -0,0 +1,230 @@
+# Imports
+import uuid
+
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.campaigns.constants import CAMPAIGN_STATUSES, RECIPIENT_STATUSES
+from apps.core.models import TenantModel
+from apps.leads.constants import LEAD_STATUSES
+from apps.leads.models import Lead
+
+
+# Campaign Model
+class Campaign(TenantModel):
+    """Campaign Model
+
+    Campaign model for the bulk emails sent to a segment of leads.
+
+    Inherits:
+        TenantModel
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the campaign.
+        id (models.UUIDField): The UUID of the campaign.
+        name (models.CharField): The name of the campaign.
+        created_by (models.ForeignKey): The user sending the campaign.
+        lead_status (models.CharField): The status of the leads to email, all if empty.
+        from_email (models.EmailField): The sender address, DEFAULT_FROM_EMAIL if empty.
+        status (models.CharField): The status of the campaign.
+        created_at (models.DateTimeField): The created date of the campaign.
+        started_at (models.DateTimeField): The date the sending started.
+        finished_at (models.DateTimeField): The date the sending finished.
+
+    Meta:
+        verbose_name (str): The verbose name of the campaign.
+        verbose_name_plural (str): The verbose name of the campaign in plural.
+        ordering (list[str]): The ordering of the campaign.
+
+    Methods:
+        get_leads: Get the leads of the segment.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    name = models.CharField(_("name"), max_length=128)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="campaigns",
+    )
+    lead_status = models.CharField(
+        _("lead status"), max_length=24, choices=LEAD_STATUSES, blank=True
+    )
+    from_email = models.EmailField(_("from email"), blank=True)
+    status = models.CharField(
+        _("status"), max_length=24, choices=CAMPAIGN_STATUSES, default="draft"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Campaign")
+        verbose_name_plural = _("Campaigns")
+        ordering = ["-created_at"]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return self.name
+
+    # Method to get the leads of the segment
+    def get_leads(self):
+        """Get the leads of the segment, as visible to the sender.
+
+        Returns:
+            LeadQuerySet: The leads with an email address.
+        """
+
+        # Get the leads of the organization visible to the sender
+        leads = (
+            Lead.objects.filter(organization_id=self.organization_id)
+            .visible_to(self.created_by)
+            .exclude(email="")
+        )
+
+        # Filter the leads by status
+        if self.lead_status:
+            leads = leads.filter(status=self.lead_status)
+
+        # Return the leads
+        return leads
+
+
+# Variant Model
+class Variant(TenantModel):
+    """Variant Model
+
+    Variant model for a version of the campaign email. The recipients are
+    split evenly between the variants.
+
+    The subject and bodies are Django templates rendered once per variant
+    with the site name and the merge fields in the context. Lead fields are
+    merged per recipient from [[field]] placeholders, {{ field }} renders
+    one, see apps.campaigns.rendering.
+
+    Inherits:
+        TenantModel
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the variant.
+        campaign (models.ForeignKey): The campaign of the variant.
+        name (models.CharField): The name of the variant.
+        subject (models.CharField): The subject template.
+        body_text (models.TextField): The plain text body template.
+        body_html (models.TextField): The HTML body template, optional.
+        updated_at (models.DateTimeField): The updated date of the variant.
+
+    Meta:
+        verbose_name (str): The verbose name of the variant.
+        verbose_name_plural (str): The verbose name of the variant in plural.
+        ordering (list[str]): The ordering of the variant.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    campaign = models.ForeignKey(
+        Campaign, on_delete=models.CASCADE, related_name="variants"
+    )
+    name = models.CharField(_("name"), max_length=64, default="A")
+    subject = models.CharField(_("subject"), max_length=255)
+    body_text = models.TextField(_("plain text body"))
+    body_html = models.TextField(_("HTML body"), blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Take the organization from the campaign
+    tenant_parent = "campaign"
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Variant")
+        verbose_name_plural = _("Variants")
+        ordering = ["pkid"]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return f"{self.campaign} ({self.name})"
+
+
+# Campaign Recipient Model
+class CampaignRecipient(TenantModel):
+    """Campaign Recipient Model
+
+    Campaign Recipient model for the send state of every recipient. The state
+    is written after every message, so a resumed campaign never emails a
+    recipient twice.
+
+    Inherits:
+        TenantModel
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the recipient.
+        campaign (models.ForeignKey): The campaign of the recipient.
+        variant (models.ForeignKey): The variant sent to the recipient.
+        lead (models.ForeignKey): The lead of the recipient.
+        email (models.EmailField): The email address of the recipient.
+        domain (models.CharField): The domain of the email address.
+        status (models.CharField): The send status of the recipient.
+        error (models.TextField): The error of a failed send.
+        claimed_at (models.DateTimeField): The date a batch claimed the recipient.
+        sent_at (models.DateTimeField): The date the email was sent.
+
+    Meta:
+        verbose_name (str): The verbose name of the recipient.
+        verbose_name_plural (str): The verbose name of the recipient in plural.
+        constraints (list[models.UniqueConstraint]): One recipient per address.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    campaign = models.ForeignKey(
+        Campaign, on_delete=models.CASCADE, related_name="recipients"
+    )
+    variant = models.ForeignKey(
+        Variant, on_delete=models.CASCADE, related_name="recipients"
+    )
+    lead = models.ForeignKey(
+        Lead,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="campaign_recipients",
+    )
+    email = models.EmailField(_("email address"))
+    domain = models.CharField(_("domain"), max_length=255)
+    status = models.CharField(
+        _("status"), max_length=24, choices=RECIPIENT_STATUSES, default="pending"
+    )
+    error = models.TextField(_("error"), blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    # Take the organization from the campaign
+    tenant_parent = "campaign"
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Campaign Recipient")
+        verbose_name_plural = _("Campaign Recipients")
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["campaign", "email"], name="campaign_recipient_unique"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["organization", "campaign", "status", "domain"],
+                name="campaign_recipient_status_idx",
+            ),
+        ]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return self.email
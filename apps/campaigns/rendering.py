@@ -0,0 +1,81 @@
+# Imports
+from typing import NamedTuple
+
+from django.conf import settings
+from django.template import Context, Template
+
+from apps.campaigns.constants import MERGE_FIELDS
+from apps.core.emails import compile_merge
+
+
+# Rendered Variant
+class RenderedVariant(NamedTuple):
+    """Rendered Variant
+
+    A campaign variant rendered once, split into literal text and merge
+    fields so merging a recipient is a plain join.
+
+    Attributes:
+        subject (list[str]): The compiled subject.
+        text (list[str]): The compiled plain text body.
+        html (list[str] | None): The compiled HTML body.
+    """
+
+    subject: list[str]
+    text: list[str]
+    html: list[str] | None
+
+
+# Function to render a variant
+def render_variant(variant) -> RenderedVariant:
+    """Render the templates of a variant once for every recipient.
+
+    Args:
+        variant (Variant): The variant.
+
+    Returns:
+        RenderedVariant: The compiled variant.
+    """
+
+    # Build the shared context from plain strings only, the merge fields render
+    # as their placeholders and are merged per recipient
+    context = {name: f"[[{name}]]" for name in MERGE_FIELDS}
+    context["site_name"] = settings.SITE_NAME
+
+    # Render the plain text templates without escaping
+    subject = Template(variant.subject).render(Context(context, autoescape=False))
+    text = Template(variant.body_text).render(Context(context, autoescape=False))
+
+    # Render the HTML template
+    html = None
+    if variant.body_html:
+        html = Template(variant.body_html).render(Context(context))
+
+    # Return the compiled variant, the subject must fit on one line
+    return RenderedVariant(
+        subject=compile_merge(" ".join(subject.split())),
+        text=compile_merge(text),
+        html=compile_merge(html) if html is not None else None,
+    )
+
+
+# Function to get the merge fields of a lead
+def get_merge_fields(lead, email: str) -> dict[str, str]:
+    """Get the merge fields of a recipient.
+
+    Args:
+        lead (Lead | None): The lead of the recipient.
+        email (str): The email address of the recipient.
+
+    Returns:
+        dict[str, str]: The merge fields by name.
+    """
+
+    # If the lead was deleted, only the address is known
+    if lead is None:
+        return {"email": email}
+
+    # Return the fields of the lead
+    return {name: str(getattr(lead, name) or "") for name in MERGE_FIELDS} | {
+        "email": email
+    }
@@ -0,0 +1,385 @@
+# Imports
+import smtplib
+from datetime import timedelta
+
+from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from apps.campaigns.models import Campaign, CampaignRecipient
+from apps.campaigns.rendering import get_merge_fields, render_variant
+from apps.campaigns.throttle import DomainThrottle
+from apps.core.emails import merge
+from apps.core.progress import TaskProgress
+from apps.core.routers import use_primary
+from apps.core.tenancy import tenant_aliases, use_organization
+
+
+# Function to check if an error broke the SMTP connection
+def is_connection_error(error: Exception) -> bool:
+    """Check if a send error broke the SMTP connection.
+
+    SMTPException derives from OSError, so rejections of a single message
+    are told apart from socket errors and disconnects.
+
+    Args:
+        error (Exception): The error.
+
+    Returns:
+        bool: True if the connection can not be used anymore.
+    """
+
+    # Return the connection error status
+    return isinstance(error, smtplib.SMTPServerDisconnected) or not isinstance(
+        error, smtplib.SMTPException
+    )
+
+
+# Function to get the SMTP connection of the campaigns
+def get_campaign_connection():
+    """Get the email connection the campaigns are sent through.
+
+    Campaigns use the backend django-celery-email delivers with, opened once
+    per batch. In sink mode every message goes to the local SMTP sink instead.
+
+    Returns:
+        BaseEmailBackend: The email backend.
+    """
+
+    # If sink mode is enabled
+    if settings.CAMPAIGN_EMAIL_SINK:
+        return get_connection(
+            "django.core.mail.backends.smtp.EmailBackend",
+            host=settings.CAMPAIGN_SINK_HOST,
+            port=settings.CAMPAIGN_SINK_PORT,
+            username="",
+            password="",
+            use_tls=False,
+            use_ssl=False,
+        )
+
+    # Return the connection of django-celery-email
+    return get_connection(
+        getattr(
+            settings,
+            "CELERY_EMAIL_BACKEND",
+            "django.core.mail.backends.smtp.EmailBackend",
+        )
+    )
+
+
+# Task to start a campaign
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    soft_time_limit=settings.BULK_TASK_TIME_LIMIT,
+    time_limit=settings.BULK_TASK_TIME_LIMIT + 60,
+)
+def start_campaign(self, campaign_id: int, owner_id: int | None = None):
+    """Create the recipients of a campaign and start sending it.
+
+    Recipients are inserted idempotently, so the task can be retried. The
+    progress of the insert is recorded for the user who started the campaign.
+
+    Args:
+        campaign_id (int): The primary key of the campaign.
+        owner_id (int | None): The primary key of the user who started it.
+    """
+
+    # Record the progress for the user who started the campaign
+    progress = TaskProgress(self.request.id, total=0, owner_id=owner_id)
+
+    # Get the campaign, it was just started
+    with use_primary():
+        campaign = (
+            Campaign.objects.select_related("created_by")
+            .filter(pkid=campaign_id, status__in=("draft", "sending"))
+            .first()
+        )
+
+    # If the campaign is gone, finished or has no variant
+    variants = (
+        list(campaign.variants.values_list("pkid", flat=True)) if campaign else []
+    )
+    if not variants:
+        progress.finish("failed")
+        return
+
+    # If the recipients are not created yet
+    if campaign.status == "draft":
+        # Count the leads of the segment
+        leads = campaign.get_leads().order_by("pkid").values_list("pkid", "email")
+        progress.total = leads.count()
+        progress.update(0, force=True)
+
+        # Traverse through the leads of the segment
+        recipients = []
+        for index, (lead_id, email) in enumerate(leads.iterator(chunk_size=2000)):
+            # Split the leads evenly between the variants
+            email = email.lower()
+            recipients.append(
+                CampaignRecipient(
+                    organization_id=campaign.organization_id,
+                    campaign=campaign,
+                    variant_id=variants[index % len(variants)],
+                    lead_id=lead_id,
+                    email=email,
+                    domain=email.rsplit("@", 1)[-1],
+                )
+            )
+
+            # Insert the recipients in chunks
+            if len(recipients) >= 1000:
+                CampaignRecipient.objects.bulk_create(recipients, ignore_conflicts=True)
+                recipients = []
+                progress.update(index + 1)
+
+        # Insert the remaining recipients
+        CampaignRecipient.objects.bulk_create(recipients, ignore_conflicts=True)
+
+        # Mark the campaign as sending
+        Campaign.objects.filter(pkid=campaign.pkid, status="draft").update(
+            status="sending", started_at=timezone.now()
+        )
+
+    # Start the batch loops
+    for _ in range(settings.CAMPAIGN_PARALLEL_BATCHES):
+        send_campaign_batch.delay(campaign.pkid)
+
+    # Record the end of the start
+    progress.finish()
+
+
+# Function to recover the recipients of a lost batch
+def recover_stale_claims(campaign: Campaign):
+    """Recover the recipients a lost worker claimed.
+
+    Claimed recipients were never attempted and go back to pending. A
+    recipient caught while sending may have been emailed, so it is marked
+    interrupted rather than sent again.
+
+    Args:
+        campaign (Campaign): The campaign.
+    """
+
+    # Get the stale recipients
+    stale = CampaignRecipient.objects.filter(
+        campaign=campaign,
+        claimed_at__lt=timezone.now()
+        - timedelta(seconds=settings.CAMPAIGN_CLAIM_TIMEOUT),
+    )
+
+    # Release the claimed and interrupt the sending recipients
+    stale.filter(status="claimed").update(status="pending", claimed_at=None)
+    stale.filter(status="sending").update(status="interrupted")
+
+
+# Task to send a batch of a campaign
+@shared_task(
+    bind=True,
+    max_retries=10,
+    default_retry_delay=60,
+    soft_time_limit=settings.CAMPAIGN_CLAIM_TIMEOUT - 2 * 60,
+    time_limit=settings.CAMPAIGN_CLAIM_TIMEOUT - 60,
+)
+def send_campaign_batch(self, campaign_id: int):
+    """Send the next batch of a campaign over one SMTP connection.
+
+    Every recipient is checkpointed before and after its message, so a crashed
+    worker never causes a duplicate. Domains over their rate limit are left out
+    of the claim, or skipped and retried in a later batch. The task enqueues
+    itself until no recipient is pending. A batch stops before its claims go
+    stale, the rest of it is sent by the next one.
+
+    Args:
+        campaign_id (int): The primary key of the campaign.
+    """
+
+    # Get the campaign, a lagging replica would end the loop early
+    with use_primary():
+        campaign = Campaign.objects.filter(pkid=campaign_id, status="sending").first()
+
+    # If the campaign is gone, finished or cancelled
+    if campaign is None:
+        return
+
+    # Recover the recipients of lost batches
+    recover_stale_claims(campaign)
+
+    # Claim the next batch, skipping the domains over their limit
+    throttle = DomainThrottle()
+    waits = throttle.throttled()
+    with transaction.atomic():
+        pks = list(
+            CampaignRecipient.objects.select_for_update(skip_locked=True)
+            .filter(campaign=campaign, status="pending")
+            .exclude(domain__in=waits)
+            .order_by("pkid")
+            .values_list("pkid", flat=True)[: settings.CAMPAIGN_BATCH_SIZE]
+        )
+        CampaignRecipient.objects.filter(pkid__in=pks).update(
+            status="claimed", claimed_at=timezone.now()
+        )
+
+    # If every pending recipient is throttled, continue once a window ends
+    if not pks and waits and campaign.recipients.filter(status="pending").exists():
+        send_campaign_batch.apply_async((campaign.pkid,), countdown=min(waits.values()))
+        return
+
+    # If no recipient is pending
+    if not pks:
+        # Finish the campaign once no batch is in flight
+        if not campaign.recipients.filter(status__in=("claimed", "sending")).exists():
+            Campaign.objects.filter(pkid=campaign.pkid, status="sending").update(
+                status="sent", finished_at=timezone.now()
+            )
+        return
+
+    # Get the claimed recipients
+    recipients = (
+        CampaignRecipient.objects.filter(pkid__in=pks)
+        .select_related("lead", "variant__campaign")
+        .order_by("pkid")
+    )
+
+    # Initialize the batch state
+    rendered = {}
+    throttled = {}
+    sent = 0
+    from_email = campaign.from_email or settings.DEFAULT_FROM_EMAIL
+
+    # Open one connection for the batch
+    connection = get_campaign_connection()
+    broken = None
+
+    try:
+        # Connect to the SMTP server
+        connection.open()
+
+        # Traverse through the recipients
+        for recipient in recipients:
+            # If the domain is throttled
+            if recipient.domain in throttled:
+                continue
+
+            # If the domain is over its rate limit
+            wait = throttle.acquire(recipient.domain)
+            if wait:
+                throttled[recipient.domain] = wait
+                continue
+
+            # Render the variant once
+            if recipient.variant_id not in rendered:
+                rendered[recipient.variant_id] = render_variant(recipient.variant)
+            variant = rendered[recipient.variant_id]
+
+            # Merge the recipient into the variant
+            fields = get_merge_fields(recipient.lead, recipient.email)
+            message = EmailMultiAlternatives(
+                subject=merge(variant.subject, fields),
+                body=merge(variant.text, fields),
+                from_email=from_email,
+                to=[recipient.email],
+                connection=connection,
+                headers={"X-Campaign-ID": str(campaign.id)},
+            )
+            if variant.html is not None:
+                message.attach_alternative(
+                    merge(variant.html, fields, html=True), "text/html"
+                )
+
+            # Checkpoint the recipient before sending
+            CampaignRecipient.objects.filter(pkid=recipient.pkid).update(
+                status="sending"
+            )
+
+            # Send the message
+            try:
+                message.send()
+
+            # If the message was not sent
+            except OSError as error:
+                CampaignRecipient.objects.filter(pkid=recipient.pkid).update(
+                    status="failed", error=str(error)[:1000]
+                )
+
+                # If the connection broke, stop the batch
+                if is_connection_error(error):
+                    broken = error
+                    break
+
+                continue
+
+            # Checkpoint the recipient after sending
+            CampaignRecipient.objects.filter(pkid=recipient.pkid).update(
+                status="sent", sent_at=timezone.now()
+            )
+            sent += 1
+
+    # If the SMTP server can not be reached
+    except OSError as error:
+        broken = error
+
+    # If the batch ran out of time, the next one sends the rest
+    except SoftTimeLimitExceeded:
+        pass
+
+    # Close the connection
+    finally:
+        connection.close()
+
+    # Release the recipients that were not attempted
+    CampaignRecipient.objects.filter(pkid__in=pks, status="claimed").update(
+        status="pending", claimed_at=None
+    )
+
+    # If the connection broke, retry later
+    if broken is not None:
+        raise self.retry(exc=broken)
+
+    # Continue with the next batch, later if every domain of this one was throttled
+    countdown = min(throttled.values()) if throttled and not sent else 0
+    send_campaign_batch.apply_async((campaign.pkid,), countdown=countdown)
+
+
+# Task to resume the stalled campaigns
+@shared_task
+def resume_campaigns() -> int:
+    """Restart the batch loops of the campaigns no batch has worked on lately.
+
+    A loop ends for good when a batch runs out of retries or its worker is
+    lost. A campaign still sending with no recipient claimed for
+    CAMPAIGN_CLAIM_TIMEOUT seconds gets new loops, which recover the stale
+    claims, send the pending recipients and finish the campaign.
+
+    Returns:
+        int: The number of resumed campaigns.
+    """
+
+    # Traverse through the shared schema and the tenant schemas
+    resumed = 0
+    stale = timezone.now() - timedelta(seconds=settings.CAMPAIGN_CLAIM_TIMEOUT)
+    for alias in [DEFAULT_DB_ALIAS, *tenant_aliases()]:
+        # Get the stalled campaigns
+        campaigns = (
+            Campaign.objects.using(alias)
+            .filter(status="sending", started_at__lt=stale)
+            .annotate(last_claimed_at=Max("recipients__claimed_at"))
+            .filter(Q(last_claimed_at__isnull=True) | Q(last_claimed_at__lt=stale))
+            .values_list("pkid", "organization_id")
+        )
+
+        # Start the batch loops of every campaign, for its organization
+        for campaign_id, organization_id in campaigns:
+            with use_organization(organization_id):
+                for _ in range(settings.CAMPAIGN_PARALLEL_BATCHES):
+                    send_campaign_batch.delay(campaign_id)
+            resumed += 1
+
+    # Return the number of resumed campaigns
+    return resumed
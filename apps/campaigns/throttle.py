@@ -0,0 +1,101 @@
+# Imports
+import time
+
+from django.conf import settings
+from django_redis import get_redis_connection
+
+
+# Domain Throttle
+class DomainThrottle:
+    """Domain Throttle
+
+    Fixed window rate limit per recipient domain, shared by every worker
+    through Redis. Receiving servers throttle or block senders by domain, so
+    the limit applies to the domain rather than to the campaign or worker.
+    Domains over their limit are kept until their window ends, so batches
+    claim the recipients of the other domains meanwhile.
+
+    Attributes:
+        window (int): The length of a window in seconds.
+
+    Methods:
+        limit_for(domain): Get the messages allowed per window for a domain.
+        acquire(domain): Reserve a message for a domain.
+        throttled(): Get the domains over their limit.
+    """
+
+    # Key of the domains over their limit, scored by the end of their window
+    THROTTLED_KEY = "campaigns:throttled"
+
+    # Constructor
+    def __init__(self, client=None, window: int = 60):
+        # Set the attributes
+        self.client = client or get_redis_connection("default")
+        self.window = window
+
+    # Method to get the limit of a domain
+    def limit_for(self, domain: str) -> int:
+        """Get the messages allowed per window for a domain.
+
+        Args:
+            domain (str): The recipient domain.
+
+        Returns:
+            int: The number of messages.
+        """
+
+        # Return the configured limit of the domain, or the default
+        return settings.CAMPAIGN_DOMAIN_RATE_LIMITS.get(
+            domain, settings.CAMPAIGN_DOMAIN_RATE_LIMIT
+        )
+
+    # Method to reserve a message for a domain
+    def acquire(self, domain: str) -> float:
+        """Reserve a message for a domain in the current window.
+
+        Args:
+            domain (str): The recipient domain.
+
+        Returns:
+            float: 0 if the message may be sent, else the seconds to wait.
+        """
+
+        # Get the current window
+        now = time.time()
+        window = int(now // self.window)
+        key = f"campaigns:throttle:{domain}:{window}"
+
+        # Count the message in the window
+        with self.client.pipeline(transaction=False) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, self.window * 2)
+            count, _ = pipe.execute()
+
+        # If the message fits in the window
+        if count <= self.limit_for(domain):
+            return 0
+
+        # Keep the domain throttled until the next window
+        ends_at = (window + 1) * self.window
+        self.client.zadd(self.THROTTLED_KEY, {domain: ends_at})
+
+        # Return the seconds until the next window
+        return ends_at - now
+
+    # Method to get the domains over their limit
+    def throttled(self) -> dict[str, float]:
+        """Get the domains over their limit in the current window.
+
+        Returns:
+            dict[str, float]: The seconds to wait by domain.
+        """
+
+        # Drop the domains whose window ended, then get the others
+        now = time.time()
+        with self.client.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(self.THROTTLED_KEY, "-inf", now)
+            pipe.zrange(self.THROTTLED_KEY, 0, -1, withscores=True)
+            _, domains = pipe.execute()
+
+        # Return the seconds to wait by domain
+        return {domain.decode(): ends_at - now for domain, ends_at in domains}
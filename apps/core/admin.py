@@ -1,10 +1,17 @@
 # Imports
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
 
 from apps.core.forms import UserChangeForm, UserCreationForm
-from apps.core.models import TokenRecord, User
+from apps.core.models import (
+    AuditEntry,
+    Organization,
+    OutboxDeadLetter,
+    TokenRecord,
+    User,
+)
+from apps.core.tasks import replay_dead_letters
 
 
 # Register the User model
@@ -52,7 +59,7 @@ class UserAdmin(BaseUserAdmin):
     search_fields = ["email", "first_name", "last_name", "username", "role"]
 
     # List filter
-    list_filter = ["is_active", "is_staff", "is_superuser", "role"]
+    list_filter = ["is_active", "is_staff", "is_superuser", "role", "organization"]
 
     # Ordering
     ordering = ["-date_joined"]
@@ -69,6 +76,7 @@ class UserAdmin(BaseUserAdmin):
                     "is_active",
                     "is_staff",
                     "is_superuser",
+                    "organization",
                     "role",
                     "groups",
                     "user_permissions",
@@ -148,3 +156,181 @@ class TokenRecordAdmin(admin.ModelAdmin):
 
     # Set readonly fields
     readonly_fields = ["token", "created_at", "is_used"]
+
+
+# Register the Organization model
+@admin.register(Organization)
+class OrganizationAdmin(admin.ModelAdmin):
+    """Organization Admin
+
+    Organization Admin for the Organization model.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        list_display_links (list[str]): The list of fields to display as links.
+        search_fields (list[str]): The list of fields to search.
+        list_filter (list[str]): The list of fields to filter by.
+        ordering (list[str]): The list of fields to order by.
+        fieldsets (tuple[str]): The fieldsets for the Organization model.
+    """
+
+    # Set model
+    model = Organization
+
+    # List display
+    list_display = ["pkid", "id", "name", "slug", "database", "is_active", "created_at"]
+
+    # List display links
+    list_display_links = ["pkid", "id", "name"]
+
+    # Search fields
+    search_fields = ["name", "slug"]
+
+    # List filter
+    list_filter = ["is_active"]
+
+    # Ordering
+    ordering = ["name"]
+
+    # Fieldsets
+    fieldsets = (
+        (_("Organization"), {"fields": ("pkid", "id", "name", "slug")}),
+        (_("Storage"), {"fields": ("database",)}),
+        (_("Status"), {"fields": ("is_active", "created_at", "updated_at")}),
+    )
+
+    # Set readonly fields
+    readonly_fields = ["pkid", "id", "created_at", "updated_at"]
+
+
+# Register the AuditEntry model
+@admin.register(AuditEntry)
+class AuditEntryAdmin(admin.ModelAdmin):
+    """Audit Entry Admin
+
+    Audit Entry Admin for the AuditEntry model. The audit log is append
+    only, so the entries can be viewed but not added, changed or deleted.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        list_display_links (list[str]): The list of fields to display as links.
+        search_fields (list[str]): The list of fields to search.
+        list_filter (list[str]): The list of fields to filter by.
+        ordering (list[str]): The list of fields to order by.
+        show_full_result_count (bool): Whether to count the unfiltered entries.
+        fieldsets (tuple[str]): The fieldsets for the AuditEntry model.
+    """
+
+    # Set model
+    model = AuditEntry
+
+    # List display
+    list_display = ["created_at", "entity", "entity_id", "action", "actor_email"]
+
+    # List display links
+    list_display_links = ["created_at", "entity"]
+
+    # Search fields
+    search_fields = ["=entity_id", "=actor_email"]
+
+    # List filter
+    list_filter = ["action", "entity"]
+
+    # Ordering
+    ordering = ["-created_at"]
+
+    # Skip counting the whole log on every page
+    show_full_result_count = False
+
+    # Fieldsets
+    fieldsets = (
+        (_("Entity"), {"fields": ("entity", "entity_id", "organization")}),
+        (_("Change"), {"fields": ("action", "changes", "created_at")}),
+        (_("Actor"), {"fields": ("actor", "actor_email", "ip_address")}),
+    )
+
+    # Method to check the add permission
+    def has_add_permission(self, request) -> bool:
+        return False
+
+    # Method to check the change permission
+    def has_change_permission(self, request, obj=None) -> bool:
+        return False
+
+    # Method to check the delete permission
+    def has_delete_permission(self, request, obj=None) -> bool:
+        return False
+
+
+# Register the OutboxDeadLetter model
+@admin.register(OutboxDeadLetter)
+class OutboxDeadLetterAdmin(admin.ModelAdmin):
+    """Outbox Dead Letter Admin
+
+    Outbox Dead Letter Admin for the OutboxDeadLetter model. The events a
+    consumer failed on are replayed once the consumer is fixed.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        list_display_links (list[str]): The list of fields to display as links.
+        search_fields (list[str]): The list of fields to search.
+        list_filter (list[str]): The list of fields to filter by.
+        ordering (list[str]): The list of fields to order by.
+        list_select_related (list[str]): The related objects of the list.
+        readonly_fields (list[str]): The list of read only fields.
+        actions (list[str]): The list of actions.
+
+    Methods:
+        replay: Queue the events of the selected dead letters again.
+    """
+
+    # Set model
+    model = OutboxDeadLetter
+
+    # List display
+    list_display = ["created_at", "consumer", "event", "error"]
+
+    # List display links
+    list_display_links = ["created_at", "consumer"]
+
+    # Search fields
+    search_fields = ["=event__entity_id", "consumer"]
+
+    # List filter
+    list_filter = ["consumer"]
+
+    # Ordering
+    ordering = ["-created_at"]
+
+    # Select the events of the list
+    list_select_related = ["event"]
+
+    # Set readonly fields
+    readonly_fields = ["consumer", "event", "error", "created_at"]
+
+    # Actions
+    actions = ["replay"]
+
+    # Method to check the add permission
+    def has_add_permission(self, request) -> bool:
+        return False
+
+    # Method to replay the selected dead letters
+    @admin.action(description=_("Replay the selected dead letters"))
+    def replay(self, request, queryset):
+        # Queue the events again
+        count = replay_dead_letters(queryset)
+
+        # Show a message
+        self.message_user(
+            request, _("%d dead letter(s) replayed.") % count, messages.SUCCESS
+        )
@@ -15,8 +15,27 @@ class CoreConfig(AppConfig):
     Attributes:
         name (str): The name of the app.
         verbose_name (str): The verbose name of the app.
+
+    Methods:
+        ready: Connect the signal handlers, track and audit the models of the app.
     """
 
     # Attributes
     name = "apps.core"
     verbose_name = _("Core")
+
+    # Method to connect the signal handlers
+    def ready(self):
+        # Import the modules that register signal handlers
+        import apps.core.metrics  # noqa: F401
+        import apps.core.routers  # noqa: F401
+        from apps.core.audit import audit_changes
+        from apps.core.models import TokenRecord, User
+        from apps.core.outbox import track_changes
+
+        # Write the changes of the models to the outbox, without the secrets
+        track_changes(User, exclude=["password"], ignore=["last_login"])
+        track_changes(TokenRecord, exclude=["token"])
+
+        # Audit the changes of the users, e.g. roles, activations and passwords
+        audit_changes(User, redact=["password"], ignore=["last_login", "updated_at"])
@@ -0,0 +1,577 @@
+# Imports
+import gzip
+import tempfile
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+from functools import partial
+
+import orjson
+from asgiref.local import Local
+from celery.signals import task_postrun, task_prerun
+from django.conf import settings
+from django.core.files import File
+from django.core.signals import request_finished
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_init, post_save
+from django.utils import timezone
+
+from apps.core.models import AuditEntry
+from config.storage.media import MediaStorage
+
+# Options of the audited models by label
+AUDITED_MODELS: dict[str, dict] = {}
+
+# Value written instead of a redacted field, e.g. a password hash
+REDACTED = "[redacted]"
+
+# Actor of the current request or task, a dict or a callable resolving it
+_current_actor: ContextVar = ContextVar("current_actor", default=None)
+
+# Committed entries of the current thread waiting to be queued, like the connections
+_buffer = Local()
+
+
+# Function to get the actor of a request
+def get_request_actor(request) -> dict:
+    """Get the user and address a request changes the data for.
+
+    Args:
+        request (HttpRequest): The request.
+
+    Returns:
+        dict: The actor_id, actor_email and ip_address of the entries.
+    """
+
+    # Get the user, if authenticated
+    user = request.user if request.user.is_authenticated else None
+
+    # Return the actor
+    return {
+        "actor_id": user.pk if user else None,
+        "actor_email": user.email if user else "",
+        "ip_address": request.META.get("REMOTE_ADDR") or None,
+    }
+
+
+# Function to get the current actor
+def get_current_actor() -> dict:
+    """Get the actor of the current request or task.
+
+    Returns:
+        dict: The actor_id, actor_email and ip_address, empty for the system.
+    """
+
+    # Get the actor, resolving it on first use
+    value = _current_actor.get()
+    if callable(value):
+        value = value()
+        _current_actor.set(value)
+
+    # Return the actor
+    return value or {}
+
+
+# Function to set the current actor
+def set_current_actor(actor) -> Token:
+    """Set the actor of the current request or task.
+
+    Args:
+        actor (dict | Callable | None): The actor, a callable returning it on
+            first use, or None for the system.
+
+    Returns:
+        Token: The token to reset the actor.
+    """
+
+    # Set the actor
+    return _current_actor.set(actor)
+
+
+# Function to queue the buffered entries
+def queue_entries():
+    """Queue the committed entries of the thread in one Celery task."""
+
+    # Take the entries
+    entries = getattr(_buffer, "entries", None)
+    if not entries:
+        return
+    _buffer.entries = []
+
+    # Queue the entries
+    from apps.core.tasks import write_audit_entries
+
+    write_audit_entries.delay(entries)
+
+
+# Function to buffer a committed entry
+def buffer_entry(entry: dict):
+    """Buffer an entry once its change is committed.
+
+    Outside of a request or task, or once AUDIT_BUFFER_SIZE entries are
+    waiting, the entries are queued right away.
+
+    Args:
+        entry (dict): The fields of the entry.
+    """
+
+    # Buffer the entry
+    if getattr(_buffer, "entries", None) is None:
+        _buffer.entries = []
+    _buffer.entries.append(entry)
+
+    # If nothing flushes the buffer later or it is full, queue the entries
+    deferred = getattr(_buffer, "deferred", False)
+    if not deferred or len(_buffer.entries) >= settings.AUDIT_BUFFER_SIZE:
+        queue_entries()
+
+
+# Function to buffer the entries until the end of the request
+def defer_entries():
+    """Buffer the committed entries until the request or task ends."""
+
+    # Buffer the entries
+    _buffer.deferred = True
+
+
+# Signal handler to queue the entries of a request
+def flush_entries(**kwargs):
+    """Queue the entries of a request once its response is sent."""
+
+    # Stop buffering and queue the entries
+    _buffer.deferred = False
+    queue_entries()
+
+
+# Signal handler to buffer the entries of a task
+def defer_task_entries(task=None, **kwargs):
+    """Buffer the entries of a task until it ends."""
+
+    # If the task runs in the caller, the caller flushes
+    if task is not None and not task.request.is_eager:
+        defer_entries()
+
+
+# Signal handler to queue the entries of a task
+def flush_task_entries(task=None, **kwargs):
+    """Queue the entries of a task once it ends."""
+
+    # If the task runs in the caller, the caller flushes
+    if task is not None and not task.request.is_eager:
+        flush_entries()
+
+
+# Function to get the audited state of an entity
+def get_state(instance: Model) -> dict:
+    """Get the loaded values of the audited fields of an entity.
+
+    Args:
+        instance (Model): The entity.
+
+    Returns:
+        dict: The values by attribute name, without the deferred fields.
+    """
+
+    # Return the loaded values
+    fields = AUDITED_MODELS[instance._meta.label_lower]["fields"]
+    return {
+        name: instance.__dict__[name] for name in fields if name in instance.__dict__
+    }
+
+
+# Function to get the changes of an entity
+def get_changes(instance: Model, action: str, update_fields=None) -> dict:
+    """Get the old and new values of the changed fields of an entity.
+
+    The old values are the ones loaded from the database, so the diff costs
+    no query.
+
+    Args:
+        instance (Model): The entity.
+        action (str): The action of the change.
+        update_fields (frozenset[str] | None): The saved fields, all if None.
+
+    Returns:
+        dict: The [old, new] values by attribute name, the redacted ones masked.
+    """
+
+    # Get the options and the states before and after the change
+    options = AUDITED_MODELS[instance._meta.label_lower]
+    previous = getattr(instance, "_audit_state", {})
+    current = get_state(instance)
+
+    # Get the fields of the change, without the ignored ones
+    names = current.keys()
+    if update_fields:
+        names = [instance._meta.get_field(name).attname for name in update_fields]
+    names = [
+        name for name in names if name in current and name not in options["ignore"]
+    ]
+
+    # Diff the fields by action
+    if action == "created":
+        changes = {name: [None, current[name]] for name in names}
+    elif action == "deleted":
+        changes = {name: [current[name], None] for name in names}
+    else:
+        changes = {
+            name: [previous.get(name), current[name]]
+            for name in names
+            if previous.get(name) != current[name]
+        }
+
+    # Mask the redacted fields
+    for name in options["redact"] & changes.keys():
+        changes[name] = [REDACTED if value else value for value in changes[name]]
+
+    # Return the changes
+    return changes
+
+
+# Function to record a change
+def record_change(
+    instance: Model, action: str, using: str, update_fields=None
+) -> dict | None:
+    """Buffer the audit entry of a change until its transaction commits.
+
+    Nothing is written to the database in the request, the entry is queued
+    with the others of the request and written by a Celery task. Changes
+    rolled back, with their transaction or savepoint, are never queued.
+
+    Args:
+        instance (Model): The changed entity.
+        action (str): The action of the change.
+        using (str): The alias of the database.
+        update_fields (frozenset[str] | None): The saved fields, all if None.
+
+    Returns:
+        dict | None: The fields of the entry, or None if nothing changed.
+    """
+
+    # Get the changes and keep the saved state for the next ones
+    changes = get_changes(instance, action, update_fields=update_fields)
+    instance._audit_state = get_state(instance)
+
+    # If only ignored fields changed
+    if not changes:
+        return None
+
+    # Buffer the entry once committed
+    entry = {
+        "created_at": timezone.now(),
+        "entity": instance._meta.label_lower,
+        "entity_id": str(instance.pk),
+        "action": action,
+        "changes": changes,
+        "organization_id": getattr(instance, "organization_id", None),
+        **get_current_actor(),
+    }
+    transaction.on_commit(partial(buffer_entry, entry), using=using)
+
+    # Return the entry
+    return entry
+
+
+# Signal handler to keep the loaded state of an entity
+def keep_state(sender, instance: Model, **kwargs):
+    """Keep the loaded values of an audited entity to diff its next save."""
+
+    # Keep the state
+    instance._audit_state = get_state(instance)
+
+
+# Signal handler to record a saved entity
+def record_save(sender, instance: Model, created: bool, using: str, **kwargs):
+    """Record the created or updated entry of an audited entity."""
+
+    # If the entity is loaded from a fixture
+    if kwargs.get("raw"):
+        return
+
+    # Record the change
+    action = "created" if created else "updated"
+    record_change(instance, action, using, update_fields=kwargs.get("update_fields"))
+
+
+# Signal handler to record a deleted entity
+def record_delete(sender, instance: Model, using: str, **kwargs):
+    """Record the deleted entry of an audited entity."""
+
+    # Record the change
+    record_change(instance, "deleted", using)
+
+
+# Function to audit the changes of a model
+def audit_changes(model: type[Model], redact=(), ignore=()):
+    """Record the field level changes of a model in the audit log.
+
+    Called when the app of the model is ready. Changes made through save()
+    and delete() are recorded, bulk updates and deletes are not.
+
+    Args:
+        model (type[Model]): The model.
+        redact (Iterable[str]): The fields whose values are masked, e.g. secrets.
+        ignore (Iterable[str]): The fields whose changes are not recorded.
+    """
+
+    # Register the model
+    label = model._meta.label_lower
+    AUDITED_MODELS[label] = {
+        "fields": tuple(field.attname for field in model._meta.concrete_fields),
+        "redact": {model._meta.get_field(name).attname for name in redact},
+        "ignore": {model._meta.get_field(name).attname for name in ignore},
+    }
+
+    # Connect the signal handlers
+    post_init.connect(keep_state, sender=model, dispatch_uid=f"audit_init_{label}")
+    post_save.connect(record_save, sender=model, dispatch_uid=f"audit_save_{label}")
+    post_delete.connect(
+        record_delete, sender=model, dispatch_uid=f"audit_delete_{label}"
+    )
+
+
+# Function to get the first day of a month
+def get_month(value: datetime, months: int = 0) -> datetime:
+    """Get the start of the month of a date, moved by a number of months.
+
+    Args:
+        value (datetime): The date.
+        months (int): The months to move by.
+
+    Returns:
+        datetime: The first day of the month at midnight UTC.
+    """
+
+    # Return the start of the month
+    index = value.year * 12 + value.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+
+
+# Function to get the name of a partition
+def partition_name(month: datetime) -> str:
+    """Get the name of the partition of a month, e.g. core_auditentry_2026_10."""
+    return f"{AuditEntry._meta.db_table}_{month:%Y_%m}"
+
+
+# Function to get the statement creating the partition of a month
+def create_partition_sql(month: datetime, quote) -> str:
+    """Get the statement creating the partition of a month, if it is missing."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {quote(partition_name(month))} "
+        f"PARTITION OF {quote(AuditEntry._meta.db_table)} "
+        f"FOR VALUES FROM ('{month.isoformat()}') "
+        f"TO ('{get_month(month, 1).isoformat()}')"
+    )
+
+
+# Function to get the name of the default partition
+def default_partition_name() -> str:
+    """Get the name of the partition of the entries outside of every month."""
+    return f"{AuditEntry._meta.db_table}_default"
+
+
+# Function to check if the audit log is partitioned
+def is_partitioned() -> bool:
+    """Check if the audit log is kept in monthly partitions, on Postgres only."""
+    return connections[DEFAULT_DB_ALIAS].vendor == "postgresql"
+
+
+# Function to create the partitions of the next months
+def create_audit_partitions(months: int) -> list[str]:
+    """Create the partitions of the current and the next months.
+
+    The default partition catches entries outside of every partition, but a
+    partition cannot be created for a month with entries in it, so the
+    partitions are created months ahead.
+
+    Args:
+        months (int): The months to create ahead of the current one.
+
+    Returns:
+        list[str]: The names of the partitions.
+    """
+
+    # If the audit log is not partitioned
+    if not is_partitioned():
+        return []
+
+    # Create the missing partitions
+    connection = connections[DEFAULT_DB_ALIAS]
+    quote = connection.ops.quote_name
+    names = []
+    with connection.cursor() as cursor:
+        for offset in range(months + 1):
+            month = get_month(timezone.now(), offset)
+            names.append(partition_name(month))
+            cursor.execute(create_partition_sql(month, quote))
+
+    # Return the names of the partitions
+    return names
+
+
+# Function to get the archived months
+def get_archivable_months(before: datetime) -> list[datetime]:
+    """Get the months with entries older than a date.
+
+    On Postgres these are the months of the partitions and the months of the
+    entries in the default partition.
+
+    Args:
+        before (datetime): The first month kept in the database.
+
+    Returns:
+        list[datetime]: The months, from the oldest.
+    """
+
+    # If the audit log is partitioned, get the months of the partitions
+    if is_partitioned():
+        connection = connections[DEFAULT_DB_ALIAS]
+        quote = connection.ops.quote_name
+        prefix = f"{AuditEntry._meta.db_table}_"
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "WHERE parent.relname = %s",
+                [AuditEntry._meta.db_table],
+            )
+            months = []
+            for (name,) in cursor.fetchall():
+                try:
+                    months.append(
+                        datetime.strptime(name.removeprefix(prefix), "%Y_%m").replace(
+                            tzinfo=UTC
+                        )
+                    )
+                except ValueError:
+                    continue
+
+            # Add the months of the entries in the default partition
+            cursor.execute(
+                "SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC') "
+                f"FROM {quote(default_partition_name())} WHERE created_at < %s",
+                [before],
+            )
+            months.extend(month.replace(tzinfo=UTC) for (month,) in cursor.fetchall())
+        return sorted({month for month in months if month < before})
+
+    # Otherwise get the months with entries
+    return list(
+        AuditEntry.objects.filter(created_at__lt=before).datetimes(
+            "created_at", "month", tzinfo=UTC
+        )
+    )
+
+
+# Function to move the entries of a month out of the default partition
+def move_default_entries(month: datetime) -> int:
+    """Move the entries of a month from the default partition to their own.
+
+    The default partition is detached while the entries move, which drops its
+    append only trigger, and attached again after.
+
+    Args:
+        month (datetime): The first day of the month.
+
+    Returns:
+        int: The number of moved entries.
+    """
+
+    # Get the names of the tables and the range of the month
+    connection = connections[DEFAULT_DB_ALIAS]
+    quote = connection.ops.quote_name
+    table = quote(AuditEntry._meta.db_table)
+    default = quote(default_partition_name())
+    where = "WHERE created_at >= %s AND created_at < %s"
+    params = [month, get_month(month, 1)]
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        # If the default partition holds no entry of the month
+        cursor.execute(f"SELECT 1 FROM {default} {where} LIMIT 1", params)
+        if cursor.fetchone() is None:
+            return 0
+
+        # Detach the default partition, so the partition of the month can be created
+        cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {default}")
+        cursor.execute(create_partition_sql(month, quote))
+
+        # Move the entries into the partition of the month
+        cursor.execute(f"INSERT INTO {table} SELECT * FROM {default} {where}", params)
+        moved = cursor.rowcount
+        cursor.execute(f"DELETE FROM {default} {where}", params)
+
+        # Attach the default partition again
+        cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT")
+
+    # Return the number of moved entries
+    return moved
+
+
+# Function to archive a month of the audit log
+def archive_audit_month(month: datetime) -> str:
+    """Move the entries of a month to a compressed archive in the media storage.
+
+    The entries are written as gzipped JSON lines, then the partition of the
+    month is detached and dropped, or the entries deleted without partitions.
+    The archive is named after the month and its first and last entry, so a
+    run repeated after a failure overwrites its own archive.
+
+    Args:
+        month (datetime): The first day of the month.
+
+    Returns:
+        str: The name of the archive in the media storage, empty if none.
+    """
+
+    # Gather the entries of the month left in the default partition
+    if is_partitioned():
+        move_default_entries(month)
+
+    # Get the entries of the month
+    entries = AuditEntry.objects.filter(
+        created_at__gte=month, created_at__lt=get_month(month, 1)
+    )
+
+    # Write the compressed archive, spooled to disk once large
+    with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as file:
+        count = 0
+        first = last = None
+        with gzip.GzipFile(fileobj=file, mode="wb") as archive:
+            rows = entries.order_by("created_at", "pkid").values()
+            for count, entry in enumerate(rows.iterator(chunk_size=2000), 1):
+                archive.write(
+                    orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE, default=str)
+                )
+                first = entry["pkid"] if first is None else min(first, entry["pkid"])
+                last = entry["pkid"] if last is None else max(last, entry["pkid"])
+
+        # Upload the archive, unless the month is empty, over the one of a failed run
+        name = ""
+        if count:
+            file.seek(0)
+            name = MediaStorage(file_overwrite=True).save(
+                f"audit/{month:%Y/%m}-{first}-{last}.jsonl.gz", File(file)
+            )
+
+    # Drop the partition of the month, or its entries
+    if is_partitioned():
+        connection = connections[DEFAULT_DB_ALIAS]
+        quote = connection.ops.quote_name
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {quote(AuditEntry._meta.db_table)} "
+                f"DETACH PARTITION {quote(partition_name(month))}"
+            )
+            cursor.execute(f"DROP TABLE {quote(partition_name(month))}")
+    else:
+        entries.delete()
+
+    # Return the name of the archive
+    return name
+
+
+# Buffer the entries of the requests and tasks until they end
+task_prerun.connect(defer_task_entries, dispatch_uid="audit_defer_task")
+task_postrun.connect(flush_task_entries, dispatch_uid="audit_flush_task")
+request_finished.connect(flush_entries, dispatch_uid="audit_flush_request")
@@ -14,3 +14,17 @@ TOKEN_TYPES = (
     ("activation", _("Activation")),
     ("reset_password", _("Reset Password")),
 )
+
+# Outbox Actions
+OUTBOX_ACTIONS = (
+    ("created", _("Created")),
+    ("updated", _("Updated")),
+    ("deleted", _("Deleted")),
+)
+
+# Audit Actions
+AUDIT_ACTIONS = (
+    ("created", _("Created")),
+    ("updated", _("Updated")),
+    ("deleted", _("Deleted")),
+)
@@ -0,0 +1,107 @@
+# Imports
+import re
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.template.loader import get_template
+from django.utils.html import escape
+
+# Placeholder of a merge field, e.g. [[first_name]]
+MERGE_PLACEHOLDER = re.compile(r"\[\[\s*(\w+)\s*\]\]")
+
+
+# Function to render the bodies of an email
+def render_email(template_name: str, context: dict) -> tuple[str, str]:
+    """Render the plain text and HTML bodies of an email.
+
+    Every email has a template_name.txt and a template_name.html template.
+    Both are loaded through the template engine, whose cached loader keeps
+    them compiled after the first email, so sending only renders.
+
+    Args:
+        template_name (str): The name of the templates without extension.
+        context (dict): The context of the templates.
+
+    Returns:
+        tuple[str, str]: The plain text and the HTML body.
+    """
+
+    # Add the shared context
+    context = {"site_name": settings.SITE_NAME, **context}
+
+    # Render the bodies
+    text = get_template(f"{template_name}.txt").render(context)
+    html = get_template(f"{template_name}.html").render(context)
+
+    # Return the bodies
+    return text, html
+
+
+# Function to build an email
+def build_email(
+    subject: str, template_name: str, context: dict, to: list[str], **kwargs
+) -> EmailMultiAlternatives:
+    """Build an email with a plain text body and an HTML alternative.
+
+    Args:
+        subject (str): The subject.
+        template_name (str): The name of the templates without extension.
+        context (dict): The context of the templates.
+        to (list[str]): The recipients.
+        **kwargs: Passed on to EmailMultiAlternatives.
+
+    Returns:
+        EmailMultiAlternatives: The email.
+    """
+
+    # Render the bodies
+    text, html = render_email(template_name, context)
+
+    # Create the email
+    kwargs.setdefault("from_email", settings.DEFAULT_FROM_EMAIL)
+    email = EmailMultiAlternatives(subject, text, to=to, **kwargs)
+    email.attach_alternative(html, "text/html")
+
+    # Return the email
+    return email
+
+
+# Function to split a rendered template into literals and merge fields
+def compile_merge(rendered: str) -> list[str]:
+    """Split a rendered template on its merge placeholders.
+
+    Args:
+        rendered (str): The rendered template.
+
+    Returns:
+        list[str]: The literals at even and the merge field names at odd indexes.
+    """
+
+    # Split the template, re.split keeps the captured field names
+    return MERGE_PLACEHOLDER.split(rendered)
+
+
+# Function to merge the fields of a recipient
+def merge(parts: list[str], fields: dict[str, str], html: bool = False) -> str:
+    """Merge the fields of a recipient into a compiled template.
+
+    Bulk emails render their templates once, and each recipient only costs
+    this substitution pass.
+
+    Args:
+        parts (list[str]): The compiled template.
+        fields (dict[str, str]): The merge fields of the recipient.
+        html (bool): Whether to escape the values for HTML.
+
+    Returns:
+        str: The merged text.
+    """
+
+    # Copy the template and replace the merge fields
+    merged = parts.copy()
+    for index in range(1, len(merged), 2):
+        value = fields.get(merged[index], "")
+        merged[index] = escape(value) if html else value
+
+    # Return the merged text
+    return "".join(merged)
@@ -0,0 +1,337 @@
+# Imports
+import os
+import time
+
+import redis
+from celery.signals import (
+    task_postrun,
+    task_prerun,
+    task_retry,
+    worker_init,
+    worker_process_shutdown,
+)
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+# Name of the djcelery_email task that sends the queued emails
+EMAIL_TASK_NAME = "djcelery_email_send_multiple"
+
+# Request latency buckets (seconds)
+REQUEST_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Task runtime buckets (seconds)
+TASK_RUNTIME_BUCKETS = (0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0)
+
+# HTTP metrics
+HTTP_REQUEST_LATENCY = Histogram(
+    "leadtrack_http_request_duration_seconds",
+    "Time spent processing a request, by view.",
+    ["method", "view"],
+    buckets=REQUEST_LATENCY_BUCKETS,
+)
+HTTP_RESPONSES = Counter(
+    "leadtrack_http_responses_total",
+    "Responses returned, by view and status code.",
+    ["method", "view", "status"],
+)
+
+# Database metrics
+DB_CONNECTIONS_OPENED = Counter(
+    "leadtrack_db_connections_opened_total",
+    "Database connections opened, by alias.",
+    ["alias"],
+)
+DB_CONNECTIONS_OPEN = Gauge(
+    "leadtrack_db_connections_open",
+    "Database connections currently held open, by alias.",
+    ["alias"],
+    multiprocess_mode="livesum",
+)
+
+# Celery metrics
+CELERY_TASK_RUNTIME = Histogram(
+    "leadtrack_celery_task_runtime_seconds",
+    "Time spent running a task, by task name.",
+    ["task"],
+    buckets=TASK_RUNTIME_BUCKETS,
+)
+CELERY_TASKS = Counter(
+    "leadtrack_celery_tasks_total",
+    "Tasks finished, by task name and final state.",
+    ["task", "state"],
+)
+CELERY_TASK_RETRIES = Counter(
+    "leadtrack_celery_task_retries_total",
+    "Task retries, by task name.",
+    ["task"],
+)
+
+# Email metrics
+EMAILS_SENT = Counter(
+    "leadtrack_emails_sent_total",
+    "Emails handed to the SMTP backend by the email task.",
+)
+EMAIL_RATE_LIMIT = Gauge(
+    "leadtrack_email_rate_limit_per_minute",
+    "Configured per-worker rate limit of the email task.",
+    multiprocess_mode="max",
+)
+
+# Start times of the running tasks, keyed by task id
+_task_start_times: dict[str, float] = {}
+
+
+# Function to convert a celery rate limit into a per minute value
+def rate_limit_per_minute(rate_limit: str | int | float | None) -> float:
+    """Convert a Celery rate limit into a per minute value.
+
+    Args:
+        rate_limit (str | int | float | None): The rate limit, e.g. "50/m".
+
+    Returns:
+        float: The rate limit per minute, 0 if there is no limit.
+    """
+
+    # If there is no rate limit
+    if not rate_limit:
+        return 0.0
+
+    # If the rate limit is a plain number, it is per second
+    if isinstance(rate_limit, (int, float)):
+        return float(rate_limit) * 60
+
+    # Split the rate limit into the value and the unit
+    value, _, unit = str(rate_limit).partition("/")
+
+    # Return the value scaled to a minute
+    return float(value) * {"s": 60, "m": 1, "h": 1 / 60}.get(unit or "s", 60)
+
+
+# Function to update the open connections gauge
+def observe_db_connections():
+    """Update the open database connections gauge for the current process."""
+
+    # Traverse through the configured database aliases
+    for alias in connections:
+        # Count the alias as open if it holds a live connection
+        is_open = connections[alias].connection is not None
+        DB_CONNECTIONS_OPEN.labels(alias=alias).set(int(is_open))
+
+
+# Collector for the celery queue depth
+class CeleryQueueCollector:
+    """Celery Queue Collector
+
+    Reads the length of the Celery queues from the Redis broker at scrape time.
+
+    Methods:
+        queue_names: Get the names of the Celery queues.
+        queue_keys: Get the broker keys of a queue.
+        collect: Yield the queue depth metric.
+    """
+
+    # Method to get the names of the queues to measure
+    def queue_names(self) -> list[str]:
+        """Get the names of the Celery queues.
+
+        Returns:
+            list[str]: The names of the queues.
+        """
+
+        # Get the configured queues
+        queues = getattr(settings, "CELERY_TASK_QUEUES", None)
+
+        # If no queues are configured, return the default queue
+        if not queues:
+            return [getattr(settings, "CELERY_TASK_DEFAULT_QUEUE", "celery")]
+
+        # Return the names of the queues
+        return [queue.name for queue in queues]
+
+    # Method to get the broker keys of a queue
+    def queue_keys(self, queue: str) -> list[str]:
+        """Get the broker keys of a queue, one list per priority step.
+
+        Args:
+            queue (str): The name of the queue.
+
+        Returns:
+            list[str]: The keys of the queue.
+        """
+
+        # Get the priority steps of the broker
+        options = getattr(settings, "CELERY_BROKER_TRANSPORT_OPTIONS", {})
+        steps = options.get("priority_steps", [0, 3, 6, 9])
+        sep = options.get("sep", "\x06\x16")
+
+        # Return the keys, the highest priority uses the plain queue name
+        return [f"{queue}{sep}{step}" if step else queue for step in steps]
+
+    # Method to collect the metric
+    def collect(self):
+        """Yield the queue depth metric.
+
+        Yields:
+            GaugeMetricFamily: The queue depth of every queue.
+        """
+
+        # Initialize the metric
+        metric = GaugeMetricFamily(
+            "leadtrack_celery_queue_depth",
+            "Messages waiting in the Celery queue.",
+            labels=["queue"],
+        )
+
+        # Read the queue lengths from the broker
+        try:
+            client = redis.Redis.from_url(settings.CELERY_BROKER_URL, socket_timeout=1)
+            for queue in self.queue_names():
+                # Sum the lengths of the priority lists of the queue
+                with client.pipeline(transaction=False) as pipe:
+                    for key in self.queue_keys(queue):
+                        pipe.llen(key)
+                    metric.add_metric([queue], sum(pipe.execute()))
+
+        # If the broker can not be reached, skip the metric
+        except redis.RedisError:
+            return
+
+        # Yield the metric
+        yield metric
+
+
+# Function to render the metrics of all processes
+def render_metrics() -> bytes:
+    """Render the metrics in the Prometheus text format.
+
+    In multiprocess mode (PROMETHEUS_MULTIPROC_DIR is set) the samples of every
+    gunicorn/uvicorn worker are aggregated from the shared directory.
+
+    Returns:
+        bytes: The rendered metrics.
+    """
+
+    # If multiprocess mode is enabled
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        # Aggregate the metrics of all processes
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    # If multiprocess mode is disabled
+    else:
+        # Use the default registry
+        registry = REGISTRY
+
+    # Add the broker metrics, which are read at scrape time
+    broker_registry = CollectorRegistry()
+    broker_registry.register(CeleryQueueCollector())
+
+    # Return the rendered metrics
+    return generate_latest(registry) + generate_latest(broker_registry)
+
+
+# Signal handler to count the opened database connections
+def count_connection(sender, connection, **kwargs):
+    """Count a new database connection."""
+    DB_CONNECTIONS_OPENED.labels(alias=connection.alias).inc()
+
+
+# Signal handler to record the task start time
+@task_prerun.connect
+def record_task_start(task_id=None, **kwargs):
+    """Record the start time of a task."""
+    _task_start_times[task_id] = time.perf_counter()
+
+
+# Signal handler to record the task runtime
+@task_postrun.connect
+def record_task_runtime(task_id=None, task=None, retval=None, state=None, **kwargs):
+    """Record the runtime and state of a finished task."""
+
+    # Get the task name
+    name = getattr(task, "name", "unknown")
+
+    # Observe the runtime
+    started = _task_start_times.pop(task_id, None)
+    if started is not None:
+        CELERY_TASK_RUNTIME.labels(task=name).observe(time.perf_counter() - started)
+
+    # Count the task
+    CELERY_TASKS.labels(task=name, state=state or "UNKNOWN").inc()
+
+    # Count the sent emails
+    if name == EMAIL_TASK_NAME and isinstance(retval, int):
+        EMAILS_SENT.inc(retval)
+
+    # Update the database connections gauge
+    observe_db_connections()
+
+
+# Signal handler to count the task retries
+@task_retry.connect
+def record_task_retry(sender=None, **kwargs):
+    """Count a task retry."""
+    CELERY_TASK_RETRIES.labels(task=getattr(sender, "name", "unknown")).inc()
+
+
+# Signal handler to expose the worker metrics
+@worker_init.connect
+def start_worker_metrics_server(**kwargs):
+    """Expose the metrics of the worker and its pool processes over HTTP."""
+
+    # Get the port of the metrics server
+    port = getattr(settings, "PROMETHEUS_CELERY_WORKER_PORT", None)
+
+    # If the metrics server is disabled
+    if not port:
+        return
+
+    # Start the metrics server with the aggregated registry
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    start_http_server(port, registry=registry)
+
+
+# Signal handler to clean up the metrics of a stopped pool process
+@worker_process_shutdown.connect
+def mark_worker_process_dead(pid=None, **kwargs):
+    """Remove the live gauges of a stopped pool process."""
+
+    # If multiprocess mode is enabled
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+# Connect the database connection signal
+connection_created.connect(count_connection, dispatch_uid="metrics_count_connection")
+
+# Expose the configured email rate limit
+EMAIL_RATE_LIMIT.set(
+    rate_limit_per_minute(settings.CELERY_EMAIL_TASK_CONFIG.get("rate_limit"))
+)
@@ -0,0 +1,185 @@
+# Imports
+import time
+
+from django.conf import settings
+
+from apps.core.audit import (
+    _current_actor,
+    defer_entries,
+    get_request_actor,
+    set_current_actor,
+)
+from apps.core.metrics import (
+    HTTP_REQUEST_LATENCY,
+    HTTP_RESPONSES,
+    observe_db_connections,
+)
+from apps.core.routers import (
+    has_written_to_primary,
+    pin_to_primary,
+    replica_aliases,
+    reset_pinning,
+    track_writes,
+)
+from apps.core.tenancy import (
+    _current_organization,
+    get_user_organization_id,
+    set_current_organization,
+)
+
+
+# Prometheus Metrics Middleware
+class PrometheusMetricsMiddleware:
+    """Prometheus Metrics Middleware
+
+    Records the latency and status of every request, labelled by the resolved view
+    name so the cardinality stays bounded by the URL configuration.
+
+    Attributes:
+        get_response (callable): The next middleware or view.
+    """
+
+    # Constructor
+    def __init__(self, get_response):
+        # Set the next middleware or view
+        self.get_response = get_response
+
+    # Method to handle the request
+    def __call__(self, request):
+        # Get the start time
+        started = time.perf_counter()
+
+        # Get the response
+        response = self.get_response(request)
+
+        # Get the view name
+        match = getattr(request, "resolver_match", None)
+        view = match.view_name if match else "<unresolved>"
+
+        # Record the request metrics
+        HTTP_REQUEST_LATENCY.labels(method=request.method, view=view).observe(
+            time.perf_counter() - started
+        )
+        HTTP_RESPONSES.labels(
+            method=request.method, view=view, status=response.status_code
+        ).inc()
+
+        # Update the database connections gauge
+        observe_db_connections()
+
+        # Return the response
+        return response
+
+
+# Replica Pinning Middleware
+class ReplicaPinningMiddleware:
+    """Replica Pinning Middleware
+
+    Routes the reads of a client to the primary for a short window after it
+    wrote, so it reads its own writes while the replicas catch up. The window
+    is tracked with a cookie, which costs no lookup on the following requests.
+
+    Attributes:
+        get_response (callable): The next middleware or view.
+        cookie_name (str): The name of the pinning cookie.
+    """
+
+    # Attributes
+    cookie_name = "leadtrack_primary"
+
+    # Constructor
+    def __init__(self, get_response):
+        # Set the next middleware or view
+        self.get_response = get_response
+
+    # Method to handle the request
+    def __call__(self, request):
+        # If there are no replicas
+        if not replica_aliases():
+            return self.get_response(request)
+
+        # Pin the reads if the client wrote recently
+        token = pin_to_primary(self.cookie_name in request.COOKIES)
+
+        # Get the response, tracking its writes, and restore the pinned status
+        try:
+            with track_writes():
+                response = self.get_response(request)
+                wrote = has_written_to_primary()
+        finally:
+            reset_pinning(token)
+
+        # If the request wrote to the primary
+        if wrote:
+            # Pin the following reads of the client, from this write on
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=settings.DATABASE_REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+
+        # Return the response
+        return response
+
+
+# Tenant Middleware
+class TenantMiddleware:
+    """Tenant Middleware
+
+    Acts for the organization of the user for the rest of the request. The
+    organization is resolved on the first query of a model of an organization,
+    so requests that never touch one load no session or user for it.
+
+    Attributes:
+        get_response (callable): The next middleware or view.
+    """
+
+    # Constructor
+    def __init__(self, get_response):
+        # Set the next middleware or view
+        self.get_response = get_response
+
+    # Method to handle the request
+    def __call__(self, request):
+        # Act for the organization of the user, resolved on first use
+        token = set_current_organization(lambda: get_user_organization_id(request.user))
+
+        # Get the response and restore the previous organization
+        try:
+            return self.get_response(request)
+        finally:
+            _current_organization.reset(token)
+
+
+# Audit Middleware
+class AuditMiddleware:
+    """Audit Middleware
+
+    Records the user and address of the request in the audit entries of its
+    changes, resolved on the first audited change. The entries are buffered
+    and queued once the response is sent.
+
+    Attributes:
+        get_response (callable): The next middleware or view.
+    """
+
+    # Constructor
+    def __init__(self, get_response):
+        # Set the next middleware or view
+        self.get_response = get_response
+
+    # Method to handle the request
+    def __call__(self, request):
+        # Act as the user of the request, resolved on first use
+        token = set_current_actor(lambda: get_request_actor(request))
+
+        # Buffer the audit entries until the request is finished
+        defer_entries()
+
+        # Get the response and restore the previous actor
+        try:
+            return self.get_response(request)
+        finally:
+            _current_actor.reset(token)
@@ -0,0 +1,60 @@
+# Generated by Django 4.2.17 on 2026-10-19 19:37
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def create_default_organization(apps, schema_editor):
+    # Give the existing users, except the superusers, to the default organization
+    Organization = apps.get_model('core', 'Organization')
+    User = apps.get_model('core', 'User')
+    using = schema_editor.connection.alias
+    organization, _ = Organization.objects.using(using).get_or_create(
+        slug=settings.DEFAULT_ORGANIZATION_SLUG, defaults={'name': 'Default'}
+    )
+    User.objects.using(using).filter(is_superuser=False).update(organization=organization)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_outbox_events'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Organization',
+            fields=[
+                ('pkid', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('name', models.CharField(max_length=128, verbose_name='name')),
+                ('slug', models.SlugField(max_length=64, unique=True, verbose_name='slug')),
+                ('database', models.CharField(blank=True, help_text='The tenant alias of a dedicated schema, empty for the shared one.', max_length=64, verbose_name='database')),
+                ('is_active', models.BooleanField(default=True, verbose_name='active')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Organization',
+                'verbose_name_plural': 'Organizations',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='organization',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='users', to='core.organization'),
+        ),
+        migrations.AddField(
+            model_name='outboxevent',
+            name='organization',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='core.organization'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['organization', 'role'], name='user_organization_role_idx'),
+        ),
+        migrations.RunPython(create_default_organization, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,114 @@
+# Generated by Django 4.2.17 on 2026-10-19 19:43
+
+import datetime
+
+from django.conf import settings
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+# Monthly partitions of the entries, rejecting updates and deletes
+CREATE_PARTITIONED_TABLE = """
+CREATE TABLE "core_auditentry" (
+    "pkid" bigint GENERATED BY DEFAULT AS IDENTITY,
+    "created_at" timestamp with time zone NOT NULL,
+    "entity" varchar(64) NOT NULL,
+    "entity_id" varchar(64) NOT NULL,
+    "action" varchar(24) NOT NULL,
+    "changes" jsonb NOT NULL,
+    "actor_email" varchar(254) NOT NULL,
+    "ip_address" inet NULL,
+    "actor_id" bigint NULL,
+    "organization_id" bigint NULL,
+    PRIMARY KEY ("pkid", "created_at")
+) PARTITION BY RANGE ("created_at");
+CREATE INDEX "audit_entity_idx" ON "core_auditentry" ("entity", "entity_id", "created_at");
+CREATE INDEX "audit_actor_idx" ON "core_auditentry" ("actor_id", "created_at");
+CREATE INDEX "audit_organization_idx" ON "core_auditentry" ("organization_id", "created_at");
+CREATE TABLE "core_auditentry_default" PARTITION OF "core_auditentry" DEFAULT;
+CREATE FUNCTION "core_auditentry_append_only"() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    RAISE EXCEPTION 'audit entries are append-only';
+END;
+$$;
+CREATE TRIGGER "core_auditentry_append_only"
+    BEFORE UPDATE OR DELETE ON "core_auditentry"
+    FOR EACH ROW EXECUTE FUNCTION "core_auditentry_append_only"();
+CREATE TRIGGER "core_auditentry_no_truncate"
+    BEFORE TRUNCATE ON "core_auditentry"
+    FOR EACH STATEMENT EXECUTE FUNCTION "core_auditentry_append_only"();
+"""
+
+# Partition of a month
+CREATE_PARTITION = """
+CREATE TABLE IF NOT EXISTS "core_auditentry_{month:%Y_%m}" PARTITION OF "core_auditentry"
+    FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{next_month:%Y-%m-%d}');
+"""
+
+# Drop the table with its partitions
+DROP_PARTITIONED_TABLE = """
+DROP TABLE "core_auditentry" CASCADE;
+DROP FUNCTION "core_auditentry_append_only"();
+"""
+
+
+def create_audit_table(apps, schema_editor):
+    # Postgres keeps the entries in monthly partitions, the other databases in one table
+    if schema_editor.connection.vendor != 'postgresql':
+        schema_editor.create_model(apps.get_model('core', 'AuditEntry'))
+        return
+    schema_editor.execute(CREATE_PARTITIONED_TABLE)
+
+    # Create the partitions of the current and the next months, later ones are created daily
+    today = datetime.date.today()
+    for offset in range(settings.AUDIT_PARTITIONS_AHEAD + 1):
+        index = today.year * 12 + today.month - 1 + offset
+        month = datetime.date(index // 12, index % 12 + 1, 1)
+        next_month = datetime.date((index + 1) // 12, (index + 1) % 12 + 1, 1)
+        schema_editor.execute(CREATE_PARTITION.format(month=month, next_month=next_month))
+
+
+def drop_audit_table(apps, schema_editor):
+    # Drop the table of the entries
+    if schema_editor.connection.vendor != 'postgresql':
+        schema_editor.delete_model(apps.get_model('core', 'AuditEntry'))
+        return
+    schema_editor.execute(DROP_PARTITIONED_TABLE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_organizations'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='AuditEntry',
+                    fields=[
+                        ('pkid', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                        ('created_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                        ('entity', models.CharField(max_length=64, verbose_name='entity')),
+                        ('entity_id', models.CharField(max_length=64, verbose_name='entity id')),
+                        ('action', models.CharField(choices=[('created', 'Created'), ('updated', 'Updated'), ('deleted', 'Deleted')], max_length=24, verbose_name='action')),
+                        ('changes', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='changes')),
+                        ('actor_email', models.EmailField(blank=True, max_length=254, verbose_name='actor email')),
+                        ('ip_address', models.GenericIPAddressField(blank=True, null=True, verbose_name='IP address')),
+                        ('actor', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                        ('organization', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.organization')),
+                    ],
+                    options={
+                        'verbose_name': 'Audit Entry',
+                        'verbose_name_plural': 'Audit Entries',
+                        'ordering': ['-created_at'],
+                        'indexes': [models.Index(fields=['entity', 'entity_id', 'created_at'], name='audit_entity_idx'), models.Index(fields=['actor', 'created_at'], name='audit_actor_idx'), models.Index(fields=['organization', 'created_at'], name='audit_organization_idx')],
+                    },
+                ),
+            ],
+        ),
+        migrations.RunPython(create_audit_table, drop_audit_table),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.17 on 2026-10-19 20:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_user_active_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxDeadLetter',
+            fields=[
+                ('pkid', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('consumer', models.CharField(max_length=255, verbose_name='consumer')),
+                ('error', models.TextField(blank=True, verbose_name='error')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dead_letters', to='core.outboxevent')),
+            ],
+            options={
+                'verbose_name': 'Outbox Dead Letter',
+                'verbose_name_plural': 'Outbox Dead Letters',
+                'ordering': ['pkid'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='outboxdeadletter',
+            constraint=models.UniqueConstraint(fields=('consumer', 'event'), name='outbox_dead_letter_unique'),
+        ),
+    ]
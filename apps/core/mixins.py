@@ -0,0 +1,31 @@
+# Imports
+from django.db import transaction
+
+
+# Explicit Transaction Mixin
+class ExplicitTransactionMixin:
+    """Explicit Transaction Mixin
+
+    Excludes the view from ATOMIC_REQUESTS. Read-only requests then run in
+    autocommit mode, and the view opens its own transaction.atomic() blocks
+    around the writes, deferring side effects such as emails with
+    transaction.on_commit().
+
+    Methods:
+        as_view: Return the view function excluded from ATOMIC_REQUESTS.
+    """
+
+    # Method to return the view function
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """Return the view function excluded from ATOMIC_REQUESTS.
+
+        Args:
+            **initkwargs: The keyword arguments for the view.
+
+        Returns:
+            function: The view function.
+        """
+
+        # Return the view function marked as non atomic
+        return transaction.non_atomic_requests(super().as_view(**initkwargs))
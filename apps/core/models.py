@@ -3,15 +3,142 @@ import uuid
 from datetime import timedelta
 
 from django.contrib.auth.models import AbstractUser
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models import Q
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
-from apps.core.constants import ROLE_CHOICES, TOKEN_TYPES
+from apps.core.constants import (
+    AUDIT_ACTIONS,
+    OUTBOX_ACTIONS,
+    ROLE_CHOICES,
+    TOKEN_TYPES,
+)
 from apps.core.managers import UserManager
+from apps.core.tenancy import TenantManager, get_current_organization_id, tenant_aliases
 from apps.core.validators import UsernameValidator
 
 
+# Organization Model
+class Organization(models.Model):
+    """Organization Model
+
+    Organization model for a client company, the tenant owning its users and
+    their data. A large organization can move to a dedicated schema.
+
+    Inherits:
+        models.Model
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the organization.
+        id (models.UUIDField): The UUID of the organization.
+        name (models.CharField): The name of the organization.
+        slug (models.SlugField): The unique slug of the organization.
+        database (models.CharField): The alias of its dedicated schema, if any.
+        is_active (models.BooleanField): Whether the organization is active.
+        created_at (models.DateTimeField): The created date of the organization.
+        updated_at (models.DateTimeField): The updated date of the organization.
+
+    Meta:
+        verbose_name (str): The verbose name of the organization.
+        verbose_name_plural (str): The verbose name of the organization in plural.
+        ordering (list[str]): The ordering of the organization.
+
+    Methods:
+        clean: Validate the dedicated schema.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    name = models.CharField(_("name"), max_length=128)
+    slug = models.SlugField(_("slug"), max_length=64, unique=True)
+    database = models.CharField(
+        _("database"),
+        max_length=64,
+        blank=True,
+        help_text=_(
+            "The tenant alias of a dedicated schema, empty for the shared one."
+        ),
+    )
+    is_active = models.BooleanField(_("active"), default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Organization")
+        verbose_name_plural = _("Organizations")
+        ordering = ["name"]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return self.name
+
+    # Method to validate the dedicated schema
+    def clean(self):
+        # If the alias is not a configured tenant schema
+        if self.database and self.database not in tenant_aliases():
+            raise ValidationError(
+                {"database": _("Unknown tenant database: %s.") % self.database}
+            )
+
+
+# Tenant Model
+class TenantModel(models.Model):
+    """Tenant Model
+
+    Abstract model for the data of an organization. The organization leads
+    the composite indexes of the subclasses, so the rows of an organization
+    are read from one range of every index.
+
+    Inherits:
+        models.Model
+
+    Attributes:
+        organization (models.ForeignKey): The organization of the row.
+        is_tenant_scoped (bool): Routes the model to the schema of the organization.
+        tenant_parent (str | None): The foreign key the organization is taken from.
+
+    Managers:
+        objects (TenantManager): The rows of the current organization.
+
+    Methods:
+        save: Set the organization of a new row.
+    """
+
+    # Attributes
+    organization = models.ForeignKey(
+        Organization, on_delete=models.PROTECT, related_name="+"
+    )
+    is_tenant_scoped = True
+    tenant_parent: str | None = None
+
+    # Set object manager
+    objects = TenantManager()
+
+    # Meta class
+    class Meta:
+        # Attributes
+        abstract = True
+
+    # Method to save the row
+    def save(self, *args, **kwargs):
+        # If the row has no organization, take the one of its parent or the current one
+        if self.organization_id is None:
+            parent = getattr(self, self.tenant_parent) if self.tenant_parent else None
+            if parent is not None:
+                self.organization_id = parent.organization_id
+            else:
+                self.organization_id = get_current_organization_id()
+
+        # Save the row
+        super().save(*args, **kwargs)
+
+
 # Customer User Model
 class User(AbstractUser):
     """Customer User Model
@@ -28,6 +155,9 @@ class User(AbstractUser):
         last_name (models.CharField): The last name of the user.
         username (models.CharField): The username of the user.
         email (models.EmailField): The email of the user.
+        role (models.CharField): The role of the user.
+        organization (models.ForeignKey): The organization of the user, none for the staff.
+        updated_at (models.DateTimeField): The updated date of the user.
 
     Constants:
         EMAIL_FIELD (str): The email field of the user.
@@ -70,6 +200,14 @@ class User(AbstractUser):
         choices=ROLE_CHOICES,
         default=ROLE_CHOICES[0][0],
     )
+    organization = models.ForeignKey(
+        Organization,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="users",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
 
     # Set the email and username fields
     EMAIL_FIELD = "email"
@@ -92,6 +230,11 @@ class User(AbstractUser):
             models.Index(fields=["id"], name="user_id_idx"),
             models.Index(fields=["username"], name="user_username_idx"),
             models.Index(fields=["email"], name="user_email_idx"),
+            models.Index(
+                fields=["organization", "role"],
+                condition=Q(is_active=True),
+                name="user_organization_role_idx",
+            ),
         ]
 
     # Property to get the full name
@@ -139,3 +282,198 @@ class TokenRecord(models.Model):
     def is_expired(self, expiry_duration=timedelta(hours=1)):
         # Return the expired status
         return now() > self.created_at + expiry_duration
+
+
+# Outbox Event Model
+class OutboxEvent(models.Model):
+    """Outbox Event Model
+
+    Outbox event model for a change of a tracked model. It is written in the
+    transaction of the change and holds the latest state of the entity, the
+    changes of an entity within one transaction are coalesced into one event.
+
+    Inherits:
+        models.Model
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the event.
+        id (models.UUIDField): The UUID of the event.
+        entity (models.CharField): The label of the model, e.g. leads.lead.
+        entity_id (models.CharField): The primary key of the entity.
+        organization (models.ForeignKey): The organization of the entity, if any.
+        action (models.CharField): The action of the change.
+        changed_fields (models.JSONField): The changed fields, all if empty.
+        data (models.JSONField): The fields of the entity after the change.
+        created_at (models.DateTimeField): The created date of the event.
+        dispatched_at (models.DateTimeField): The date the event was published.
+
+    Meta:
+        verbose_name (str): The verbose name of the event.
+        verbose_name_plural (str): The verbose name of the event in plural.
+        ordering (list[str]): The ordering of the event.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    entity = models.CharField(_("entity"), max_length=64)
+    entity_id = models.CharField(_("entity id"), max_length=64)
+    organization = models.ForeignKey(
+        Organization, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    action = models.CharField(_("action"), max_length=24, choices=OUTBOX_ACTIONS)
+    changed_fields = models.JSONField(_("changed fields"), default=list, blank=True)
+    data = models.JSONField(_("data"), encoder=DjangoJSONEncoder, default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+    dispatched_at = models.DateTimeField(null=True, blank=True)
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Outbox Event")
+        verbose_name_plural = _("Outbox Events")
+        ordering = ["pkid"]
+
+        indexes = [
+            models.Index(
+                fields=["pkid"],
+                condition=Q(dispatched_at__isnull=True),
+                name="outbox_pending_idx",
+            ),
+            models.Index(fields=["dispatched_at"], name="outbox_dispatched_idx"),
+        ]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return f"{self.entity} {self.entity_id} {self.action}"
+
+
+# Outbox Dead Letter Model
+class OutboxDeadLetter(models.Model):
+    """Outbox Dead Letter Model
+
+    Outbox dead letter model for an event a consumer still failed on after its
+    last retry. The event is kept until the dead letter is replayed from the
+    admin or deleted.
+
+    Inherits:
+        models.Model
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the dead letter.
+        consumer (models.CharField): The name of the consumer.
+        event (models.ForeignKey): The outbox event.
+        error (models.TextField): The error of the last attempt.
+        created_at (models.DateTimeField): The created date of the dead letter.
+
+    Meta:
+        verbose_name (str): The verbose name of the dead letter.
+        verbose_name_plural (str): The verbose name of the dead letter in plural.
+        ordering (list[str]): The ordering of the dead letter.
+        constraints (list[UniqueConstraint]): One dead letter per consumer and event.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    consumer = models.CharField(_("consumer"), max_length=255)
+    event = models.ForeignKey(
+        OutboxEvent, on_delete=models.CASCADE, related_name="dead_letters"
+    )
+    error = models.TextField(_("error"), blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Outbox Dead Letter")
+        verbose_name_plural = _("Outbox Dead Letters")
+        ordering = ["pkid"]
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["consumer", "event"], name="outbox_dead_letter_unique"
+            )
+        ]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return f"{self.consumer} {self.event_id}"
+
+
+# Audit Entry Model
+class AuditEntry(models.Model):
+    """Audit Entry Model
+
+    Audit entry model for a change of an audited model, with the values of
+    the changed fields before and after it and the user who made it. The
+    entries are written in batches by a Celery task after the change is
+    committed. On Postgres the table is partitioned by month and rejects
+    updates and deletes, the old partitions are archived to the media storage.
+
+    Inherits:
+        models.Model
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the entry.
+        created_at (models.DateTimeField): The date of the change, the partition key.
+        entity (models.CharField): The label of the model, e.g. leads.lead.
+        entity_id (models.CharField): The primary key of the entity.
+        action (models.CharField): The action of the change.
+        changes (models.JSONField): The old and new value of every changed field.
+        organization (models.ForeignKey): The organization of the entity, if any.
+        actor (models.ForeignKey): The user who made the change, none for the system.
+        actor_email (models.EmailField): The email of the user at the time.
+        ip_address (models.GenericIPAddressField): The address of the request.
+
+    Meta:
+        verbose_name (str): The verbose name of the entry.
+        verbose_name_plural (str): The verbose name of the entry in plural.
+        ordering (list[str]): The ordering of the entry.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    created_at = models.DateTimeField(default=now, editable=False)
+    entity = models.CharField(_("entity"), max_length=64)
+    entity_id = models.CharField(_("entity id"), max_length=64)
+    action = models.CharField(_("action"), max_length=24, choices=AUDIT_ACTIONS)
+    changes = models.JSONField(_("changes"), encoder=DjangoJSONEncoder, default=dict)
+    organization = models.ForeignKey(
+        Organization,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    actor = models.ForeignKey(
+        User,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    actor_email = models.EmailField(_("actor email"), blank=True)
+    ip_address = models.GenericIPAddressField(_("IP address"), null=True, blank=True)
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Audit Entry")
+        verbose_name_plural = _("Audit Entries")
+        ordering = ["-created_at"]
+
+        indexes = [
+            models.Index(
+                fields=["entity", "entity_id", "created_at"], name="audit_entity_idx"
+            ),
+            models.Index(fields=["actor", "created_at"], name="audit_actor_idx"),
+            models.Index(
+                fields=["organization", "created_at"], name="audit_organization_idx"
+            ),
+        ]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return f"{self.entity} {self.entity_id} {self.action}"
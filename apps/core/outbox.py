@@ -0,0 +1,315 @@
+# Imports
+from collections.abc import Callable
+
+from asgiref.local import Local
+from django.db import connections, transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+
+from apps.core.models import OutboxEvent
+
+# Consumers of the outbox events by name
+CONSUMERS: dict[str, "Consumer"] = {}
+
+# Options of the tracked models by label
+TRACKED_MODELS: dict[str, dict] = {}
+
+# Open transactions of the current thread by database alias, like the connections
+_transactions = Local()
+
+
+# Consumer Class
+class Consumer:
+    """Consumer
+
+    A function receiving the outbox events of some entities in a Celery task,
+    after the changes are committed. Events are delivered at least once, so
+    a consumer must be idempotent.
+
+    Attributes:
+        name (str): The dotted path of the function.
+        func (Callable): The function, called with a list of OutboxEvent.
+        entities (tuple[str]): The labels of the consumed models.
+        queue (str | None): The Celery queue of the consumer.
+
+    Methods:
+        accepts: Check if the consumer receives the events of an entity.
+    """
+
+    # Constructor
+    def __init__(self, func: Callable, entities: tuple[str, ...], queue=None):
+        # Set the attributes
+        self.name = f"{func.__module__}.{func.__qualname__}"
+        self.func = func
+        self.entities = entities
+        self.queue = queue
+
+    # Method to check if the consumer receives the events of an entity
+    def accepts(self, entity: str) -> bool:
+        return entity in self.entities
+
+
+# Decorator to register a consumer
+def consumer(*entities: str, queue: str | None = None):
+    """Register a function as a consumer of the outbox events.
+
+    The module of the function must be imported when its app is ready, so the
+    web processes and the workers know it.
+
+    Args:
+        *entities (str): The labels of the consumed models, e.g. leads.lead.
+        queue (str | None): The Celery queue of the consumer, the default if None.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    # Decorator registering the function
+    def decorator(func: Callable) -> Callable:
+        registered = Consumer(func, entities, queue=queue)
+        CONSUMERS[registered.name] = registered
+        return func
+
+    # Return the decorator
+    return decorator
+
+
+# Function to serialize an entity
+def serialize_entity(instance: Model) -> dict:
+    """Serialize the fields of an entity into the data of its events.
+
+    Args:
+        instance (Model): The entity.
+
+    Returns:
+        dict: The concrete fields by attribute name, without the excluded ones.
+    """
+
+    # Get the excluded fields
+    exclude = TRACKED_MODELS[instance._meta.label_lower]["exclude"]
+
+    # Return the fields
+    return {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields
+        if field.name not in exclude
+    }
+
+
+# Function to coalesce two actions on an entity
+def coalesce(previous: str, action: str) -> str | None:
+    """Coalesce the action of a change with the previous one of the transaction.
+
+    Args:
+        previous (str): The action recorded earlier in the transaction.
+        action (str): The action of the change.
+
+    Returns:
+        str | None: The action of the event, or None if the changes cancel out.
+    """
+
+    # An entity created and deleted in the transaction never existed outside
+    if previous == "created":
+        return None if action == "deleted" else "created"
+
+    # An entity deleted and created again was updated
+    if previous == "deleted" and action == "created":
+        return "updated"
+
+    # Otherwise the latest action wins
+    return action
+
+
+# Outbox Transaction Class
+class OutboxTransaction:
+    """Outbox Transaction
+
+    The events written in one database transaction, by entity. Once the
+    transaction commits, the events are published with one Celery message.
+
+    Attributes:
+        using (str): The alias of the database.
+        events (dict[tuple[str, str], OutboxEvent]): The events by entity.
+        registered (bool): Whether the flush runs on commit.
+
+    Methods:
+        is_open: Check if the transaction is still open.
+        flush: Publish the events.
+    """
+
+    # Constructor
+    def __init__(self, using: str):
+        # Set the attributes
+        self.using = using
+        self.events: dict[tuple[str, str], OutboxEvent] = {}
+        self.registered = False
+
+    # Method to check if the transaction is still open
+    def is_open(self) -> bool:
+        # A rolled back transaction drops its commit callbacks, and the flush with them
+        connection = connections[self.using]
+        return connection.in_atomic_block and any(
+            callback == self.flush for _, callback, _ in connection.run_on_commit
+        )
+
+    # Method to publish the events
+    def flush(self):
+        # Forget the transaction
+        if getattr(_transactions, self.using, None) is self:
+            delattr(_transactions, self.using)
+
+        # Publish the events
+        if self.events:
+            from apps.core.tasks import publish_events
+
+            publish_events.delay([event.pkid for event in self.events.values()])
+
+
+# Function to get the outbox transaction of a database
+def get_transaction(using: str) -> OutboxTransaction:
+    """Get the outbox transaction of the open transaction of a database.
+
+    Outside of a transaction every change commits on its own, so a new
+    outbox transaction is returned and flushed right after the change.
+
+    Args:
+        using (str): The alias of the database.
+
+    Returns:
+        OutboxTransaction: The outbox transaction.
+    """
+
+    # If the open transaction has an outbox transaction
+    current = getattr(_transactions, using, None)
+    if current is not None and current.is_open():
+        return current
+
+    # Otherwise start one, kept until its transaction commits
+    current = OutboxTransaction(using)
+    if connections[using].in_atomic_block:
+        setattr(_transactions, using, current)
+    return current
+
+
+# Function to record a change
+def record_change(
+    instance: Model, action: str, using: str, update_fields=None
+) -> OutboxEvent | None:
+    """Write the change of an entity to the outbox.
+
+    The first change of an entity in a transaction inserts its event, later
+    ones coalesce into it, so the consumers receive one event per entity and
+    transaction, holding its latest state. The events are published after the
+    commit, the synchronous part of a save is a single insert or update.
+
+    Args:
+        instance (Model): The changed entity.
+        action (str): The action of the change.
+        using (str): The alias of the database.
+        update_fields (frozenset[str] | None): The saved fields, all if None.
+
+    Returns:
+        OutboxEvent | None: The event, or None if the changes cancelled out.
+    """
+
+    # Get the outbox transaction and the previous event of the entity
+    outbox = get_transaction(using)
+    key = (instance._meta.label_lower, str(instance.pk))
+    event = outbox.events.get(key)
+
+    # If the entity has no event in the transaction yet, insert one
+    if event is None:
+        event = OutboxEvent.objects.using(using).create(
+            entity=key[0],
+            entity_id=key[1],
+            organization_id=getattr(instance, "organization_id", None),
+            action=action,
+            changed_fields=sorted(update_fields or ()),
+            data=serialize_entity(instance),
+        )
+        outbox.events[key] = event
+
+        # Publish the events once committed
+        if not outbox.registered:
+            outbox.registered = True
+            transaction.on_commit(outbox.flush, using=using)
+        return event
+
+    # If the changes cancel out, drop the event
+    merged = coalesce(event.action, action)
+    if merged is None:
+        OutboxEvent.objects.using(using).filter(pkid=event.pkid).delete()
+        del outbox.events[key]
+        return None
+
+    # Otherwise coalesce the change into the event
+    changed = set(event.changed_fields)
+    event.changed_fields = (
+        sorted(changed | set(update_fields)) if changed and update_fields else []
+    )
+    event.action = merged
+    event.data = serialize_entity(instance)
+
+    # Update the event, or insert it again if a rolled back savepoint removed it
+    updated = (
+        OutboxEvent.objects.using(using)
+        .filter(pkid=event.pkid)
+        .update(action=merged, changed_fields=event.changed_fields, data=event.data)
+    )
+    if not updated:
+        event.pkid = None
+        event.save(using=using, force_insert=True)
+
+    # Return the event
+    return event
+
+
+# Signal handler to record a saved entity
+def record_save(sender, instance: Model, created: bool, using: str, **kwargs):
+    """Write the created or updated event of a tracked entity to the outbox."""
+
+    # If the entity is loaded from a fixture
+    if kwargs.get("raw"):
+        return
+
+    # If only ignored fields are saved
+    update_fields = kwargs.get("update_fields")
+    ignore = TRACKED_MODELS[sender._meta.label_lower]["ignore"]
+    if update_fields and set(update_fields) <= ignore:
+        return
+
+    # Record the change
+    action = "created" if created else "updated"
+    record_change(instance, action, using, update_fields=update_fields)
+
+
+# Signal handler to record a deleted entity
+def record_delete(sender, instance: Model, using: str, **kwargs):
+    """Write the deleted event of a tracked entity to the outbox."""
+
+    # Record the change
+    record_change(instance, "deleted", using)
+
+
+# Function to track the changes of a model
+def track_changes(model: type[Model], exclude=(), ignore=()):
+    """Write the changes of a model to the outbox.
+
+    Called when the app of the model is ready. Changes made through save()
+    and delete() are recorded, bulk updates and deletes are not.
+
+    Args:
+        model (type[Model]): The model.
+        exclude (Iterable[str]): The fields left out of the events, e.g. secrets.
+        ignore (Iterable[str]): The fields whose saves alone record no event.
+    """
+
+    # Register the model
+    label = model._meta.label_lower
+    TRACKED_MODELS[label] = {"exclude": set(exclude), "ignore": set(ignore)}
+
+    # Connect the signal handlers
+    post_save.connect(record_save, sender=model, dispatch_uid=f"outbox_save_{label}")
+    post_delete.connect(
+        record_delete, sender=model, dispatch_uid=f"outbox_delete_{label}"
+    )
@@ -0,0 +1,142 @@
+# Imports
+import time
+
+from celery.signals import task_failure
+from django.conf import settings
+from django.core.cache import cache
+
+
+# Function to get the cache key of a progress record
+def progress_key(task_id: str) -> str:
+    """Get the cache key of the progress record of a task.
+
+    Args:
+        task_id (str): The id of the task.
+
+    Returns:
+        str: The cache key.
+    """
+
+    # Return the key
+    return f"celery:progress:{task_id}"
+
+
+# Function to get the progress of a task
+def get_progress(task_id: str) -> dict | None:
+    """Get the progress of a long running task.
+
+    Args:
+        task_id (str): The id of the task.
+
+    Returns:
+        dict | None: The progress, or None if the task records none.
+    """
+
+    # Get the record
+    record = cache.get(progress_key(task_id))
+
+    # If there is no record
+    if record is None:
+        return None
+
+    # Return the progress
+    done, total, state, owner_id = record
+    return {
+        "done": done,
+        "total": total,
+        "state": state,
+        "owner_id": owner_id,
+    }
+
+
+# Task Progress
+class TaskProgress:
+    """Task Progress
+
+    Compact progress record of a long running task. Tasks ignore their results
+    by default, so a job that reports progress keeps a small tuple in the cache
+    instead of result backend state. Updates are throttled to one write per
+    min_interval seconds, and the record expires CELERY_PROGRESS_TIMEOUT
+    seconds after the last write.
+
+    Attributes:
+        task_id (str): The id of the task.
+        total (int): The number of items to process.
+        owner_id (int | None): The primary key of the user who started the task.
+        min_interval (float): The minimum seconds between two writes.
+
+    Methods:
+        update(done, force=False): Record the number of processed items.
+        finish(state="done", done=None): Record the final state.
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        task_id: str,
+        total: int,
+        owner_id: int | None = None,
+        min_interval: float = 2.0,
+    ):
+        # Set the attributes
+        self.task_id = task_id
+        self.total = total
+        self.owner_id = owner_id
+        self.min_interval = min_interval
+        self._written_at = 0.0
+
+    # Method to write the record
+    def _write(self, done: int, state: str):
+        # Write the record and remember when
+        cache.set(
+            progress_key(self.task_id),
+            (done, self.total, state, self.owner_id),
+            settings.CELERY_PROGRESS_TIMEOUT,
+        )
+        self._written_at = time.monotonic()
+
+    # Method to record the number of processed items
+    def update(self, done: int, force: bool = False):
+        """Record the number of processed items.
+
+        Args:
+            done (int): The number of processed items.
+            force (bool): Whether to write even if the last write is recent.
+        """
+
+        # If the last write is recent
+        if not force and time.monotonic() - self._written_at < self.min_interval:
+            return
+
+        # Write the record
+        self._write(done, "running")
+
+    # Method to record the final state
+    def finish(self, state: str = "done", done: int | None = None):
+        """Record the final state.
+
+        Args:
+            state (str): The final state, "done" or "failed".
+            done (int | None): The number of processed items, total by default.
+        """
+
+        # Write the record
+        self._write(self.total if done is None else done, state)
+
+
+# Signal handler to record the failure of a task
+@task_failure.connect
+def fail_task_progress(task_id=None, **kwargs):
+    """Mark the progress of a failed task as failed, if it records one."""
+
+    # Get the record of the task
+    record = cache.get(progress_key(task_id)) if task_id else None
+
+    # If the task records progress, keep it with the failed state
+    if record is not None:
+        done, total, _, owner_id = record
+        cache.set(
+            progress_key(task_id),
+            (done, total, "failed", owner_id),
+            settings.CELERY_PROGRESS_TIMEOUT,
+        )
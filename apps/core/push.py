@@ -0,0 +1,44 @@
+# Imports
+import orjson
+from django_redis import get_redis_connection
+
+# Redis channel of the websocket connections of a user
+USER_CHANNEL = "websocket:user:{}"
+
+
+# Function to push a message to a user
+def push_to_user(user_id: int, message: dict) -> int:
+    """Push a message to the open websocket connections of a user.
+
+    Every connection of a user subscribes to the Redis channel of the user
+    (see config.websocket), so any process can push to it. Messages are not
+    kept, a user without open connections never receives them.
+
+    Args:
+        user_id (int): The primary key of the user.
+        message (dict): The message, sent as JSON.
+
+    Returns:
+        int: The number of connections that received the message.
+    """
+
+    # Publish the message to the channel of the user
+    client = get_redis_connection("default")
+    return client.publish(USER_CHANNEL.format(user_id), orjson.dumps(message))
+
+
+# Function to check if a user has open connections
+def is_user_connected(user_id: int) -> bool:
+    """Check if a user has open websocket connections.
+
+    Args:
+        user_id (int): The primary key of the user.
+
+    Returns:
+        bool: Whether a connection is subscribed to the channel of the user.
+    """
+
+    # Count the subscribers of the channel of the user
+    client = get_redis_connection("default")
+    [(_, subscribers)] = client.pubsub_numsub(USER_CHANNEL.format(user_id))
+    return subscribers > 0
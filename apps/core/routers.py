@@ -0,0 +1,275 @@
+# Imports
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from celery.signals import task_prerun
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+from apps.core.tenancy import get_tenant_database, tenant_aliases
+
+# Whether the reads of the current request or task must go to the primary
+_pinned_to_primary: ContextVar[bool] = ContextVar("pinned_to_primary", default=False)
+
+# Whether the current request or task wrote to the primary
+_wrote_to_primary: ContextVar[bool] = ContextVar("wrote_to_primary", default=False)
+
+# Replicas that failed to connect, mapped to the time they may be retried
+_unavailable_until: dict[str, float] = {}
+
+
+# Function to get the replica aliases
+def replica_aliases() -> list[str]:
+    """Get the aliases of the configured read replicas.
+
+    Returns:
+        list[str]: The replica aliases.
+    """
+
+    # Return the aliases of the replicas
+    return [alias for alias in settings.DATABASES if alias.startswith("replica_")]
+
+
+# Function to check if the reads are pinned to the primary
+def is_pinned_to_primary() -> bool:
+    """Check if the reads of the current context are pinned to the primary.
+
+    Returns:
+        bool: True if the reads must go to the primary.
+    """
+
+    # Return the pinned status
+    return _pinned_to_primary.get()
+
+
+# Function to pin the reads to the primary
+def pin_to_primary(pinned: bool = True):
+    """Pin the reads of the current request or task to the primary.
+
+    Args:
+        pinned (bool): Whether the reads must go to the primary.
+
+    Returns:
+        Token: The token to reset the pinned status.
+    """
+
+    # Set the pinned status
+    return _pinned_to_primary.set(pinned)
+
+
+# Function to restore the pinned status
+def reset_pinning(token):
+    """Restore the pinned status from before a call to pin_to_primary.
+
+    Args:
+        token (Token): The token returned by pin_to_primary.
+    """
+
+    # Restore the pinned status
+    _pinned_to_primary.reset(token)
+
+
+# Context manager to read from the primary
+@contextmanager
+def use_primary():
+    """Read from the primary inside the block."""
+
+    # Pin the reads to the primary
+    token = pin_to_primary()
+
+    # Run the block and restore the previous status
+    try:
+        yield
+    finally:
+        reset_pinning(token)
+
+
+# Context manager to read from the replicas
+@contextmanager
+def use_replicas():
+    """Read from the replicas inside the block, unless the primary was written to.
+
+    Tasks read from the primary by default, bulk and reporting reads that
+    tolerate replication lag opt in to the replicas with this block.
+    """
+
+    # Unpin the reads, a task keeps reading its own writes from the primary
+    token = pin_to_primary(has_written_to_primary())
+
+    # Run the block and restore the previous status
+    try:
+        yield
+    finally:
+        reset_pinning(token)
+
+
+# Function to check if the primary was written to
+def has_written_to_primary() -> bool:
+    """Check if the current request or task wrote to the primary.
+
+    Returns:
+        bool: True if a write was routed to the primary.
+    """
+
+    # Return the written status
+    return _wrote_to_primary.get()
+
+
+# Context manager to track the writes to the primary
+@contextmanager
+def track_writes():
+    """Track the writes to the primary inside the block, from none."""
+
+    # Clear the written status
+    token = _wrote_to_primary.set(False)
+
+    # Run the block and restore the previous status
+    try:
+        yield
+    finally:
+        _wrote_to_primary.reset(token)
+
+
+# Function to check if a replica can be used
+def is_replica_available(alias: str) -> bool:
+    """Check if the replica accepts connections.
+
+    A replica that fails to connect is skipped for DATABASE_REPLICA_RETRY_SECONDS.
+
+    Args:
+        alias (str): The alias of the replica.
+
+    Returns:
+        bool: True if the replica can be used.
+    """
+
+    # If the replica failed recently
+    if _unavailable_until.get(alias, 0) > time.monotonic():
+        return False
+
+    # Try to connect to the replica, this is a no-op for an open connection
+    try:
+        connections[alias].ensure_connection()
+
+    # If the replica can not be reached
+    except DatabaseError:
+        # Skip the replica for a while
+        _unavailable_until[alias] = (
+            time.monotonic() + settings.DATABASE_REPLICA_RETRY_SECONDS
+        )
+        return False
+
+    # Return the available status
+    return True
+
+
+# Function to check if a model belongs to an organization
+def is_tenant_scoped(model) -> bool:
+    """Check if the rows of a model belong to an organization.
+
+    Args:
+        model (type[Model]): The model.
+
+    Returns:
+        bool: True for the subclasses of TenantModel.
+    """
+
+    # Return the tenant scoped status
+    return getattr(model, "is_tenant_scoped", False)
+
+
+# Replica Router
+class ReplicaRouter:
+    """Replica Router
+
+    Sends the reads to a random available read replica and the writes to the
+    primary. Reads fall back to the primary when:
+
+    - no replica is configured or available,
+    - the primary is inside a transaction, so the reads see its writes,
+    - the current context is a task outside use_replicas,
+    - the current request or task has written, or the client wrote within the
+      last DATABASE_REPLICA_STICKY_SECONDS (see ReplicaPinningMiddleware).
+
+    The models of an organization with a dedicated schema are read from and
+    written to its tenant alias instead.
+
+    Methods:
+        db_for_read: Get the database for reads.
+        db_for_write: Get the database for writes.
+        allow_relation: Allow relations between all databases.
+        allow_migrate: Allow migrations on the primary and the tenant schemas.
+    """
+
+    # Method to get the database for reads
+    def db_for_read(self, model, **hints) -> str:
+        # If the organization of the rows has a dedicated schema
+        if is_tenant_scoped(model):
+            database = get_tenant_database()
+            if database is not None:
+                return database
+
+        # If the reads are pinned to the primary
+        if is_pinned_to_primary() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+
+        # Get the replicas in a random order
+        aliases = replica_aliases()
+        random.shuffle(aliases)
+
+        # Return the first available replica
+        for alias in aliases:
+            if is_replica_available(alias):
+                return alias
+
+        # Fall back to the primary
+        return DEFAULT_DB_ALIAS
+
+    # Method to get the database for writes
+    def db_for_write(self, model, **hints) -> str:
+        # If the organization of the rows has a dedicated schema
+        if is_tenant_scoped(model):
+            database = get_tenant_database()
+            if database is not None:
+                return database
+
+        # Read your own writes for the rest of the request or task
+        pin_to_primary()
+        _wrote_to_primary.set(True)
+
+        # Return the primary
+        return DEFAULT_DB_ALIAS
+
+    # Method to allow relations
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        # The replicas hold the same data as the primary
+        return True
+
+    # Method to allow migrations
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool:
+        # The tenant schemas hold the tables of the organizations only
+        if db in tenant_aliases():
+            try:
+                return model_name is not None and is_tenant_scoped(
+                    django_apps.get_model(app_label, model_name)
+                )
+            except LookupError:
+                return False
+
+        # The replicas receive the schema through replication
+        return db == DEFAULT_DB_ALIAS
+
+
+# Signal handler to reset the pinned status of a task
+@task_prerun.connect
+def reset_task_pinning(**kwargs):
+    """Start every task with the reads routed to the primary.
+
+    Tasks are mostly enqueued right after a write, which the replicas may not
+    have received yet. Reads that tolerate the lag opt in with use_replicas.
+    """
+    pin_to_primary()
+    _wrote_to_primary.set(False)
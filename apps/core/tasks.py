@@ -0,0 +1,248 @@
+# Imports
+from collections import defaultdict
+from datetime import timedelta
+from functools import partial
+
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.audit import (
+    archive_audit_month,
+    create_audit_partitions,
+    get_archivable_months,
+    get_month,
+)
+from apps.core.models import AuditEntry, OutboxDeadLetter, OutboxEvent
+from apps.core.outbox import CONSUMERS
+from apps.core.routers import use_primary
+from apps.core.tenancy import use_organization
+
+
+# Task to publish outbox events to their consumers
+@shared_task
+def publish_events(event_ids: list[int]):
+    """Fan the outbox events out to the consumers of their entities.
+
+    Every consumer receives the events of an organization in one task on its
+    own queue, run for that organization, so a slow or failing consumer
+    delays none of the others. The events are marked dispatched once the
+    consumer tasks are queued, a consumer failing on them after its retries
+    dead letters them.
+
+    Args:
+        event_ids (list[int]): The primary keys of the events.
+    """
+
+    # Get the events that are not dispatched yet, committed on the primary
+    with use_primary():
+        events = list(
+            OutboxEvent.objects.filter(
+                pkid__in=event_ids, dispatched_at__isnull=True
+            ).values_list("pkid", "entity", "organization_id")
+        )
+
+    # If every event is dispatched already
+    if not events:
+        return
+
+    # Group the events by organization
+    organizations = defaultdict(list)
+    for pkid, entity, organization_id in events:
+        organizations[organization_id].append((pkid, entity))
+
+    # Queue the events of every consumer and organization
+    for organization_id, organization_events in organizations.items():
+        with use_organization(organization_id):
+            for consumer in CONSUMERS.values():
+                accepted = [
+                    pkid
+                    for pkid, entity in organization_events
+                    if consumer.accepts(entity)
+                ]
+                if accepted:
+                    run_consumer.apply_async(
+                        (consumer.name, accepted), queue=consumer.queue
+                    )
+
+    # Mark the events dispatched
+    OutboxEvent.objects.filter(pkid__in=[pkid for pkid, _, _ in events]).update(
+        dispatched_at=timezone.now()
+    )
+
+
+# Task to run a consumer
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def run_consumer(self, name: str, event_ids: list[int]):
+    """Call a consumer with its outbox events, retried with backoff on errors.
+
+    If the last retry fails too, the events are dead lettered for the consumer
+    and can be replayed from the admin.
+
+    Args:
+        name (str): The name of the consumer.
+        event_ids (list[int]): The primary keys of the events.
+    """
+
+    # If the consumer is gone after a deploy
+    consumer = CONSUMERS.get(name)
+    if consumer is None:
+        return
+
+    # Read the events and their entities from the primary, they were just committed
+    with use_primary():
+        # Get the events in the order of the changes
+        events = list(OutboxEvent.objects.filter(pkid__in=event_ids).order_by("pkid"))
+
+        # If there is no event
+        if not events:
+            return
+
+        # Call the consumer
+        try:
+            consumer.func(events)
+
+        # If the retries are exhausted, dead letter the events
+        except Exception as error:
+            if self.request.retries >= self.max_retries:
+                OutboxDeadLetter.objects.bulk_create(
+                    [
+                        OutboxDeadLetter(
+                            consumer=name, event=event, error=str(error)[:1000]
+                        )
+                        for event in events
+                    ],
+                    ignore_conflicts=True,
+                )
+            raise
+
+
+# Function to queue events to a consumer
+def queue_consumer(name: str, event_ids: list[int], organization_id: int | None):
+    """Queue outbox events to a consumer, run for their organization.
+
+    Args:
+        name (str): The name of the consumer.
+        event_ids (list[int]): The primary keys of the events.
+        organization_id (int | None): The organization of the events.
+    """
+
+    # If the consumer is gone after a deploy
+    consumer = CONSUMERS.get(name)
+    if consumer is None:
+        return
+
+    # Queue the events for their organization
+    with use_organization(organization_id):
+        run_consumer.apply_async((name, event_ids), queue=consumer.queue)
+
+
+# Function to replay dead lettered events
+def replay_dead_letters(dead_letters) -> int:
+    """Queue dead lettered events to their consumers again.
+
+    The dead letters are deleted and the events queued once the deletion is
+    committed, events failing again are dead lettered again.
+
+    Args:
+        dead_letters (QuerySet[OutboxDeadLetter]): The dead letters.
+
+    Returns:
+        int: The number of replayed dead letters.
+    """
+
+    # Group the events by consumer and organization
+    batches = defaultdict(list)
+    for name, event_id, organization_id in dead_letters.values_list(
+        "consumer", "event_id", "event__organization_id"
+    ):
+        batches[(name, organization_id)].append(event_id)
+
+    # Delete the dead letters
+    count, _ = dead_letters.delete()
+
+    # Queue the events once committed
+    for (name, organization_id), event_ids in batches.items():
+        transaction.on_commit(partial(queue_consumer, name, event_ids, organization_id))
+
+    # Return the number of replayed dead letters
+    return count
+
+
+# Task to publish the outbox events that were never published
+@shared_task
+def dispatch_outbox():
+    """Publish the events left behind by a lost commit callback or broker.
+
+    Run every minute, it only picks events older than
+    OUTBOX_DISPATCH_DELAY seconds, so it does not race the publishing after
+    the commit.
+    """
+
+    # Get the pending events in batches
+    cutoff = timezone.now() - timedelta(seconds=settings.OUTBOX_DISPATCH_DELAY)
+    event_ids = list(
+        OutboxEvent.objects.filter(dispatched_at__isnull=True, created_at__lt=cutoff)
+        .order_by("pkid")
+        .values_list("pkid", flat=True)[: settings.OUTBOX_BATCH_SIZE * 10]
+    )
+
+    # Publish the batches
+    for start in range(0, len(event_ids), settings.OUTBOX_BATCH_SIZE):
+        publish_events.delay(event_ids[start : start + settings.OUTBOX_BATCH_SIZE])
+
+
+# Task to purge the dispatched outbox events
+@shared_task(
+    soft_time_limit=settings.BULK_TASK_TIME_LIMIT,
+    time_limit=settings.BULK_TASK_TIME_LIMIT + 60,
+)
+def purge_outbox_events():
+    """Delete the events dispatched more than OUTBOX_RETENTION seconds ago.
+
+    Dead lettered events are kept until they are replayed.
+    """
+
+    # Delete the dispatched events
+    OutboxEvent.objects.filter(
+        dispatched_at__lt=timezone.now() - timedelta(seconds=settings.OUTBOX_RETENTION),
+        dead_letters__isnull=True,
+    ).delete()
+
+
+# Task to write audit entries
+@shared_task(autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def write_audit_entries(entries: list[dict]):
+    """Write the audit entries buffered by a request or task in one insert.
+
+    Args:
+        entries (list[dict]): The fields of the entries.
+    """
+
+    # Write the entries, all or none so a retry writes no duplicates
+    with transaction.atomic():
+        AuditEntry.objects.bulk_create(
+            [AuditEntry(**entry) for entry in entries], batch_size=500
+        )
+
+
+# Task to maintain the audit log
+@shared_task(
+    soft_time_limit=settings.BULK_TASK_TIME_LIMIT,
+    time_limit=settings.BULK_TASK_TIME_LIMIT + 60,
+)
+def maintain_audit_log():
+    """Create the partitions of the next months and archive the old ones.
+
+    Run daily, the months older than AUDIT_RETENTION_MONTHS are moved to
+    compressed archives in the media storage.
+    """
+
+    # Create the partitions of the next months
+    create_audit_partitions(settings.AUDIT_PARTITIONS_AHEAD)
+
+    # Archive the old months
+    cutoff = get_month(timezone.now(), -settings.AUDIT_RETENTION_MONTHS)
+    for month in get_archivable_months(cutoff):
+        archive_audit_month(month)
@@ -0,0 +1,42 @@
+# Imports
+from crispy_forms.templatetags.crispy_forms_filters import as_crispy_form
+from django import template
+from django.conf import settings
+from django.utils.safestring import SafeString
+from django.utils.translation import get_language
+
+# Template library
+register = template.Library()
+
+# Rendered unbound forms by form class and language
+_rendered: dict[tuple[type, str | None], SafeString] = {}
+
+
+# Filter to render a form with crispy, caching unbound forms
+@register.filter
+def crispy_cached(form) -> SafeString:
+    """Render a form like the crispy filter, reusing the HTML of unbound forms.
+
+    An unbound form without initial data renders the same for every request,
+    so its HTML is kept per form class and language for the life of the
+    process. Bound forms, which show values and errors, are rendered normally.
+    The cache is skipped in DEBUG so edits to the crispy templates show up.
+
+    Args:
+        form (Form): The form.
+
+    Returns:
+        SafeString: The rendered form.
+    """
+
+    # If the form can differ between requests
+    if settings.DEBUG or form.is_bound or form.initial or form.prefix:
+        return as_crispy_form(form)
+
+    # Render the form once per class and language
+    key = (type(form), get_language())
+    if key not in _rendered:
+        _rendered[key] = as_crispy_form(form)
+
+    # Return the rendered form
+    return _rendered[key]
@@ -0,0 +1,202 @@
+# Imports
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+
+from celery.signals import before_task_publish, task_prerun
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, models
+
+# Organization of the current request or task, its primary key or a callable resolving it
+_current_organization: ContextVar = ContextVar("current_organization", default=None)
+
+# Organization of the users outside of every organization, it matches no row
+NO_ORGANIZATION = 0
+
+# Dedicated database aliases of the organizations, mapped to the time they expire
+_databases: dict[int, tuple[str, float]] = {}
+
+
+# Function to get the tenant aliases
+def tenant_aliases() -> list[str]:
+    """Get the aliases of the configured tenant schemas.
+
+    Returns:
+        list[str]: The tenant aliases.
+    """
+
+    # Return the aliases of the tenant schemas
+    return [alias for alias in settings.DATABASES if alias.startswith("tenant_")]
+
+
+# Function to get the organization a user acts for
+def get_user_organization_id(user) -> int | None:
+    """Get the organization a user acts for.
+
+    Args:
+        user (User | AnonymousUser): The user.
+
+    Returns:
+        int | None: The primary key of the organization of the user, None for
+            the staff outside of an organization, who act for every one, and
+            NO_ORGANIZATION for everybody else.
+    """
+
+    # If the user belongs to an organization
+    organization_id = getattr(user, "organization_id", None)
+    if organization_id is not None:
+        return organization_id
+
+    # Return None for the staff and NO_ORGANIZATION for the others
+    return None if user.is_authenticated and user.is_staff else NO_ORGANIZATION
+
+
+# Function to get the current organization
+def get_current_organization_id() -> int | None:
+    """Get the organization the current request or task acts for.
+
+    Returns:
+        int | None: The primary key of the organization, or None outside of one.
+    """
+
+    # Get the organization, resolving it on first use
+    value = _current_organization.get()
+    if callable(value):
+        value = value()
+        _current_organization.set(value)
+
+    # Return the organization
+    return value
+
+
+# Function to set the current organization
+def set_current_organization(organization) -> Token:
+    """Set the organization the current request or task acts for.
+
+    Args:
+        organization (Organization | int | Callable | None): The organization,
+            its primary key, a callable returning the primary key on first use,
+            or None to act for every organization.
+
+    Returns:
+        Token: The token to reset the organization.
+    """
+
+    # If an organization is given, keep its primary key
+    if isinstance(organization, models.Model):
+        organization = organization.pk
+
+    # Set the organization
+    return _current_organization.set(organization)
+
+
+# Context manager to act for an organization
+@contextmanager
+def use_organization(organization):
+    """Act for an organization inside the block, None acts for every organization."""
+
+    # Set the organization
+    token = set_current_organization(organization)
+
+    # Run the block and restore the previous organization
+    try:
+        yield
+    finally:
+        _current_organization.reset(token)
+
+
+# Function to get the dedicated database of the current organization
+def get_tenant_database() -> str | None:
+    """Get the alias of the dedicated schema of the current organization.
+
+    The aliases are kept in the process for TENANT_DATABASE_CACHE_SECONDS,
+    without tenant schemas this costs nothing.
+
+    Returns:
+        str | None: The alias, or None if the organization uses the shared schema.
+    """
+
+    # If no organization has a dedicated schema or none is current
+    if not tenant_aliases():
+        return None
+    organization_id = get_current_organization_id()
+    if organization_id is None:
+        return None
+
+    # If the alias is not known or expired
+    database, expires_at = _databases.get(organization_id, ("", 0))
+    if expires_at <= time.monotonic():
+        # Get the alias of the organization
+        from apps.core.models import Organization
+
+        database = (
+            Organization.objects.using(DEFAULT_DB_ALIAS)
+            .filter(pkid=organization_id)
+            .values_list("database", flat=True)
+            .first()
+        ) or ""
+        _databases[organization_id] = (
+            database,
+            time.monotonic() + settings.TENANT_DATABASE_CACHE_SECONDS,
+        )
+
+    # Return the alias
+    return database or None
+
+
+# TenantManager Class
+class TenantManager(models.Manager):
+    """TenantManager
+
+    TenantManager class for the models of an organization. It filters the
+    rows of the current organization, and every row outside of one, e.g. in
+    the admin of a superuser or in the maintenance tasks.
+
+    Inherits:
+        models.Manager
+    """
+
+    # get_queryset Method
+    def get_queryset(self) -> models.QuerySet:
+        """get_queryset
+
+        Filters the rows of the current organization.
+
+        Returns:
+            QuerySet: The rows.
+        """
+
+        # Get the rows
+        queryset = super().get_queryset()
+
+        # If the request or task acts for an organization
+        organization_id = get_current_organization_id()
+        if organization_id is not None:
+            queryset = queryset.filter(organization_id=organization_id)
+
+        # Return the rows
+        return queryset
+
+
+# Signal handler to pass the organization to the tasks
+@before_task_publish.connect
+def add_organization_header(headers=None, **kwargs):
+    """Send the current organization with every task."""
+
+    # If the task is queued for an organization
+    organization_id = get_current_organization_id()
+    if organization_id is not None and headers is not None:
+        headers.setdefault("organization", organization_id)
+
+
+# Signal handler to set the organization of a task
+@task_prerun.connect
+def set_task_organization(task=None, **kwargs):
+    """Run every task for the organization it was queued for."""
+
+    # If the task runs in the caller, it already acts for its organization
+    if task is None or task.request.is_eager:
+        return
+
+    # Set the organization
+    set_current_organization(getattr(task.request, "organization", None))
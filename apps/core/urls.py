@@ -1,11 +1,26 @@
 # Imports
+from django.db import transaction
 from django.urls import path
 from django.views.generic import TemplateView
 
+from apps.core.views import MetricsView, TaskProgressView
+
 # Set app name
 app_name = "core"
 
 # URL Patterns
 urlpatterns = [
-    path("", TemplateView.as_view(template_name="core/home.html"), name="home"),
+    path(
+        "",
+        transaction.non_atomic_requests(
+            TemplateView.as_view(template_name="core/home.html")
+        ),
+        name="home",
+    ),
+    path("metrics", MetricsView.as_view(), name="metrics"),
+    path(
+        "tasks/<str:task_id>/progress/",
+        TaskProgressView.as_view(),
+        name="task-progress",
+    ),
 ]
@@ -0,0 +1,59 @@
+# Imports
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, HttpResponse, JsonResponse
+from django.views.generic import View
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from apps.core.metrics import render_metrics
+from apps.core.mixins import ExplicitTransactionMixin
+from apps.core.progress import get_progress
+
+
+# Metrics View
+class MetricsView(ExplicitTransactionMixin, View):
+    """Prometheus Metrics View.
+
+    Inherits:
+        ExplicitTransactionMixin
+        View
+
+    Methods:
+        get: Method to handle get request
+    """
+
+    # Method to handle get request
+    def get(self, request):
+        # Return the rendered metrics
+        return HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
+
+
+# Task Progress View
+class TaskProgressView(LoginRequiredMixin, ExplicitTransactionMixin, View):
+    """Progress of a long running task started by the user.
+
+    Inherits:
+        LoginRequiredMixin
+        ExplicitTransactionMixin
+        View
+
+    Attributes:
+        raise_exception (bool): Answer anonymous requests with 403.
+
+    Methods:
+        get: Method to handle get request
+    """
+
+    # Attributes
+    raise_exception = True
+
+    # Method to handle get request
+    def get(self, request, task_id):
+        # Get the progress of the task
+        progress = get_progress(task_id)
+
+        # If the task records no progress or was started by another user
+        if progress is None or progress.pop("owner_id") != request.user.pk:
+            raise Http404
+
+        # Return the progress
+        return JsonResponse(progress)
@@ -0,0 +1,328 @@
+# Imports
+from django.contrib import admin, messages
+from django.utils.html import format_html
+from django.utils.translation import gettext_lazy as _
+
+from apps.leads.archive import archive_leads, restore_lead
+from apps.leads.models import Activity, Attachment, Blob, Lead, Reminder
+
+
+# Register the Lead model
+@admin.register(Lead)
+class LeadAdmin(admin.ModelAdmin):
+    """Lead Admin
+
+    Lead Admin for the Lead model.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        list_display_links (list[str]): The list of fields to display as links.
+        search_fields (list[str]): The list of fields to search.
+        list_filter (list[str]): The list of fields to filter.
+        ordering (list[str]): The list of fields to order by.
+        fieldsets (tuple[str]): The fieldsets for the Lead model.
+        actions (list[str]): The actions on the selected leads.
+
+    Methods:
+        get_queryset: Get the active and archived leads.
+        archive: Archive the selected leads.
+        restore: Restore the selected archived leads.
+    """
+
+    # Set model
+    model = Lead
+
+    # List display
+    list_display = [
+        "pkid",
+        "id",
+        "first_name",
+        "last_name",
+        "email",
+        "company",
+        "status",
+        "owner",
+    ]
+
+    # List display links
+    list_display_links = ["pkid", "id"]
+
+    # Search fields
+    search_fields = ["first_name", "last_name", "email", "company"]
+
+    # List filter
+    list_filter = ["status", ("archived_at", admin.EmptyFieldListFilter)]
+
+    # Ordering
+    ordering = ["-created_at"]
+
+    # Fieldsets
+    fieldsets = (
+        (_("Lead Profile"), {"fields": ("pkid", "id", "owner", "status")}),
+        (
+            _("Contact Details"),
+            {"fields": ("first_name", "last_name", "email", "phone", "company")},
+        ),
+        (
+            _("Important Dates"),
+            {"fields": ("created_at", "updated_at", "archived_at")},
+        ),
+    )
+
+    # Set readonly fields
+    readonly_fields = ["pkid", "id", "created_at", "updated_at", "archived_at"]
+
+    # Set raw id fields
+    raw_id_fields = ["owner"]
+
+    # Actions
+    actions = ["archive", "restore"]
+
+    # Method to get the active and archived leads
+    def get_queryset(self, request):
+        # Get the leads with the archived ones
+        queryset = Lead.all_objects.get_queryset()
+
+        # Return the ordered leads
+        ordering = self.get_ordering(request)
+        return queryset.order_by(*ordering) if ordering else queryset
+
+    # Action to archive the selected leads
+    @admin.action(description=_("Archive the selected leads"))
+    def archive(self, request, queryset):
+        # Archive the active leads
+        archived = archive_leads(
+            list(
+                queryset.filter(archived_at__isnull=True).values_list("pkid", flat=True)
+            ),
+            using=queryset.db,
+        )
+
+        # Show a message
+        self.message_user(
+            request,
+            _("%(count)d leads archived.") % {"count": archived},
+            messages.SUCCESS,
+        )
+
+    # Action to restore the selected archived leads
+    @admin.action(description=_("Restore the selected archived leads"))
+    def restore(self, request, queryset):
+        # Restore the archived leads
+        leads = list(queryset.filter(archived_at__isnull=False))
+        for lead in leads:
+            restore_lead(lead)
+
+        # Show a message
+        self.message_user(
+            request,
+            _("%(count)d leads restored.") % {"count": len(leads)},
+            messages.SUCCESS,
+        )
+
+
+# Register the Activity model
+@admin.register(Activity)
+class ActivityAdmin(admin.ModelAdmin):
+    """Activity Admin
+
+    Activity Admin for the Activity model.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        search_fields (list[str]): The list of fields to search.
+        list_filter (list[str]): The list of fields to filter.
+        ordering (list[str]): The list of fields to order by.
+        readonly_fields (list[str]): The list of read only fields.
+    """
+
+    # Set model
+    model = Activity
+
+    # List display
+    list_display = ["id", "kind", "subject", "lead", "user", "occurred_at"]
+
+    # Search fields
+    search_fields = ["subject", "lead__email"]
+
+    # List filter
+    list_filter = ["kind"]
+
+    # Ordering
+    ordering = ["-occurred_at"]
+
+    # Set readonly fields
+    readonly_fields = ["id", "created_at", "updated_at"]
+
+    # Set raw id fields
+    raw_id_fields = ["lead", "user"]
+
+
+# Register the Reminder model
+@admin.register(Reminder)
+class ReminderAdmin(admin.ModelAdmin):
+    """Reminder Admin
+
+    Reminder Admin for the Reminder model.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        search_fields (list[str]): The list of fields to search.
+        list_filter (list[str]): The list of fields to filter.
+        ordering (list[str]): The list of fields to order by.
+        readonly_fields (list[str]): The list of read only fields.
+    """
+
+    # Set model
+    model = Reminder
+
+    # List display
+    list_display = ["id", "note", "lead", "user", "due_at", "channel", "status"]
+
+    # Search fields
+    search_fields = ["note", "lead__email", "user__email"]
+
+    # List filter
+    list_filter = ["status", "channel"]
+
+    # Ordering
+    ordering = ["-due_at"]
+
+    # Set readonly fields
+    readonly_fields = ["id", "sent_at", "created_at", "updated_at"]
+
+    # Set raw id fields
+    raw_id_fields = ["lead", "user"]
+
+
+# Register the Attachment model
+@admin.register(Attachment)
+class AttachmentAdmin(admin.ModelAdmin):
+    """Attachment Admin
+
+    Attachment Admin for the Attachment model.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        list_display_links (list[str]): The list of fields to display as links.
+        search_fields (list[str]): The list of fields to search.
+        list_filter (list[str]): The list of fields to filter.
+        ordering (list[str]): The list of fields to order by.
+        readonly_fields (list[str]): The list of read only fields.
+
+    Methods:
+        thumbnail_tag: Render the thumbnail of the attachment.
+    """
+
+    # Set model
+    model = Attachment
+
+    # List display
+    list_display = [
+        "thumbnail_tag",
+        "id",
+        "original_name",
+        "kind",
+        "size",
+        "status",
+        "lead",
+        "uploaded_by",
+        "created_at",
+    ]
+
+    # List display links
+    list_display_links = ["id", "original_name"]
+
+    # Search fields
+    search_fields = ["original_name", "uploaded_by__email"]
+
+    # List filter
+    list_filter = ["kind", "status"]
+
+    # Ordering
+    ordering = ["-created_at"]
+
+    # Set readonly fields
+    readonly_fields = [
+        "id",
+        "file",
+        "original_name",
+        "content_type",
+        "size",
+        "upload_id",
+        "status",
+        "created_at",
+        "content_sha256",
+        "thumbnail",
+        "preview",
+        "completed_at",
+    ]
+
+    # Set raw id fields
+    raw_id_fields = ["lead", "blob", "uploaded_by"]
+
+    # Method to render the thumbnail
+    @admin.display(description=_("Thumbnail"))
+    def thumbnail_tag(self, obj):
+        # If the thumbnail is not rendered yet
+        if not obj.thumbnail_url:
+            return "-"
+
+        # Return the thumbnail, never the original
+        return format_html(
+            '<img src="{}" alt="" loading="lazy" style="max-height: 48px;">',
+            obj.thumbnail_url,
+        )
+
+
+# Register the Blob model
+@admin.register(Blob)
+class BlobAdmin(admin.ModelAdmin):
+    """Blob Admin
+
+    Blob Admin for the Blob model.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        search_fields (list[str]): The list of fields to search.
+        ordering (list[str]): The list of fields to order by.
+        readonly_fields (list[str]): The list of read only fields.
+    """
+
+    # Set model
+    model = Blob
+
+    # List display
+    list_display = ["sha256", "content_type", "size", "ref_count", "updated_at"]
+
+    # Search fields
+    search_fields = ["sha256"]
+
+    # Ordering
+    ordering = ["-updated_at"]
+
+    # Set readonly fields
+    readonly_fields = [
+        "sha256",
+        "file",
+        "size",
+        "content_type",
+        "ref_count",
+        "created_at",
+        "updated_at",
+    ]
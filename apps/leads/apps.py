@@ -0,0 +1,39 @@
+# Imports
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+# LeadsConfig Class
+class LeadsConfig(AppConfig):
+    """LeadsConfig
+
+    LeadsConfig class is used to configure the leads app.
+
+    Inherits:
+        AppConfig
+
+    Attributes:
+        name (str): The name of the app.
+        verbose_name (str): The verbose name of the app.
+
+    Methods:
+        ready: Connect the signal handlers, track and audit the models of the app.
+    """
+
+    # Attributes
+    name = "apps.leads"
+    verbose_name = _("Leads")
+
+    # Method to connect the signal handlers
+    def ready(self):
+        # Import the modules that register signal handlers
+        import apps.leads.signals  # noqa: F401
+        from apps.core.audit import audit_changes
+        from apps.core.outbox import track_changes
+        from apps.leads.models import Lead
+
+        # Write the changes of the leads to the outbox
+        track_changes(Lead)
+
+        # Audit the edits of the leads
+        audit_changes(Lead, ignore=["version", "updated_at"])
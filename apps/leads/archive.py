@@ -0,0 +1,134 @@
+# Imports
+import zlib
+
+import orjson
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS, router, transaction
+from django.utils import timezone
+
+from apps.leads.models import Activity, Lead, LeadArchive, LeadTombstone, next_version
+
+# User Model
+User = get_user_model()
+
+
+# Function to archive leads
+def archive_leads(lead_ids: list[int], using: str = DEFAULT_DB_ALIAS) -> int:
+    """Archive active leads and move their activities to the archive.
+
+    The leads stay in their table, out of the partial indexes, and their
+    activities move into one compressed LeadArchive row per lead. The leads
+    leave tombstones, so the offline copies drop them.
+
+    Args:
+        lead_ids (list[int]): The primary keys of the leads.
+        using (str): The database of the leads.
+
+    Returns:
+        int: The number of archived leads.
+    """
+
+    with transaction.atomic(using=using):
+        # Lock the leads that are still active
+        leads = list(
+            Lead.objects.using(using)
+            .select_for_update()
+            .filter(pkid__in=lead_ids)
+            .values_list("pkid", "id", "organization_id", "owner_id")
+        )
+
+        # If every lead is archived already
+        if not leads:
+            return 0
+
+        # Get the activities of the leads, in the order they were logged
+        pkids = [pkid for pkid, _, _, _ in leads]
+        activities = {pkid: [] for pkid in pkids}
+        rows = Activity._base_manager.using(using).filter(lead_id__in=pkids)
+        for row in rows.order_by("pkid").values().iterator(chunk_size=2000):
+            activities[row["lead_id"]].append(row)
+
+        # Move the activities into the archives
+        LeadArchive.objects.using(using).bulk_create(
+            [
+                LeadArchive(
+                    organization_id=organization_id,
+                    lead_id=pkid,
+                    activities=zlib.compress(orjson.dumps(activities[pkid])),
+                    activity_count=len(activities[pkid]),
+                )
+                for pkid, _, organization_id, _ in leads
+            ]
+        )
+        rows.delete()
+
+        # Leave the tombstones of the leads
+        LeadTombstone.objects.using(using).bulk_create(
+            [
+                LeadTombstone(
+                    lead_uuid=lead_uuid,
+                    organization_id=organization_id,
+                    owner_id=owner_id,
+                    version=next_version(using),
+                )
+                for _, lead_uuid, organization_id, owner_id in leads
+            ]
+        )
+
+        # Archive the leads
+        Lead._base_manager.using(using).filter(pkid__in=pkids).update(
+            archived_at=timezone.now()
+        )
+
+    # Return the number of archived leads
+    return len(leads)
+
+
+# Function to restore an archived lead
+def restore_lead(lead: Lead) -> Lead:
+    """Restore an archived lead and move its activities back.
+
+    The lead is saved under a new sync version, so the offline copies and
+    the webhooks receive it again.
+
+    Args:
+        lead (Lead): The archived lead.
+
+    Returns:
+        Lead: The restored lead.
+    """
+
+    # Get the database of the lead
+    using = lead._state.db or router.db_for_write(Lead, instance=lead)
+
+    with transaction.atomic(using=using):
+        # If the lead has archived activities
+        archive = (
+            LeadArchive.objects.using(using)
+            .select_for_update()
+            .filter(lead=lead)
+            .first()
+        )
+        if archive is not None:
+            # Get the activities, without the users deleted since
+            rows = orjson.loads(zlib.decompress(archive.activities))
+            users = set(
+                User.objects.using(using)
+                .filter(pk__in={row["user_id"] for row in rows if row["user_id"]})
+                .values_list("pk", flat=True)
+            )
+            for row in rows:
+                if row["user_id"] not in users:
+                    row["user_id"] = None
+
+            # Move the activities back, raw so their dates are kept
+            for row in rows:
+                Activity(**row).save_base(raw=True, force_insert=True, using=using)
+            archive.delete()
+
+        # Restore the lead
+        lead.archived_at = None
+        lead.save(using=using, update_fields=["archived_at"])
+
+    # Return the lead
+    return lead
@@ -0,0 +1,51 @@
+# Imports
+from django.utils.translation import gettext_lazy as _
+
+# Lead Statuses
+LEAD_STATUSES = (
+    ("new", _("New")),
+    ("contacted", _("Contacted")),
+    ("qualified", _("Qualified")),
+    ("won", _("Won")),
+    ("lost", _("Lost")),
+)
+
+# Lead statuses of the closed leads, archived first
+CLOSED_LEAD_STATUSES = ("won", "lost")
+
+# Activity Kinds
+ACTIVITY_KINDS = (
+    ("note", _("Note")),
+    ("call", _("Call")),
+    ("email", _("Email")),
+    ("meeting", _("Meeting")),
+)
+
+# Attachment Kinds
+ATTACHMENT_KINDS = (
+    ("attachment", _("Attachment")),
+    ("import", _("Import File")),
+)
+
+# Upload Statuses
+UPLOAD_STATUSES = (
+    ("pending", _("Pending")),
+    ("completed", _("Completed")),
+    ("aborted", _("Aborted")),
+)
+
+# Reminder Channels
+REMINDER_CHANNELS = (
+    ("websocket", _("In App")),
+    ("email", _("Email")),
+)
+
+# Reminder Statuses
+REMINDER_STATUSES = (
+    ("pending", _("Pending")),
+    ("sent", _("Sent")),
+    ("cancelled", _("Cancelled")),
+)
+
+# Roles that can access the leads of every user
+LEAD_MANAGER_ROLES = ("admin", "manager")
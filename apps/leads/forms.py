@@ -0,0 +1,94 @@
+# Imports
+from django import forms
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.validators import RegexValidator
+
+from apps.leads.constants import ATTACHMENT_KINDS
+from apps.leads.models import Lead
+
+
+# Upload Form
+class UploadForm(forms.Form):
+    """Upload Form
+
+    Validates a request to upload a file straight to the bucket.
+
+    Inherits:
+        forms.Form
+
+    Attributes:
+        filename (str): The name of the file on the client.
+        content_type (str): The content type of the file.
+        size (int): The size of the file in bytes.
+        kind (str): The kind of the file.
+        lead (uuid.UUID): The id of the lead, required for attachments.
+        sha256 (str): The SHA-256 of the file, to skip uploading content the user
+            uploaded before.
+
+    Methods:
+        clean_lead: Check the lead exists and is accessible to the user.
+        clean: Check attachments have a lead.
+    """
+
+    # Attributes
+    filename = forms.CharField(max_length=255)
+    content_type = forms.CharField(max_length=128)
+    size = forms.IntegerField(min_value=1)
+    kind = forms.ChoiceField(choices=ATTACHMENT_KINDS)
+    lead = forms.UUIDField(required=False)
+    sha256 = forms.CharField(
+        required=False,
+        validators=[RegexValidator(r"^[0-9a-f]{64}$", "Enter a hex SHA-256.")],
+    )
+
+    # Constructor
+    def __init__(self, *args, user=None, **kwargs):
+        # Call the parent constructor
+        super().__init__(*args, **kwargs)
+
+        # Set the user
+        self.user = user
+
+    # Method to clean the size
+    def clean_size(self):
+        # Get the size
+        size = self.cleaned_data.get("size")
+
+        # If the file is too large
+        if size > settings.LEADS_UPLOAD_MAX_SIZE:
+            raise ValidationError("File is too large.")
+
+        # Return the size
+        return size
+
+    # Method to clean the lead
+    def clean_lead(self):
+        # Get the lead id
+        lead_id = self.cleaned_data.get("lead")
+
+        # If no lead is given
+        if not lead_id:
+            return None
+
+        # Get the lead
+        lead = Lead.objects.visible_to(self.user).filter(id=lead_id).first()
+
+        # If the lead is not found
+        if not lead:
+            raise ValidationError("Lead not found.")
+
+        # Return the lead
+        return lead
+
+    # Method to clean the form
+    def clean(self):
+        # Get the cleaned data
+        cleaned_data = super().clean()
+
+        # If an attachment has no lead
+        if cleaned_data.get("kind") == "attachment" and not cleaned_data.get("lead"):
+            self.add_error("lead", "Attachments must belong to a lead.")
+
+        # Return the cleaned data
+        return cleaned_data
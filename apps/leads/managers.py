@@ -0,0 +1,318 @@
+# Imports
+from datetime import timedelta
+
+from django.db import models, transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.utils import timezone
+
+from apps.core.tenancy import TenantManager
+from apps.leads.constants import CLOSED_LEAD_STATUSES, LEAD_MANAGER_ROLES
+
+
+# LeadQuerySet Class
+class LeadQuerySet(models.QuerySet):
+    """LeadQuerySet
+
+    LeadQuerySet class for the Lead model.
+
+    Inherits:
+        models.QuerySet
+
+    Methods:
+        visible_to: Filter the leads a user can access.
+        archivable: Filter the leads due for the archive.
+    """
+
+    # visible_to Method
+    def visible_to(self, user) -> "LeadQuerySet":
+        """visible_to
+
+        Filters the leads a user can access. Admins and managers access every
+        lead, other roles only the leads they own.
+
+        Args:
+            user (User): The user.
+
+        Returns:
+            LeadQuerySet: The filtered leads.
+        """
+
+        if user.role in LEAD_MANAGER_ROLES:
+            return self
+        return self.filter(owner=user)
+
+    # archivable Method
+    def archivable(self, closed_after: int, stale_after: int) -> "LeadQuerySet":
+        """archivable
+
+        Filters the active leads due for the archive, the won and lost leads
+        untouched for closed_after seconds and every lead untouched for
+        stale_after seconds.
+
+        Args:
+            closed_after (int): The seconds a closed lead stays active.
+            stale_after (int): The seconds an untouched lead stays active.
+
+        Returns:
+            LeadQuerySet: The filtered leads.
+        """
+
+        now = timezone.now()
+        return self.filter(archived_at__isnull=True).filter(
+            Q(
+                status__in=CLOSED_LEAD_STATUSES,
+                updated_at__lt=now - timedelta(seconds=closed_after),
+            )
+            | Q(updated_at__lt=now - timedelta(seconds=stale_after))
+        )
+
+
+# LeadManager Class
+class LeadManager(TenantManager.from_queryset(LeadQuerySet)):
+    """LeadManager
+
+    LeadManager class for the active leads of the current organization.
+    Archived leads are left out, so the queries match the partial indexes
+    that only cover the active leads.
+
+    Inherits:
+        TenantManager.from_queryset(LeadQuerySet)
+    """
+
+    # get_queryset Method
+    def get_queryset(self) -> LeadQuerySet:
+        """get_queryset
+
+        Filters the active leads.
+
+        Returns:
+            LeadQuerySet: The active leads.
+        """
+
+        return super().get_queryset().filter(archived_at__isnull=True)
+
+
+# LeadTombstoneQuerySet Class
+class LeadTombstoneQuerySet(models.QuerySet):
+    """LeadTombstoneQuerySet
+
+    LeadTombstoneQuerySet class for the LeadTombstone model.
+
+    Inherits:
+        models.QuerySet
+
+    Methods:
+        visible_to: Filter the tombstones of the leads a user had access to.
+    """
+
+    # visible_to Method
+    def visible_to(self, user) -> "LeadTombstoneQuerySet":
+        """visible_to
+
+        Filters the tombstones of the leads a user had access to. Admins and
+        managers see every tombstone, other roles only those of the leads
+        they owned.
+
+        Args:
+            user (User): The user.
+
+        Returns:
+            LeadTombstoneQuerySet: The filtered tombstones.
+        """
+
+        if user.role in LEAD_MANAGER_ROLES:
+            return self
+        return self.filter(owner=user)
+
+
+# ActivityQuerySet Class
+class ActivityQuerySet(models.QuerySet):
+    """ActivityQuerySet
+
+    ActivityQuerySet class for the Activity model.
+
+    Inherits:
+        models.QuerySet
+
+    Methods:
+        visible_to: Filter the activities a user can access.
+    """
+
+    # visible_to Method
+    def visible_to(self, user) -> "ActivityQuerySet":
+        """visible_to
+
+        Filters the activities a user can access, the activities of the leads
+        the user can access.
+
+        Args:
+            user (User): The user.
+
+        Returns:
+            ActivityQuerySet: The filtered activities.
+        """
+
+        if user.role in LEAD_MANAGER_ROLES:
+            return self
+        return self.filter(lead__owner=user)
+
+
+# BlobQuerySet Class
+class BlobQuerySet(models.QuerySet):
+    """BlobQuerySet
+
+    BlobQuerySet class for the Blob model.
+
+    Inherits:
+        models.QuerySet
+
+    Methods:
+        acquire: Add a reference to a blob.
+        release: Drop a reference to a blob.
+        orphaned: Filter the blobs unreferenced for a while.
+    """
+
+    # acquire Method
+    def acquire(
+        self,
+        sha256: str,
+        size: int | None = None,
+        content_type: str = "",
+        source: str | None = None,
+        uploaded_by=None,
+    ):
+        """acquire
+
+        Adds a reference to the blob of a content. With a source file the blob
+        is created if needed, and the source is copied into the blob storage
+        unless the content is stored already. The copy runs before the blob
+        row is locked, the row then stays locked until the surrounding
+        transaction ends, so a concurrent purge can not drop it.
+
+        Without a source the caller only claims to hold the content, so only
+        a blob of the same size that the user already uploaded is referenced.
+
+        Args:
+            sha256 (str): The SHA-256 of the content.
+            size (int | None): The size of the content in bytes.
+            content_type (str): The content type of the content.
+            source (str | None): The media file holding the content.
+            uploaded_by (User | None): The user claiming the content, without a source.
+
+        Returns:
+            Blob | None: The blob, or None if it does not exist and no source is given.
+        """
+
+        # Copy the content unless it is stored already, the name only depends
+        # on the content so a concurrent copy writes the same object
+        storage = self.model._meta.get_field("file").storage
+        name = storage.blob_name(sha256)
+        if source is not None and not storage.exists(name):
+            storage.copy(source, name)
+
+        with transaction.atomic(using=self.db):
+            # If there is no source, only a blob the user uploaded can be referenced
+            if source is None:
+                attachments = self.model._meta.get_field("attachments").related_model
+                blob = (
+                    self.select_for_update()
+                    .filter(
+                        Exists(
+                            attachments._base_manager.filter(
+                                blob=OuterRef("pk"), uploaded_by=uploaded_by
+                            )
+                        ),
+                        sha256=sha256,
+                        size=size,
+                    )
+                    .first()
+                )
+                if blob is None:
+                    return None
+
+            # Get or create the blob
+            else:
+                blob, _ = self.select_for_update().get_or_create(
+                    sha256=sha256,
+                    defaults={"file": name, "size": size, "content_type": content_type},
+                )
+
+                # If a purge deleted the content before the row was locked, copy it again
+                if not storage.exists(blob.file.name):
+                    storage.copy(source, blob.file.name)
+
+            # Add the reference
+            self.filter(pk=blob.pk).update(
+                ref_count=F("ref_count") + 1, updated_at=timezone.now()
+            )
+            blob.ref_count += 1
+
+        return blob
+
+    # release Method
+    def release(self, pk) -> int:
+        """release
+
+        Drops a reference to a blob. The blob is purged once it stays
+        unreferenced for LEADS_BLOB_PURGE_GRACE seconds.
+
+        Args:
+            pk (int): The primary key of the blob.
+
+        Returns:
+            int: The number of updated blobs.
+        """
+
+        return self.filter(pk=pk, ref_count__gt=0).update(
+            ref_count=F("ref_count") - 1, updated_at=timezone.now()
+        )
+
+    # orphaned Method
+    def orphaned(self, grace: int) -> "BlobQuerySet":
+        """orphaned
+
+        Filters the blobs that have been unreferenced for grace seconds.
+
+        Args:
+            grace (int): The seconds a blob is kept after its last reference.
+
+        Returns:
+            BlobQuerySet: The filtered blobs.
+        """
+
+        attachments = self.model._meta.get_field("attachments").related_model
+        return self.filter(
+            ~Exists(attachments._base_manager.filter(blob=OuterRef("pk"))),
+            ref_count=0,
+            updated_at__lt=timezone.now() - timedelta(seconds=grace),
+        )
+
+
+# ReminderQuerySet Class
+class ReminderQuerySet(models.QuerySet):
+    """ReminderQuerySet
+
+    ReminderQuerySet class for the Reminder model.
+
+    Inherits:
+        models.QuerySet
+
+    Methods:
+        due_before: Filter the pending reminders due before a date.
+    """
+
+    # due_before Method
+    def due_before(self, until) -> "ReminderQuerySet":
+        """due_before
+
+        Filters the pending reminders due before a date, overdue ones
+        included, through the partial index on the due date.
+
+        Args:
+            until (datetime): The date.
+
+        Returns:
+            ReminderQuerySet: The filtered reminders.
+        """
+
+        return self.filter(status="pending", due_at__lte=until)
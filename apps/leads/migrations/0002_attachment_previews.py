@@ -0,0 +1,28 @@
+# Generated by Django 4.2.17 on 2026-10-19 19:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attachment',
+            name='content_sha256',
+            field=models.CharField(blank=True, max_length=64, verbose_name='content SHA-256'),
+        ),
+        migrations.AddField(
+            model_name='attachment',
+            name='preview',
+            field=models.FileField(blank=True, max_length=512, upload_to='', verbose_name='preview'),
+        ),
+        migrations.AddField(
+            model_name='attachment',
+            name='thumbnail',
+            field=models.FileField(blank=True, max_length=512, upload_to='', verbose_name='thumbnail'),
+        ),
+    ]
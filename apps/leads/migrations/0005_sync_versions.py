@@ -0,0 +1,81 @@
+# Generated by Django 4.2.17 on 2026-10-19 19:17
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+import django.db.models.deletion
+
+
+def backfill_versions(apps, schema_editor):
+    # Number the existing leads in creation order and start the sequence after them
+    Lead = apps.get_model('leads', 'Lead')
+    Lead.objects.using(schema_editor.connection.alias).update(version=F('pkid'))
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE SEQUENCE IF NOT EXISTS leads_sync_version_seq')
+        schema_editor.execute(
+            "SELECT setval('leads_sync_version_seq', COALESCE((SELECT MAX(pkid) FROM leads_lead), 0) + 1, false)"
+        )
+
+
+def drop_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP SEQUENCE IF EXISTS leads_sync_version_seq')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('leads', '0004_activity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeadTombstone',
+            fields=[
+                ('pkid', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('lead_uuid', models.UUIDField(verbose_name='lead UUID')),
+                ('version', models.BigIntegerField(verbose_name='version')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Lead Tombstone',
+                'verbose_name_plural': 'Lead Tombstones',
+            },
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='version',
+            field=models.BigIntegerField(default=0, editable=False, verbose_name='version'),
+        ),
+        migrations.RunPython(backfill_versions, drop_sequence),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['version'], name='lead_version_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['owner', 'version'], name='lead_owner_version_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['updated_at'], name='lead_updated_at_idx'),
+        ),
+        migrations.AddField(
+            model_name='leadtombstone',
+            name='owner',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='leadtombstone',
+            index=models.Index(fields=['version'], name='tombstone_version_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leadtombstone',
+            index=models.Index(fields=['owner', 'version'], name='tombstone_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leadtombstone',
+            index=models.Index(fields=['deleted_at'], name='tombstone_deleted_at_idx'),
+        ),
+    ]
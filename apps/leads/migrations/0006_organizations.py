@@ -0,0 +1,141 @@
+# Generated by Django 4.2.17 on 2026-10-19 19:37
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def set_organizations(apps, schema_editor):
+    # Give the existing rows to the default organization
+    Organization = apps.get_model('core', 'Organization')
+    using = schema_editor.connection.alias
+    organization, _ = Organization.objects.using(using).get_or_create(
+        slug=settings.DEFAULT_ORGANIZATION_SLUG, defaults={'name': 'Default'}
+    )
+    for model_name in ['lead', 'leadtombstone', 'activity', 'attachment']:
+        model = apps.get_model('leads', model_name)
+        model.objects.using(using).update(organization=organization)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_organizations'),
+        ('leads', '0005_sync_versions'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='activity',
+            name='activity_lead_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='attachment',
+            name='attachment_lead_status_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_owner_status_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_email_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_version_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_owner_version_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_updated_at_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='leadtombstone',
+            name='tombstone_version_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='leadtombstone',
+            name='tombstone_owner_idx',
+        ),
+        migrations.AddField(
+            model_name='activity',
+            name='organization',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AddField(
+            model_name='attachment',
+            name='organization',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='organization',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AddField(
+            model_name='leadtombstone',
+            name='organization',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.RunPython(set_organizations, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='lead',
+            name='organization',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AlterField(
+            model_name='leadtombstone',
+            name='organization',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AlterField(
+            model_name='activity',
+            name='organization',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AlterField(
+            model_name='attachment',
+            name='organization',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['organization', 'lead', 'occurred_at'], name='activity_lead_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attachment',
+            index=models.Index(fields=['organization', 'lead', 'status'], name='attachment_lead_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['organization', 'owner', 'status'], name='lead_owner_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['organization', 'email'], name='lead_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['organization', 'version'], name='lead_version_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['organization', 'owner', 'version'], name='lead_owner_version_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['organization', 'updated_at'], name='lead_updated_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leadtombstone',
+            index=models.Index(fields=['organization', 'version'], name='tombstone_version_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leadtombstone',
+            index=models.Index(fields=['organization', 'owner', 'version'], name='tombstone_owner_idx'),
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 4.2.17 on 2026-10-19 19:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_user_active_index'),
+        ('leads', '0006_organizations'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeadArchive',
+            fields=[
+                ('pkid', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('activities', models.BinaryField(verbose_name='activities')),
+                ('activity_count', models.PositiveIntegerField(default=0, verbose_name='activity count')),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Lead Archive',
+                'verbose_name_plural': 'Lead Archives',
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_owner_status_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_email_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_version_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_owner_version_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lead',
+            name='lead_updated_at_idx',
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='archived_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='archived at'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('archived_at__isnull', True)), fields=['organization', 'owner', 'status'], name='lead_owner_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('archived_at__isnull', True)), fields=['organization', 'email'], name='lead_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('archived_at__isnull', True)), fields=['organization', 'version'], name='lead_version_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('archived_at__isnull', True)), fields=['organization', 'owner', 'version'], name='lead_owner_version_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('archived_at__isnull', True)), fields=['organization', 'updated_at'], name='lead_updated_at_idx'),
+        ),
+        migrations.AddField(
+            model_name='leadarchive',
+            name='lead',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='archive', to='leads.lead'),
+        ),
+        migrations.AddField(
+            model_name='leadarchive',
+            name='organization',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.17 on 2026-10-19 19:51
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0008_user_active_index'),
+        ('leads', '0007_lead_archives'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Reminder',
+            fields=[
+                ('pkid', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('note', models.CharField(blank=True, max_length=255, verbose_name='note')),
+                ('due_at', models.DateTimeField(verbose_name='due at')),
+                ('channel', models.CharField(choices=[('websocket', 'In App'), ('email', 'Email')], default='websocket', max_length=16, verbose_name='channel')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('cancelled', 'Cancelled')], default='pending', max_length=16, verbose_name='status')),
+                ('sent_at', models.DateTimeField(blank=True, editable=False, null=True, verbose_name='sent at')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('lead', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to='leads.lead')),
+                ('organization', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Reminder',
+                'verbose_name_plural': 'Reminders',
+                'ordering': ['due_at'],
+                'indexes': [models.Index(condition=models.Q(('status', 'pending')), fields=['due_at'], name='reminder_due_idx'), models.Index(fields=['organization', 'user', 'due_at'], name='reminder_user_idx')],
+            },
+        ),
+    ]
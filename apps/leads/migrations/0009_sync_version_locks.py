@@ -0,0 +1,73 @@
+# Generated by Django 4.2.17 on 2026-10-20 02:00
+
+from django.db import migrations
+
+# Take a sync version and mark it in flight until the transaction ends. The guard is
+# held while the version is taken, so a reader never sees it taken but not marked.
+CREATE_NEXT_VERSION = """
+CREATE OR REPLACE FUNCTION leads_next_sync_version() RETURNS bigint LANGUAGE plpgsql AS $$
+DECLARE
+    taken bigint;
+BEGIN
+    PERFORM pg_advisory_lock_shared(1818584164, 1);
+    BEGIN
+        taken := nextval('leads_sync_version_seq');
+        PERFORM pg_advisory_xact_lock(taken);
+    EXCEPTION WHEN OTHERS THEN
+        PERFORM pg_advisory_unlock_shared(1818584164, 1);
+        RAISE;
+    END;
+    PERFORM pg_advisory_unlock_shared(1818584164, 1);
+    RETURN taken;
+END;
+$$;
+"""
+
+# Get the last version below every version still in flight
+CREATE_SETTLED_VERSION = """
+CREATE OR REPLACE FUNCTION leads_settled_sync_version() RETURNS bigint LANGUAGE plpgsql AS $$
+DECLARE
+    taken bigint;
+    in_flight bigint;
+BEGIN
+    PERFORM pg_advisory_lock(1818584164, 1);
+    BEGIN
+        SELECT CASE WHEN is_called THEN last_value ELSE last_value - 1 END
+            INTO taken FROM leads_sync_version_seq;
+        SELECT MIN((classid::bigint << 32) | objid::bigint) INTO in_flight
+            FROM pg_locks
+            WHERE locktype = 'advisory' AND objsubid = 1 AND pid <> pg_backend_pid()
+                AND database = (SELECT oid FROM pg_database WHERE datname = current_database());
+    EXCEPTION WHEN OTHERS THEN
+        PERFORM pg_advisory_unlock(1818584164, 1);
+        RAISE;
+    END;
+    PERFORM pg_advisory_unlock(1818584164, 1);
+    RETURN LEAST(taken, in_flight - 1);
+END;
+$$;
+"""
+
+
+def create_functions(apps, schema_editor):
+    # Only Postgres runs writes concurrently, the other databases serialize them
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_NEXT_VERSION)
+        schema_editor.execute(CREATE_SETTLED_VERSION)
+
+
+def drop_functions(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP FUNCTION IF EXISTS leads_settled_sync_version()')
+        schema_editor.execute('DROP FUNCTION IF EXISTS leads_next_sync_version()')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0008_reminders'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_functions, drop_functions),
+    ]
@@ -0,0 +1,789 @@
+# Imports
+import uuid
+
+from django.conf import settings
+from django.db import connections, models, router, transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import TenantModel
+from apps.core.tenancy import TenantManager
+from apps.leads.constants import (
+    ACTIVITY_KINDS,
+    ATTACHMENT_KINDS,
+    LEAD_STATUSES,
+    REMINDER_CHANNELS,
+    REMINDER_STATUSES,
+    UPLOAD_STATUSES,
+)
+from apps.leads.managers import (
+    ActivityQuerySet,
+    BlobQuerySet,
+    LeadManager,
+    LeadQuerySet,
+    LeadTombstoneQuerySet,
+    ReminderQuerySet,
+)
+from apps.leads.previews import PREVIEW_FORMAT
+from config.storage.media import BlobStorage
+
+# Sequence numbering the lead changes and deletions for the sync API
+SYNC_VERSION_SEQUENCE = "leads_sync_version_seq"
+
+
+# Function to get the next sync version
+def next_version(using: str) -> int:
+    """Get the next number of the lead change sequence.
+
+    Every saved lead and every tombstone takes a number from one PostgreSQL
+    sequence, so clients sync everything after the last number they saw. The
+    number stays marked in flight until the transaction of the write ends, so
+    it must be taken inside that transaction. Other databases serialize their
+    writes, so the number follows the largest one in use.
+
+    Args:
+        using (str): The database alias.
+
+    Returns:
+        int: The version.
+    """
+
+    # If the database has sequences
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT leads_next_sync_version()")
+            return cursor.fetchone()[0]
+
+    # Return the version after the largest one in use
+    versions = [
+        model._base_manager.using(using).aggregate(version=Max("version"))["version"]
+        or 0
+        for model in (Lead, LeadTombstone)
+    ]
+    return max(versions) + 1
+
+
+# Function to get the last settled sync version
+def settled_version(using: str) -> int | None:
+    """Get the last number of the lead change sequence below every open write.
+
+    The numbers are taken in order but commit in any order. Every number up to
+    the one returned is committed or rolled back, so a sync cursor stopping
+    there never skips a change that commits later.
+
+    Args:
+        using (str): The database alias.
+
+    Returns:
+        int | None: The version, or None if the database does not track the
+            numbers in flight.
+    """
+
+    # If the database does not track the numbers in flight
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return None
+
+    # Return the number below the first one in flight
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT leads_settled_sync_version()")
+        return cursor.fetchone()[0] or 0
+
+
+# Lead Model
+class Lead(TenantModel):
+    """Lead Model
+
+    Lead model for the application.
+
+    Inherits:
+        TenantModel
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the lead.
+        id (models.UUIDField): The UUID of the lead.
+        owner (models.ForeignKey): The user owning the lead.
+        first_name (models.CharField): The first name of the lead.
+        last_name (models.CharField): The last name of the lead.
+        email (models.EmailField): The email of the lead.
+        phone (models.CharField): The phone number of the lead.
+        company (models.CharField): The company of the lead.
+        status (models.CharField): The status of the lead.
+        version (models.BigIntegerField): The sync version of the last change.
+        archived_at (models.DateTimeField): The date the lead was archived, if archived.
+        created_at (models.DateTimeField): The created date of the lead.
+        updated_at (models.DateTimeField): The updated date of the lead.
+
+    Managers:
+        objects (LeadManager): The active leads of the current organization.
+        all_objects (LeadQuerySet): The active and archived leads.
+
+    Meta:
+        verbose_name (str): The verbose name of the lead.
+        verbose_name_plural (str): The verbose name of the lead in plural.
+        ordering (list[str]): The ordering of the lead.
+
+    Properties:
+        full_name (str): The full name of the lead.
+
+    Methods:
+        from_db: Remember the owner the lead was loaded with.
+        save: Version the change, and leave a tombstone for a previous owner.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="leads",
+    )
+    first_name = models.CharField(_("first name"), max_length=64, blank=True)
+    last_name = models.CharField(_("last name"), max_length=64, blank=True)
+    email = models.EmailField(_("email address"), blank=True)
+    phone = models.CharField(_("phone"), max_length=32, blank=True)
+    company = models.CharField(_("company"), max_length=128, blank=True)
+    status = models.CharField(
+        _("status"),
+        max_length=24,
+        choices=LEAD_STATUSES,
+        default=LEAD_STATUSES[0][0],
+    )
+    version = models.BigIntegerField(_("version"), default=0, editable=False)
+    archived_at = models.DateTimeField(
+        _("archived at"), null=True, blank=True, editable=False
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Set object managers
+    objects = LeadManager()
+    all_objects = TenantManager.from_queryset(LeadQuerySet)()
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Lead")
+        verbose_name_plural = _("Leads")
+        ordering = ["-created_at"]
+
+        # The indexes cover the active leads only
+        indexes = [
+            models.Index(
+                fields=["organization", "owner", "status"],
+                condition=Q(archived_at__isnull=True),
+                name="lead_owner_status_idx",
+            ),
+            models.Index(
+                fields=["organization", "email"],
+                condition=Q(archived_at__isnull=True),
+                name="lead_email_idx",
+            ),
+            models.Index(
+                fields=["organization", "version"],
+                condition=Q(archived_at__isnull=True),
+                name="lead_version_idx",
+            ),
+            models.Index(
+                fields=["organization", "owner", "version"],
+                condition=Q(archived_at__isnull=True),
+                name="lead_owner_version_idx",
+            ),
+            models.Index(
+                fields=["organization", "updated_at"],
+                condition=Q(archived_at__isnull=True),
+                name="lead_updated_at_idx",
+            ),
+        ]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return self.full_name or self.email or str(self.id)
+
+    # Method to create an instance from the database
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # Remember the owner the lead was loaded with
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_owner_id = instance.__dict__.get("owner_id")
+        return instance
+
+    # Method to save the lead
+    def save(self, *args, **kwargs):
+        """Save the lead under the next sync version.
+
+        A lead taken away from its owner leaves a tombstone, so the offline
+        copy of the previous owner drops it. QuerySet.update() bypasses this
+        and must set the version itself.
+        """
+
+        # Get the database of the write
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+
+        with transaction.atomic(using=using):
+            # If the lead is taken away from its owner
+            previous_owner_id = getattr(self, "_loaded_owner_id", None)
+            if previous_owner_id is not None and previous_owner_id != self.owner_id:
+                LeadTombstone.objects.using(using).create(
+                    lead_uuid=self.id,
+                    organization_id=self.organization_id,
+                    owner_id=previous_owner_id,
+                    version=next_version(using),
+                )
+
+            # Version the change, also when only some fields are saved
+            self.version = next_version(using)
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {
+                    *kwargs["update_fields"],
+                    "version",
+                    "updated_at",
+                }
+
+            # Save the lead
+            super().save(*args, **kwargs)
+
+        # Remember the saved owner
+        self._loaded_owner_id = self.owner_id
+
+    # Property to get the full name
+    @property
+    def full_name(self) -> str:
+        """Get the full name of the lead.
+
+        Returns:
+            str: The full name of the lead.
+        """
+        return f"{self.first_name} {self.last_name}".strip()
+
+
+# Lead Tombstone Model
+class LeadTombstone(TenantModel):
+    """Lead Tombstone Model
+
+    Lead tombstone model for a lead deleted or taken away from its owner,
+    kept so the offline copies of the sync API drop it.
+
+    Inherits:
+        TenantModel
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the tombstone.
+        lead_uuid (models.UUIDField): The UUID of the lead.
+        owner (models.ForeignKey): The owner who lost the lead.
+        version (models.BigIntegerField): The sync version of the removal.
+        deleted_at (models.DateTimeField): The date the lead was removed.
+
+    Managers:
+        objects (LeadTombstoneQuerySet): The tombstones of the current organization.
+
+    Meta:
+        verbose_name (str): The verbose name of the tombstone.
+        verbose_name_plural (str): The verbose name of the tombstone in plural.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    lead_uuid = models.UUIDField(_("lead UUID"))
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    version = models.BigIntegerField(_("version"))
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    # Set object manager
+    objects = TenantManager.from_queryset(LeadTombstoneQuerySet)()
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Lead Tombstone")
+        verbose_name_plural = _("Lead Tombstones")
+
+        indexes = [
+            models.Index(
+                fields=["organization", "version"], name="tombstone_version_idx"
+            ),
+            models.Index(
+                fields=["organization", "owner", "version"], name="tombstone_owner_idx"
+            ),
+            models.Index(fields=["deleted_at"], name="tombstone_deleted_at_idx"),
+        ]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return str(self.lead_uuid)
+
+
+# Activity Model
+class Activity(TenantModel):
+    """Activity Model
+
+    Activity model for the calls, emails, meetings and notes logged on a lead.
+
+    Inherits:
+        TenantModel
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the activity.
+        id (models.UUIDField): The UUID of the activity.
+        lead (models.ForeignKey): The lead of the activity.
+        user (models.ForeignKey): The user who logged the activity.
+        kind (models.CharField): The kind of the activity.
+        subject (models.CharField): The subject of the activity.
+        note (models.TextField): The note of the activity.
+        occurred_at (models.DateTimeField): The date the activity took place.
+        created_at (models.DateTimeField): The created date of the activity.
+        updated_at (models.DateTimeField): The updated date of the activity.
+
+    Managers:
+        objects (ActivityQuerySet): The activities of the current organization.
+
+    Meta:
+        verbose_name (str): The verbose name of the activity.
+        verbose_name_plural (str): The verbose name of the activity in plural.
+        ordering (list[str]): The ordering of the activity.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    lead = models.ForeignKey(Lead, on_delete=models.CASCADE, related_name="activities")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="activities",
+    )
+    kind = models.CharField(
+        _("kind"),
+        max_length=24,
+        choices=ACTIVITY_KINDS,
+        default=ACTIVITY_KINDS[0][0],
+    )
+    subject = models.CharField(_("subject"), max_length=255, blank=True)
+    note = models.TextField(_("note"), blank=True)
+    occurred_at = models.DateTimeField(_("occurred at"), default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Take the organization from the lead
+    tenant_parent = "lead"
+
+    # Set object manager
+    objects = TenantManager.from_queryset(ActivityQuerySet)()
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Activity")
+        verbose_name_plural = _("Activities")
+        ordering = ["-occurred_at"]
+
+        indexes = [
+            models.Index(
+                fields=["organization", "lead", "occurred_at"], name="activity_lead_idx"
+            ),
+        ]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return self.subject or self.get_kind_display()
+
+
+# Lead Archive Model
+class LeadArchive(TenantModel):
+    """Lead Archive Model
+
+    Lead archive model for the activities of an archived lead, moved out of
+    the activity table as one compressed JSON document. Restoring the lead
+    moves them back.
+
+    Inherits:
+        TenantModel
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the archive.
+        lead (models.OneToOneField): The archived lead.
+        activities (models.BinaryField): The activities, as zlib compressed JSON.
+        activity_count (models.PositiveIntegerField): The number of activities.
+        archived_at (models.DateTimeField): The date the lead was archived.
+
+    Meta:
+        verbose_name (str): The verbose name of the archive.
+        verbose_name_plural (str): The verbose name of the archive in plural.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    lead = models.OneToOneField(Lead, on_delete=models.CASCADE, related_name="archive")
+    activities = models.BinaryField(_("activities"))
+    activity_count = models.PositiveIntegerField(_("activity count"), default=0)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    # Take the organization from the lead
+    tenant_parent = "lead"
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Lead Archive")
+        verbose_name_plural = _("Lead Archives")
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return str(self.lead_id)
+
+
+# Reminder Model
+class Reminder(TenantModel):
+    """Reminder Model
+
+    Reminder model for the follow-ups a user schedules on a lead. The
+    database holds every reminder, the scheduler keeps the ones due in the
+    next hours in Redis (see apps.leads.reminders).
+
+    Inherits:
+        TenantModel
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the reminder.
+        id (models.UUIDField): The UUID of the reminder.
+        lead (models.ForeignKey): The lead to follow up.
+        user (models.ForeignKey): The user to remind.
+        note (models.CharField): The note of the reminder.
+        due_at (models.DateTimeField): The date the reminder is due.
+        channel (models.CharField): The channel the reminder is delivered by.
+        status (models.CharField): The status of the reminder.
+        sent_at (models.DateTimeField): The date the reminder was sent.
+        created_at (models.DateTimeField): The created date of the reminder.
+        updated_at (models.DateTimeField): The updated date of the reminder.
+
+    Managers:
+        objects (ReminderQuerySet): The reminders of the current organization.
+
+    Meta:
+        verbose_name (str): The verbose name of the reminder.
+        verbose_name_plural (str): The verbose name of the reminder in plural.
+        ordering (list[str]): The ordering of the reminder.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    lead = models.ForeignKey(Lead, on_delete=models.CASCADE, related_name="reminders")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="reminders"
+    )
+    note = models.CharField(_("note"), max_length=255, blank=True)
+    due_at = models.DateTimeField(_("due at"))
+    channel = models.CharField(
+        _("channel"),
+        max_length=16,
+        choices=REMINDER_CHANNELS,
+        default=REMINDER_CHANNELS[0][0],
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=16,
+        choices=REMINDER_STATUSES,
+        default=REMINDER_STATUSES[0][0],
+    )
+    sent_at = models.DateTimeField(_("sent at"), null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Take the organization from the lead
+    tenant_parent = "lead"
+
+    # Set object manager
+    objects = TenantManager.from_queryset(ReminderQuerySet)()
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Reminder")
+        verbose_name_plural = _("Reminders")
+        ordering = ["due_at"]
+
+        # The scheduler loads the pending reminders of every organization by due date
+        indexes = [
+            models.Index(
+                fields=["due_at"],
+                name="reminder_due_idx",
+                condition=Q(status="pending"),
+            ),
+            models.Index(
+                fields=["organization", "user", "due_at"], name="reminder_user_idx"
+            ),
+        ]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return self.note or str(self.id)
+
+
+# Function to build the storage name of a preview
+def preview_name(file_name: str, digest: str, name: str) -> str:
+    """Build the storage name of a preview, next to the original.
+
+    Args:
+        file_name (str): The storage name of the original.
+        digest (str): The SHA-256 of the original.
+        name (str): The name of the preview.
+
+    Returns:
+        str: The storage name of the preview.
+    """
+
+    # Get the folder of the original
+    folder = file_name.rsplit("/", 1)[0]
+
+    # Return the name of the preview
+    return f"{folder}/previews/{digest}-{name}.{PREVIEW_FORMAT}"
+
+
+# Function to get the storage of the blobs
+def get_blob_storage() -> BlobStorage:
+    """Get the content addressed storage of the blobs.
+
+    Returns:
+        BlobStorage: The storage.
+    """
+    return BlobStorage()
+
+
+# Blob Model
+class Blob(models.Model):
+    """Blob Model
+
+    Blob model for the content stored once under its SHA-256 and shared by
+    every attachment with the same content.
+
+    Inherits:
+        models.Model
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the blob.
+        sha256 (models.CharField): The SHA-256 of the content.
+        file (models.FileField): The content in the blob storage.
+        size (models.BigIntegerField): The size of the content in bytes.
+        content_type (models.CharField): The content type of the content.
+        ref_count (models.PositiveIntegerField): The number of attachments using it.
+        created_at (models.DateTimeField): The created date of the blob.
+        updated_at (models.DateTimeField): The date the references last changed.
+
+    Managers:
+        objects (BlobQuerySet): The object manager of the blob.
+
+    Meta:
+        verbose_name (str): The verbose name of the blob.
+        verbose_name_plural (str): The verbose name of the blob in plural.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    sha256 = models.CharField(_("SHA-256"), max_length=64, unique=True)
+    file = models.FileField(_("file"), storage=get_blob_storage, max_length=512)
+    size = models.BigIntegerField(_("size"))
+    content_type = models.CharField(_("content type"), max_length=128)
+    ref_count = models.PositiveIntegerField(_("reference count"), default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Set object manager
+    objects = BlobQuerySet.as_manager()
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Blob")
+        verbose_name_plural = _("Blobs")
+
+        indexes = [
+            models.Index(fields=["ref_count", "updated_at"], name="blob_orphan_idx"),
+        ]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return self.sha256
+
+
+# Function to build the storage name of an attachment
+def attachment_upload_to(instance: "Attachment", filename: str) -> str:
+    """Build the storage name of an attachment.
+
+    Args:
+        instance (Attachment): The attachment.
+        filename (str): The original file name.
+
+    Returns:
+        str: The storage name, relative to the media location.
+    """
+
+    # Group the uploads by kind and keep every upload in its own folder
+    folder = "imports" if instance.kind == "import" else "attachments"
+    return f"{folder}/{instance.id}/{get_valid_filename(filename)}"
+
+
+# Attachment Model
+class Attachment(TenantModel):
+    """Attachment Model
+
+    Attachment model for the files uploaded straight from the browser to the bucket.
+
+    Inherits:
+        TenantModel
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the attachment.
+        id (models.UUIDField): The UUID of the attachment.
+        lead (models.ForeignKey): The lead of the attachment, empty for imports.
+        blob (models.ForeignKey): The stored content, set once the upload is hashed.
+        uploaded_by (models.ForeignKey): The user uploading the file.
+        kind (models.CharField): The kind of the file.
+        file (models.FileField): The file in the media storage.
+        original_name (models.CharField): The name of the file on the client.
+        content_type (models.CharField): The content type of the file.
+        size (models.BigIntegerField): The size of the file in bytes.
+        upload_id (models.CharField): The id of the multipart upload.
+        status (models.CharField): The status of the upload.
+        content_sha256 (models.CharField): The SHA-256 the previews were rendered from.
+        thumbnail (models.FileField): The thumbnail for list views.
+        preview (models.FileField): The first page preview for detail views.
+        created_at (models.DateTimeField): The created date of the attachment.
+        completed_at (models.DateTimeField): The date the upload completed.
+
+    Meta:
+        verbose_name (str): The verbose name of the attachment.
+        verbose_name_plural (str): The verbose name of the attachment in plural.
+        ordering (list[str]): The ordering of the attachment.
+
+    Properties:
+        is_multipart (bool): Whether the file is uploaded in parts.
+        thumbnail_url (str | None): The URL of the thumbnail.
+        preview_url (str | None): The URL of the preview.
+
+    Methods:
+        get_preview_name(digest, name): Get the storage name of a preview.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    lead = models.ForeignKey(
+        Lead,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="attachments",
+    )
+    blob = models.ForeignKey(
+        Blob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="attachments",
+    )
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="attachments",
+    )
+    kind = models.CharField(
+        _("kind"), max_length=24, choices=ATTACHMENT_KINDS, default="attachment"
+    )
+    file = models.FileField(_("file"), upload_to=attachment_upload_to, max_length=512)
+    original_name = models.CharField(_("original name"), max_length=255)
+    content_type = models.CharField(_("content type"), max_length=128)
+    size = models.BigIntegerField(_("size"))
+    upload_id = models.CharField(_("upload id"), max_length=255, blank=True)
+    status = models.CharField(
+        _("status"), max_length=24, choices=UPLOAD_STATUSES, default="pending"
+    )
+    content_sha256 = models.CharField(_("content SHA-256"), max_length=64, blank=True)
+    thumbnail = models.FileField(_("thumbnail"), max_length=512, blank=True)
+    preview = models.FileField(_("preview"), max_length=512, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    # Take the organization from the lead
+    tenant_parent = "lead"
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Attachment")
+        verbose_name_plural = _("Attachments")
+        ordering = ["-created_at"]
+
+        indexes = [
+            models.Index(
+                fields=["organization", "lead", "status"],
+                name="attachment_lead_status_idx",
+            ),
+        ]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return self.original_name
+
+    # Property to check if the file is uploaded in parts
+    @property
+    def is_multipart(self) -> bool:
+        """Check if the file is uploaded in parts.
+
+        Returns:
+            bool: True if the upload is a multipart upload.
+        """
+        return bool(self.upload_id)
+
+    # Property to get the URL of the thumbnail
+    @property
+    def thumbnail_url(self) -> str | None:
+        """Get the URL of the thumbnail, list views never load the original.
+
+        Returns:
+            str | None: The URL, or None until the thumbnail is rendered.
+        """
+        return self.thumbnail.url if self.thumbnail else None
+
+    # Property to get the URL of the preview
+    @property
+    def preview_url(self) -> str | None:
+        """Get the URL of the first page preview.
+
+        Returns:
+            str | None: The URL, or None until the preview is rendered.
+        """
+        return self.preview.url if self.preview else None
+
+    # Method to get the storage name of a preview
+    def get_preview_name(self, digest: str, name: str) -> str:
+        """Get the storage name of a preview, next to the original.
+
+        The name contains the content hash, so the previews of a file are
+        rendered once and re-rendered only when the content changes.
+
+        Args:
+            digest (str): The SHA-256 of the original.
+            name (str): The name of the preview.
+
+        Returns:
+            str: The storage name of the preview.
+        """
+
+        # Return the name of the preview
+        return preview_name(self.file.name, digest, name)
@@ -0,0 +1,104 @@
+# Imports
+import io
+
+from PIL import Image, ImageOps
+
+# pypdfium2 is optional, without it PDFs get no previews
+try:
+    import pypdfium2
+except ImportError:  # pragma: no cover
+    pypdfium2 = None
+
+# Format of the rendered previews
+PREVIEW_FORMAT = "webp"
+PREVIEW_CONTENT_TYPE = "image/webp"
+
+# Largest image decoded, guards the workers against decompression bombs
+MAX_IMAGE_PIXELS = 64 * 1024 * 1024
+
+
+# Function to check if a file can be previewed
+def can_preview(content_type: str) -> bool:
+    """Check if previews can be rendered for a content type.
+
+    Args:
+        content_type (str): The content type of the file.
+
+    Returns:
+        bool: True if the file is an image, or a PDF with pypdfium2 installed.
+    """
+
+    # Return the previewable status
+    if content_type == "application/pdf":
+        return pypdfium2 is not None
+    return content_type.startswith("image/") and content_type != "image/svg+xml"
+
+
+# Function to open the first page of a file as an image
+def open_first_page(data: bytes, content_type: str, size: tuple[int, int]):
+    """Open an image, or the first page of a PDF rendered to fit size.
+
+    Args:
+        data (bytes): The content of the file.
+        content_type (str): The content type of the file.
+        size (tuple[int, int]): The largest size needed.
+
+    Returns:
+        Image.Image: The image.
+    """
+
+    # If the file is a PDF
+    if content_type == "application/pdf":
+        # Render the first page just large enough for the preview
+        document = pypdfium2.PdfDocument(data)
+        try:
+            page = document[0]
+            width, height = page.get_size()
+            scale = min(size[0] / width, size[1] / height, 4)
+            return page.render(scale=scale).to_pil()
+        finally:
+            document.close()
+
+    # Open the image, honouring the camera orientation of photos
+    Image.MAX_IMAGE_PIXELS = MAX_IMAGE_PIXELS
+    image = Image.open(io.BytesIO(data))
+    image.draft("RGB", size)
+    return ImageOps.exif_transpose(image)
+
+
+# Function to render the previews of a file
+def render_previews(
+    data: bytes, content_type: str, sizes: dict[str, tuple[int, int]]
+) -> dict[str, bytes]:
+    """Render the previews of a file.
+
+    Args:
+        data (bytes): The content of the file.
+        content_type (str): The content type of the file.
+        sizes (dict[str, tuple[int, int]]): The bounding box of every preview.
+
+    Returns:
+        dict[str, bytes]: The encoded previews by name.
+    """
+
+    # Open the first page at the largest size needed
+    largest = (max(w for w, _ in sizes.values()), max(h for _, h in sizes.values()))
+    image = open_first_page(data, content_type, largest)
+
+    # Flatten transparency and palettes
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+    # Traverse through the previews, largest first so smaller ones resize less
+    previews = {}
+    for name, size in sorted(sizes.items(), key=lambda item: -item[1][0]):
+        # Shrink the image in place to fit the preview, never enlarge it
+        image.thumbnail(size, Image.Resampling.LANCZOS)
+
+        # Encode the preview
+        buffer = io.BytesIO()
+        image.save(buffer, PREVIEW_FORMAT, quality=80, method=4)
+        previews[name] = buffer.getvalue()
+
+    # Return the previews
+    return previews
@@ -0,0 +1,282 @@
+# Imports
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from apps.core.emails import build_email
+from apps.core.push import is_user_connected
+from apps.core.tenancy import tenant_aliases
+from apps.leads.models import Reminder
+from apps.notifications.events import notify
+
+# Lua script claiming the due reminders, so every reminder is popped by one worker.
+# KEYS: due set, claimed set. ARGV: now, batch size, claim expiry.
+POP_DUE = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, member in ipairs(due) do
+    redis.call('ZADD', KEYS[2], ARGV[3], member)
+end
+if #due > 0 then
+    redis.call('ZREM', KEYS[1], unpack(due))
+end
+return due
+"""
+
+# Lua script moving the expired claims of lost workers back to the due reminders.
+# KEYS: due set, claimed set. ARGV: now, batch size.
+RELEASE_EXPIRED = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, member in ipairs(expired) do
+    redis.call('ZADD', KEYS[1], ARGV[1], member)
+end
+if #expired > 0 then
+    redis.call('ZREM', KEYS[2], unpack(expired))
+end
+return #expired
+"""
+
+
+# Reminder Scheduler
+class ReminderScheduler:
+    """Reminder Scheduler
+
+    Timer wheel of the reminders due in the next REMINDERS_WINDOW seconds,
+    kept in a Redis sorted set scored by due date. The loader fills it from
+    the partial index on the due date, saved reminders due within the window
+    join it once committed, and the dispatcher pops the due ones in batches,
+    so no query runs while nothing is due.
+
+    Popped reminders are claimed for REMINDERS_CLAIM_TIMEOUT seconds, the
+    claims of a lost worker go back to the due reminders. The database stays
+    the source of truth: a reminder is sent by the transaction turning it
+    from pending to sent, before it commits, and a lost sorted set is loaded
+    again. A failed send keeps the claims, so the reminders are sent again
+    once they expire.
+
+    Attributes:
+        client (Redis): The Redis client.
+        window (int): The seconds of due reminders kept in Redis.
+
+    Methods:
+        member(using, pkid): Get the member of a reminder.
+        schedule(using, pkid, due_at): Add a reminder due within the window.
+        is_loaded(): Check if the window is loaded.
+        load(): Load the reminders due within the window.
+        pop(batch_size): Claim the due reminders.
+        ack(members): Release the claims of handled reminders.
+    """
+
+    # Keys of the due and claimed reminders, and of the loaded marker
+    DUE_KEY = "leads:reminders:due"
+    CLAIMED_KEY = "leads:reminders:claimed"
+    LOADED_KEY = "leads:reminders:loaded"
+
+    # Constructor
+    def __init__(self, client=None, window: int | None = None):
+        # Set the attributes
+        self.client = client or get_redis_connection("default")
+        self.window = window or settings.REMINDERS_WINDOW
+        self.pop_due = self.client.register_script(POP_DUE)
+        self.release_expired = self.client.register_script(RELEASE_EXPIRED)
+
+    # Method to get the member of a reminder
+    @staticmethod
+    def member(using: str, pkid: int) -> str:
+        return f"{using}:{pkid}"
+
+    # Method to add a reminder due within the window
+    def schedule(self, using: str, pkid: int, due_at: datetime | None):
+        """Add a reminder to the sorted set if it is due within the window.
+
+        Args:
+            using (str): The database of the reminder.
+            pkid (int): The primary key of the reminder.
+            due_at (datetime | None): The due date, None if no longer pending.
+        """
+
+        # If the reminder is due within the window, add or move it
+        member = self.member(using, pkid)
+        if due_at is not None and due_at.timestamp() <= time.time() + self.window:
+            self.client.zadd(self.DUE_KEY, {member: due_at.timestamp()})
+
+        # Otherwise drop it, the loader adds it once due within the window
+        else:
+            self.client.zrem(self.DUE_KEY, member)
+
+    # Method to check if the window is loaded
+    def is_loaded(self) -> bool:
+        # The marker expires if the loader stops and is lost with the sorted set
+        return bool(self.client.exists(self.LOADED_KEY))
+
+    # Method to load the reminders due within the window
+    def load(self) -> int:
+        """Load the pending reminders due within the window, overdue ones included.
+
+        Returns:
+            int: The number of loaded reminders.
+        """
+
+        # Traverse through the shared schema and the tenant schemas
+        loaded = 0
+        until = timezone.now() + timedelta(seconds=self.window)
+        for alias in [DEFAULT_DB_ALIAS, *tenant_aliases()]:
+            # Get the reminders due within the window
+            reminders = (
+                Reminder.objects.using(alias)
+                .due_before(until)
+                .values_list("pkid", "due_at")
+                .iterator(chunk_size=settings.REMINDERS_BATCH_SIZE)
+            )
+
+            # Add them to the sorted set in batches
+            scores = {}
+            for pkid, due_at in reminders:
+                scores[self.member(alias, pkid)] = due_at.timestamp()
+                if len(scores) >= settings.REMINDERS_BATCH_SIZE:
+                    loaded += self.client.zadd(self.DUE_KEY, scores)
+                    scores = {}
+            if scores:
+                loaded += self.client.zadd(self.DUE_KEY, scores)
+
+        # Mark the window loaded until the next load is overdue
+        self.client.set(self.LOADED_KEY, 1, ex=settings.REMINDERS_LOAD_INTERVAL * 2)
+
+        # Return the number of newly loaded reminders
+        return loaded
+
+    # Method to claim the due reminders
+    def pop(self, batch_size: int) -> list[str]:
+        """Claim a batch of due reminders.
+
+        Args:
+            batch_size (int): The largest number of reminders.
+
+        Returns:
+            list[str]: The members of the claimed reminders.
+        """
+
+        # Release the expired claims, then claim the due reminders
+        now = time.time()
+        keys = [self.DUE_KEY, self.CLAIMED_KEY]
+        self.release_expired(keys=keys, args=[now, batch_size])
+        members = self.pop_due(
+            keys=keys,
+            args=[now, batch_size, now + settings.REMINDERS_CLAIM_TIMEOUT],
+        )
+
+        # Return the members
+        return [member.decode() for member in members]
+
+    # Method to release the claims of handled reminders
+    def ack(self, members: list[str]):
+        # Release the claims
+        if members:
+            self.client.zrem(self.CLAIMED_KEY, *members)
+
+
+# Function to send reminders
+def send_reminders(reminders: list[Reminder]):
+    """Notify the users of their reminders in the app, or email them.
+
+    In app reminders become notifications, pushed to the open pages of their
+    users. Users without an open page are emailed right away as well.
+
+    Args:
+        reminders (list[Reminder]): The reminders, with their leads and users.
+    """
+
+    # Traverse through the reminders
+    emails = []
+    for reminder in reminders:
+        # If the reminder is in app, notify the user
+        connected = False
+        if reminder.channel == "websocket":
+            connected = is_user_connected(reminder.user_id)
+            notify(
+                reminder.user_id,
+                "reminder",
+                f"reminder:{reminder.pkid}",
+                reminder.organization_id,
+                lead=reminder.lead,
+                detail=reminder.note,
+                emailed=not connected,
+                using=reminder._state.db,
+            )
+
+        # If the user is not in the app, email the reminder
+        if not connected:
+            emails.append(
+                build_email(
+                    f"Reminder: {reminder.lead}",
+                    "leads/emails/reminder_email",
+                    {
+                        "user": reminder.user,
+                        "lead": reminder.lead,
+                        "reminder": reminder,
+                    },
+                    [reminder.user.email],
+                )
+            )
+
+    # Send the emails over one connection
+    if emails:
+        get_connection().send_messages(emails)
+
+
+# Function to deliver claimed reminders
+def deliver_reminders(scheduler: ReminderScheduler, members: list[str]) -> int:
+    """Send the claimed reminders still pending and due, then release them.
+
+    The reminders are marked sent once sent. If sending fails the marks roll
+    back and the claims of the database are kept, so the reminders are popped
+    again once the claims expire.
+
+    Args:
+        scheduler (ReminderScheduler): The scheduler the reminders were claimed from.
+        members (list[str]): The members of the claimed reminders.
+
+    Returns:
+        int: The number of sent reminders.
+    """
+
+    # Group the reminders by database
+    pkids = defaultdict(list)
+    for member in members:
+        alias, pkid = member.rsplit(":", 1)
+        pkids[alias].append(int(pkid))
+
+    # Traverse through the databases
+    sent = 0
+    for alias, batch in pkids.items():
+        now = timezone.now()
+        with transaction.atomic(using=alias):
+            # Lock the reminders still pending, another worker holds the others
+            reminders = list(
+                Reminder.objects.using(alias)
+                .select_for_update(skip_locked=True, of=("self",))
+                .select_related("lead", "user")
+                .filter(pkid__in=batch, status="pending")
+            )
+
+            # Send the due reminders, then mark them sent
+            due = [reminder for reminder in reminders if reminder.due_at <= now]
+            send_reminders(due)
+            Reminder.objects.using(alias).filter(
+                pkid__in=[reminder.pkid for reminder in due]
+            ).update(status="sent", sent_at=now)
+            sent += len(due)
+
+        # Put the reminders moved to a later date back, then release the batch
+        for reminder in reminders:
+            if reminder.due_at > now:
+                scheduler.schedule(alias, reminder.pkid, reminder.due_at)
+        scheduler.ack([scheduler.member(alias, pkid) for pkid in batch])
+
+    # Return the number of sent reminders
+    return sent
@@ -0,0 +1,54 @@
+# Imports
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.leads.models import (
+    Attachment,
+    Blob,
+    Lead,
+    LeadTombstone,
+    Reminder,
+    next_version,
+)
+from apps.leads.reminders import ReminderScheduler
+
+
+# Signal handler to release the blob of a deleted attachment
+@receiver(post_delete, sender=Attachment)
+def release_attachment_blob(sender, instance: Attachment, **kwargs):
+    """Drop the reference of a deleted attachment to its blob."""
+
+    # If the attachment uses a blob
+    if instance.blob_id:
+        Blob.objects.release(instance.blob_id)
+
+
+# Signal handler to leave a tombstone for a deleted lead
+@receiver(post_delete, sender=Lead)
+def create_lead_tombstone(sender, instance: Lead, using: str, **kwargs):
+    """Leave a tombstone so the offline copies of a deleted lead drop it."""
+
+    # Create the tombstone
+    LeadTombstone.objects.using(using).create(
+        lead_uuid=instance.id,
+        organization_id=instance.organization_id,
+        owner_id=instance.owner_id,
+        version=next_version(using),
+    )
+
+
+# Signal handler to schedule a saved reminder
+@receiver(post_save, sender=Reminder)
+def schedule_reminder(sender, instance: Reminder, using: str, **kwargs):
+    """Add a committed reminder due within the window to the scheduler."""
+
+    # Schedule the pending reminder, or drop it, once committed. If Redis is
+    # down the save still succeeds, the next load picks the reminder up
+    due_at = instance.due_at if instance.status == "pending" else None
+    transaction.on_commit(
+        lambda: ReminderScheduler().schedule(using, instance.pkid, due_at),
+        using=using,
+        robust=True,
+    )
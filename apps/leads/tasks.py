@@ -0,0 +1,352 @@
+# Imports
+import hashlib
+from datetime import timedelta
+
+from botocore.exceptions import BotoCoreError, ClientError
+from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+
+from apps.core.routers import use_primary, use_replicas
+from apps.core.tenancy import tenant_aliases
+from apps.leads.archive import archive_leads
+from apps.leads.models import Attachment, Blob, Lead, LeadTombstone, preview_name
+from apps.leads.previews import PREVIEW_CONTENT_TYPE, can_preview, render_previews
+from apps.leads.reminders import ReminderScheduler, deliver_reminders
+
+# Logger of the tasks
+logger = get_task_logger(__name__)
+
+
+# Function to read an attachment
+def read_file(attachment: Attachment) -> bytes:
+    """Read the content of an attachment.
+
+    Args:
+        attachment (Attachment): The attachment.
+
+    Returns:
+        bytes: The content.
+    """
+
+    # Read the file
+    with attachment.file.open("rb") as file:
+        return file.read()
+
+
+# Task to store an uploaded file under its content hash
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def store_blob(self, attachment_id: int):
+    """Move an uploaded file to the blob of its content.
+
+    The upload is hashed while streaming it from the bucket. A file whose
+    content is stored already only gains a reference to the existing blob,
+    otherwise it is copied inside the bucket. The upload is deleted after.
+
+    Args:
+        attachment_id (int): The primary key of the attachment.
+    """
+
+    # Get the completed attachment without a blob, it was just committed
+    with use_primary():
+        attachment = Attachment.objects.filter(
+            pkid=attachment_id, status="completed", blob__isnull=True
+        ).first()
+
+    # If the attachment is gone or stored already
+    if attachment is None:
+        return
+
+    # Get the storage and the uploaded file
+    storage = attachment.file.storage
+    source = attachment.file.name
+
+    try:
+        # Hash the content
+        digest = hashlib.sha256()
+        for chunk in storage.iter_chunks(source):
+            digest.update(chunk)
+
+        # Reference the blob and point the attachment to it
+        with transaction.atomic():
+            blob = Blob.objects.acquire(
+                digest.hexdigest(),
+                size=attachment.size,
+                content_type=attachment.content_type,
+                source=source,
+            )
+            Attachment.objects.filter(pkid=attachment.pkid).update(
+                blob=blob, file=blob.file.name
+            )
+
+    # If the bucket can not be reached, try again later
+    except (BotoCoreError, ClientError) as error:
+        raise self.retry(exc=error)
+
+    # Delete the upload
+    storage.delete(source)
+
+
+# Task to generate the previews of an attachment
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=30,
+    soft_time_limit=settings.LEADS_PREVIEW_TIMEOUT,
+    time_limit=settings.LEADS_PREVIEW_TIMEOUT + 30,
+)
+def generate_previews(self, attachment_id: int):
+    """Generate the thumbnail and first page preview of an uploaded file.
+
+    The previews are stored next to the original under its SHA-256, so running
+    the task again for the same content, or for another attachment sharing its
+    blob, only links the existing previews. Rendering is CPU bound and runs in
+    the worker process, the media pool runs one process per core.
+
+    Args:
+        attachment_id (int): The primary key of the attachment.
+    """
+
+    # Get the completed attachment, it was just committed
+    with use_primary():
+        attachment = (
+            Attachment.objects.select_related("blob")
+            .filter(pkid=attachment_id, status="completed")
+            .first()
+        )
+
+    # If the attachment is gone or can not be previewed
+    if (
+        attachment is None
+        or not can_preview(attachment.content_type)
+        or attachment.size > settings.LEADS_PREVIEW_MAX_SOURCE_SIZE
+    ):
+        return
+
+    # Get the hash of the content, reading the original only if it is unknown
+    data = None
+    if attachment.blob_id:
+        digest = attachment.blob.sha256
+    else:
+        data = read_file(attachment)
+        digest = hashlib.sha256(data).hexdigest()
+
+    # If the previews of this content are already linked
+    if attachment.content_sha256 == digest and attachment.thumbnail:
+        return
+
+    # Get the storage and the names of the previews
+    storage = attachment.file.storage
+    names = {
+        name: attachment.get_preview_name(digest, name)
+        for name in settings.LEADS_PREVIEW_SIZES
+    }
+
+    # Get the previews that are not stored yet
+    missing = {
+        name: size
+        for name, size in settings.LEADS_PREVIEW_SIZES.items()
+        if not storage.exists(names[name])
+    }
+
+    # If some previews are missing
+    if missing:
+        # Read the original
+        if data is None:
+            data = read_file(attachment)
+
+        # Render the previews
+        try:
+            previews = render_previews(data, attachment.content_type, missing)
+
+        # If rendering takes longer than LEADS_PREVIEW_TIMEOUT, the file would
+        # time out again, so it keeps no previews
+        except SoftTimeLimitExceeded:
+            logger.warning(
+                "Rendering the previews of attachment %s timed out", attachment_id
+            )
+            return
+
+        # If the file can not be decoded, there is nothing to retry
+        except (OSError, ValueError):
+            logger.info("Attachment %s can not be previewed", attachment_id)
+            return
+
+        # Store the previews next to the original
+        for name, content in previews.items():
+            preview = ContentFile(content)
+            preview.content_type = PREVIEW_CONTENT_TYPE
+            storage.save(names[name], preview)
+
+    # Link the previews to the attachment
+    Attachment.objects.filter(pkid=attachment.pkid).update(
+        content_sha256=digest,
+        thumbnail=names.get("thumbnail", ""),
+        preview=names.get("preview", ""),
+    )
+
+
+# Task to purge the orphaned blobs
+@shared_task(
+    soft_time_limit=settings.BULK_TASK_TIME_LIMIT,
+    time_limit=settings.BULK_TASK_TIME_LIMIT + 60,
+)
+def purge_orphaned_blobs(batch_size: int = 500) -> int:
+    """Delete the blobs, and their previews, no attachment uses anymore.
+
+    Args:
+        batch_size (int): The maximum number of blobs to purge.
+
+    Returns:
+        int: The number of purged blobs.
+    """
+
+    # Get the orphaned blobs, each is checked again on the primary before it is purged
+    grace = settings.LEADS_BLOB_PURGE_GRACE
+    with use_replicas():
+        pks = list(
+            Blob.objects.orphaned(grace).values_list("pk", flat=True)[:batch_size]
+        )
+
+    # Traverse through the orphaned blobs
+    purged = 0
+    for pk in pks:
+        with transaction.atomic():
+            # Lock the blob if it is still orphaned
+            blob = (
+                Blob.objects.orphaned(grace)
+                .select_for_update(skip_locked=True, of=("self",))
+                .filter(pk=pk)
+                .first()
+            )
+
+            # If the blob was referenced again
+            if blob is None:
+                continue
+
+            # Delete the content and the previews
+            storage = blob.file.storage
+            storage.delete(blob.file.name)
+            for name in settings.LEADS_PREVIEW_SIZES:
+                storage.delete(preview_name(blob.file.name, blob.sha256, name))
+
+            # Delete the blob
+            blob.delete()
+            purged += 1
+
+    # Return the number of purged blobs
+    return purged
+
+
+# Task to purge the expired lead tombstones
+@shared_task(
+    soft_time_limit=settings.BULK_TASK_TIME_LIMIT,
+    time_limit=settings.BULK_TASK_TIME_LIMIT + 60,
+)
+def purge_lead_tombstones() -> int:
+    """Delete the lead tombstones older than any sync cursor still accepted.
+
+    Returns:
+        int: The number of purged tombstones.
+    """
+
+    # Keep a day more than the cursors live, tombstones settle before they are synced
+    expired = timezone.now() - timedelta(
+        seconds=settings.LEADS_SYNC_CURSOR_MAX_AGE + 24 * 60 * 60
+    )
+
+    # Delete the expired tombstones of every schema
+    purged = 0
+    for alias in [DEFAULT_DB_ALIAS, *tenant_aliases()]:
+        count, _ = (
+            LeadTombstone.objects.using(alias).filter(deleted_at__lt=expired).delete()
+        )
+        purged += count
+
+    # Return the number of purged tombstones
+    return purged
+
+
+# Task to archive the closed and stale leads
+@shared_task(
+    soft_time_limit=settings.BULK_TASK_TIME_LIMIT,
+    time_limit=settings.BULK_TASK_TIME_LIMIT + 60,
+)
+def archive_stale_leads() -> int:
+    """Archive the won and lost leads and the stale leads of every schema.
+
+    Closed leads untouched for LEADS_ARCHIVE_CLOSED_AFTER seconds and any
+    lead untouched for LEADS_ARCHIVE_STALE_AFTER seconds are archived in
+    batches of LEADS_ARCHIVE_BATCH_SIZE, each in its own transaction.
+
+    Returns:
+        int: The number of archived leads.
+    """
+
+    # Traverse through the shared schema and the tenant schemas
+    archived = 0
+    for alias in [DEFAULT_DB_ALIAS, *tenant_aliases()]:
+        # Get the leads due for the archive
+        leads = Lead.objects.using(alias).archivable(
+            settings.LEADS_ARCHIVE_CLOSED_AFTER, settings.LEADS_ARCHIVE_STALE_AFTER
+        )
+
+        # Archive the leads in batches
+        while True:
+            batch = list(
+                leads.order_by("pkid").values_list("pkid", flat=True)[
+                    : settings.LEADS_ARCHIVE_BATCH_SIZE
+                ]
+            )
+            if not batch:
+                break
+            archived += archive_leads(batch, using=alias)
+
+    # Return the number of archived leads
+    return archived
+
+
+# Task to load the reminders due soon
+@shared_task
+def load_reminders() -> int:
+    """Load the pending reminders due within REMINDERS_WINDOW seconds into Redis.
+
+    Returns:
+        int: The number of newly loaded reminders.
+    """
+
+    # Load the reminders
+    return ReminderScheduler().load()
+
+
+# Task to send the due reminders
+@shared_task
+def dispatch_reminders() -> int:
+    """Send the due reminders, popped from Redis in batches.
+
+    If the reminders are not loaded, e.g. after Redis restarted, they are
+    loaded first.
+
+    Returns:
+        int: The number of sent reminders.
+    """
+
+    # Load the reminders if needed
+    scheduler = ReminderScheduler()
+    if not scheduler.is_loaded():
+        scheduler.load()
+
+    # Send the due reminders in batches, failed ones are retried once their claims expire
+    sent = 0
+    while members := scheduler.pop(settings.REMINDERS_BATCH_SIZE):
+        try:
+            sent += deliver_reminders(scheduler, members)
+        except Exception:
+            logger.exception("Sending %d reminders failed", len(members))
+
+    # Return the number of sent reminders
+    return sent
@@ -0,0 +1,24 @@
+# Imports
+from django.urls import path
+
+from apps.leads.views import (
+    AbortUploadView,
+    CompleteUploadView,
+    CreateUploadView,
+    UploadPartsView,
+)
+
+# Set app name
+app_name = "leads"
+
+# URL Patterns
+urlpatterns = [
+    path("uploads/", CreateUploadView.as_view(), name="upload-create"),
+    path("uploads/<uuid:id>/parts/", UploadPartsView.as_view(), name="upload-parts"),
+    path(
+        "uploads/<uuid:id>/complete/",
+        CompleteUploadView.as_view(),
+        name="upload-complete",
+    ),
+    path("uploads/<uuid:id>/abort/", AbortUploadView.as_view(), name="upload-abort"),
+]
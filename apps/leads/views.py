@@ -0,0 +1,346 @@
+# Imports
+import math
+
+from celery import chain
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
+from django.http import HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.views.generic import View
+
+from apps.core.mixins import ExplicitTransactionMixin
+from apps.leads.forms import UploadForm
+from apps.leads.models import Attachment, Blob, attachment_upload_to
+from apps.leads.tasks import generate_previews, store_blob
+
+# Maximum number of parts of a multipart upload
+MAX_UPLOAD_PARTS = 10000
+
+
+# Function to get the part size of an upload
+def get_part_size(size: int) -> int:
+    """Get the part size of a multipart upload.
+
+    Args:
+        size (int): The size of the file in bytes.
+
+    Returns:
+        int: The part size in bytes.
+    """
+
+    # Grow the parts if the file would need too many of them
+    return max(settings.LEADS_UPLOAD_PART_SIZE, math.ceil(size / MAX_UPLOAD_PARTS))
+
+
+# Base Upload View
+class BaseUploadView(LoginRequiredMixin, ExplicitTransactionMixin, View):
+    """Base view for the uploads of the current user.
+
+    Inherits:
+        LoginRequiredMixin
+        ExplicitTransactionMixin
+        View
+
+    Attributes:
+        raise_exception (bool): Answer anonymous requests with 403.
+
+    Methods:
+        get_attachment: Get a pending upload of the current user.
+        part_urls: Get the upload URLs of the given parts.
+    """
+
+    # Attributes
+    raise_exception = True
+
+    # Method to get a pending upload
+    def get_attachment(self, request, id) -> Attachment:
+        # Return the pending upload or 404
+        return get_object_or_404(
+            Attachment, id=id, uploaded_by=request.user, status="pending"
+        )
+
+    # Method to get the upload URLs of the given parts
+    def part_urls(self, attachment: Attachment, part_numbers) -> list[dict]:
+        # Get the storage of the file
+        storage = attachment.file.storage
+
+        # Return the presigned URLs
+        return [
+            {
+                "part_number": part_number,
+                "url": storage.presigned_part_url(
+                    attachment.file.name,
+                    attachment.upload_id,
+                    part_number,
+                    expire=settings.LEADS_UPLOAD_URL_EXPIRE,
+                ),
+            }
+            for part_number in part_numbers
+        ]
+
+
+# Create Upload View
+class CreateUploadView(BaseUploadView):
+    """Start an upload straight from the browser to the bucket.
+
+    A file whose SHA-256 matches a stored blob is linked to it without an
+    upload. Files up to LEADS_UPLOAD_MULTIPART_THRESHOLD get a presigned POST
+    form, larger files a multipart upload with a presigned URL per part.
+
+    Inherits:
+        BaseUploadView
+
+    Methods:
+        post: Method to handle post request
+    """
+
+    # Method to handle post request
+    def post(self, request):
+        # If the user belongs to no organization, the upload would belong to none
+        if request.user.organization_id is None:
+            return JsonResponse(
+                {"errors": {"__all__": ["You do not belong to an organization."]}},
+                status=403,
+            )
+
+        # Initialize the form
+        form = UploadForm(request.POST, user=request.user)
+
+        # If the form is invalid
+        if not form.is_valid():
+            return JsonResponse({"errors": form.errors}, status=400)
+
+        # Create the pending upload
+        attachment = Attachment(
+            organization_id=request.user.organization_id,
+            lead=form.cleaned_data["lead"],
+            uploaded_by=request.user,
+            kind=form.cleaned_data["kind"],
+            original_name=form.cleaned_data["filename"],
+            content_type=form.cleaned_data["content_type"],
+            size=form.cleaned_data["size"],
+        )
+
+        # If the user uploaded this content before
+        if form.cleaned_data["sha256"]:
+            with transaction.atomic():
+                # Reference the blob of the content
+                blob = Blob.objects.acquire(
+                    form.cleaned_data["sha256"],
+                    size=attachment.size,
+                    uploaded_by=request.user,
+                )
+
+                # If the blob exists
+                if blob is not None:
+                    # Save the completed attachment
+                    attachment.blob = blob
+                    attachment.file.name = blob.file.name
+                    attachment.size = blob.size
+                    attachment.status = "completed"
+                    attachment.completed_at = timezone.now()
+                    attachment.save()
+
+                    # Link the previews of the content once committed
+                    transaction.on_commit(
+                        lambda: generate_previews.delay(attachment.pkid)
+                    )
+
+            # If the attachment was linked, return without an upload
+            if attachment.blob_id:
+                return JsonResponse(
+                    {"id": attachment.id, "method": "existing"}, status=201
+                )
+
+        # Set the storage name of the file
+        attachment.file.name = attachment_upload_to(
+            attachment, form.cleaned_data["filename"]
+        )
+        storage = attachment.file.storage
+
+        # If the file is small enough for a single request
+        if attachment.size <= settings.LEADS_UPLOAD_MULTIPART_THRESHOLD:
+            # Save the upload
+            attachment.save()
+
+            # Return the presigned POST form
+            return JsonResponse(
+                {
+                    "id": attachment.id,
+                    "method": "post",
+                    "post": storage.presigned_post(
+                        attachment.file.name,
+                        attachment.content_type,
+                        settings.LEADS_UPLOAD_MAX_SIZE,
+                        expire=settings.LEADS_UPLOAD_URL_EXPIRE,
+                    ),
+                },
+                status=201,
+            )
+
+        # Start the multipart upload and save it
+        attachment.upload_id = storage.create_multipart_upload(
+            attachment.file.name, attachment.content_type
+        )
+        attachment.save()
+
+        # Get the parts of the file
+        part_size = get_part_size(attachment.size)
+        part_count = math.ceil(attachment.size / part_size)
+
+        # Return the part URLs
+        return JsonResponse(
+            {
+                "id": attachment.id,
+                "method": "multipart",
+                "part_size": part_size,
+                "parts": self.part_urls(attachment, range(1, part_count + 1)),
+            },
+            status=201,
+        )
+
+
+# Upload Parts View
+class UploadPartsView(BaseUploadView):
+    """List the uploaded parts of a multipart upload to resume it.
+
+    Inherits:
+        BaseUploadView
+
+    Methods:
+        get: Method to handle get request
+    """
+
+    # Method to handle get request
+    def get(self, request, id):
+        # Get the upload
+        attachment = self.get_attachment(request, id)
+
+        # If the upload is not a multipart upload
+        if not attachment.is_multipart:
+            return JsonResponse({"error": "Not a multipart upload."}, status=400)
+
+        # Get the parts uploaded so far
+        uploaded = attachment.file.storage.list_parts(
+            attachment.file.name, attachment.upload_id
+        )
+        uploaded_numbers = {part["PartNumber"] for part in uploaded}
+
+        # Get the parts of the file
+        part_size = get_part_size(attachment.size)
+        part_count = math.ceil(attachment.size / part_size)
+        missing = [
+            number
+            for number in range(1, part_count + 1)
+            if number not in uploaded_numbers
+        ]
+
+        # Return the uploaded parts and the URLs of the missing ones
+        return JsonResponse(
+            {
+                "id": attachment.id,
+                "part_size": part_size,
+                "uploaded": sorted(uploaded_numbers),
+                "parts": self.part_urls(attachment, missing),
+            }
+        )
+
+
+# Complete Upload View
+class CompleteUploadView(BaseUploadView):
+    """Register a file once the browser finished uploading it.
+
+    Inherits:
+        BaseUploadView
+
+    Methods:
+        post: Method to handle post request
+    """
+
+    # Method to handle post request
+    def post(self, request, id):
+        # Get the upload
+        attachment = self.get_attachment(request, id)
+        storage = attachment.file.storage
+
+        # If the upload is a multipart upload
+        if attachment.is_multipart:
+            # Assemble the uploaded parts
+            storage.complete_multipart_upload(
+                attachment.file.name, attachment.upload_id
+            )
+
+        # Get the uploaded file
+        head = storage.head(attachment.file.name)
+
+        # If the file was not uploaded
+        if head is None:
+            return JsonResponse({"error": "File not uploaded."}, status=400)
+
+        # If the file is larger than allowed
+        if head["ContentLength"] > settings.LEADS_UPLOAD_MAX_SIZE:
+            # Delete the file and abort the upload
+            storage.delete(attachment.file.name)
+            attachment.status = "aborted"
+            attachment.save(update_fields=["status"])
+
+            # Return the error
+            return JsonResponse({"error": "File is too large."}, status=400)
+
+        # Mark the upload as completed
+        with transaction.atomic():
+            attachment.size = head["ContentLength"]
+            attachment.status = "completed"
+            attachment.completed_at = timezone.now()
+            attachment.save(update_fields=["size", "status", "completed_at"])
+
+            # Store the content by hash and render the previews once committed
+            transaction.on_commit(
+                lambda: chain(
+                    store_blob.si(attachment.pkid),
+                    generate_previews.si(attachment.pkid),
+                ).delay()
+            )
+
+        # Return the file
+        return JsonResponse(
+            {
+                "id": attachment.id,
+                "name": attachment.original_name,
+                "size": attachment.size,
+                "url": attachment.file.url,
+            }
+        )
+
+
+# Abort Upload View
+class AbortUploadView(BaseUploadView):
+    """Abort an upload and drop its uploaded parts.
+
+    Inherits:
+        BaseUploadView
+
+    Methods:
+        post: Method to handle post request
+    """
+
+    # Method to handle post request
+    def post(self, request, id):
+        # Get the upload
+        attachment = self.get_attachment(request, id)
+
+        # If the upload is a multipart upload
+        if attachment.is_multipart:
+            # Drop the uploaded parts
+            attachment.file.storage.abort_multipart_upload(
+                attachment.file.name, attachment.upload_id
+            )
+
+        # Mark the upload as aborted
+        attachment.status = "aborted"
+        attachment.save(update_fields=["status"])
+
+        # Return no content
+        return HttpResponse(status=204)
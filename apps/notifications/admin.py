@@ -0,0 +1,44 @@
+# Imports
+from django.contrib import admin
+
+from apps.notifications.models import Notification
+
+
+# Register the Notification model
+@admin.register(Notification)
+class NotificationAdmin(admin.ModelAdmin):
+    """Notification Admin
+
+    Notification Admin for the Notification model.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        search_fields (list[str]): The list of fields to search.
+        list_filter (list[str]): The list of fields to filter.
+        ordering (list[str]): The list of fields to order by.
+        readonly_fields (list[str]): The list of read only fields.
+    """
+
+    # Set model
+    model = Notification
+
+    # List display
+    list_display = ["id", "user", "kind", "count", "updated_at", "read_at"]
+
+    # Search fields
+    search_fields = ["user__email"]
+
+    # List filter
+    list_filter = ["kind"]
+
+    # Ordering
+    ordering = ["-updated_at"]
+
+    # Set readonly fields
+    readonly_fields = ["id", "group", "count", "created_at", "updated_at", "emailed_at"]
+
+    # Set raw id fields
+    raw_id_fields = ["user", "lead", "actor"]
@@ -0,0 +1,30 @@
+# Imports
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+# NotificationsConfig Class
+class NotificationsConfig(AppConfig):
+    """NotificationsConfig
+
+    NotificationsConfig class is used to configure the notifications app.
+
+    Inherits:
+        AppConfig
+
+    Attributes:
+        name (str): The name of the app.
+        verbose_name (str): The verbose name of the app.
+
+    Methods:
+        ready: Connect the signal handlers notifying the users.
+    """
+
+    # Attributes
+    name = "apps.notifications"
+    verbose_name = _("Notifications")
+
+    # Method to connect the signal handlers
+    def ready(self):
+        # Import the modules that register signal handlers
+        import apps.notifications.signals  # noqa: F401
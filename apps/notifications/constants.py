@@ -0,0 +1,30 @@
+# Imports
+from django.utils.translation import gettext_lazy as _
+
+# Notification Kinds
+NOTIFICATION_KINDS = (
+    ("lead_assigned", _("Lead Assigned")),
+    ("mention", _("Mention")),
+    ("stage_changed", _("Stage Changed")),
+    ("reminder", _("Reminder")),
+)
+
+# Messages of the notification kinds, for one and for coalesced notifications
+NOTIFICATION_MESSAGES = {
+    "lead_assigned": (
+        _("%(actor)s assigned %(lead)s to you"),
+        _("%(count)d leads assigned to you"),
+    ),
+    "mention": (
+        _("%(actor)s mentioned you on %(lead)s"),
+        _("%(count)d mentions on %(lead)s"),
+    ),
+    "stage_changed": (
+        _("%(lead)s moved to %(detail)s"),
+        _("%(lead)s changed stage %(count)d times, now %(detail)s"),
+    ),
+    "reminder": (
+        _("Follow up with %(lead)s"),
+        _("Follow up with %(lead)s"),
+    ),
+}
@@ -0,0 +1,53 @@
+# Imports
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.notifications.models import Notification
+
+# Cache key of the unread count of a user
+UNREAD_COUNT_KEY = "notifications:unread:{}"
+
+
+# Function to get the unread count of a user
+def get_unread_count(user_id: int) -> int:
+    """Get the number of unread notifications of a user.
+
+    The count is a cached counter, moved as notifications are created and
+    read. It is only counted in the database if the cache lost it, and
+    expires after NOTIFICATIONS_UNREAD_TIMEOUT seconds, so a drift heals.
+
+    Args:
+        user_id (int): The primary key of the user.
+
+    Returns:
+        int: The number of unread notifications.
+    """
+
+    # If the counter is cached
+    key = UNREAD_COUNT_KEY.format(user_id)
+    count = cache.get(key)
+    if count is not None:
+        return count
+
+    # Otherwise count the unread notifications, unless a change cached it meanwhile
+    count = Notification.objects.filter(user_id=user_id).unread().count()
+    cache.add(key, count, timeout=settings.NOTIFICATIONS_UNREAD_TIMEOUT)
+
+    # Return the count
+    return count
+
+
+# Function to change the unread count of a user
+def change_unread_count(user_id: int, delta: int):
+    """Move the cached unread count of a user.
+
+    Args:
+        user_id (int): The primary key of the user.
+        delta (int): The number of created, or minus the number of read, notifications.
+    """
+
+    # Move the counter, a counter not cached is counted on its next read
+    try:
+        cache.incr(UNREAD_COUNT_KEY.format(user_id), delta)
+    except ValueError:
+        pass
@@ -0,0 +1,202 @@
+# Imports
+from asgiref.local import Local
+from django.db import IntegrityError, router, transaction
+from django.utils import timezone
+
+from apps.core.push import push_to_user
+from apps.core.tenancy import use_organization
+from apps.notifications.counters import change_unread_count, get_unread_count
+from apps.notifications.models import Notification
+
+# Latest state of the notifications waiting for their transaction to commit, by group
+_pending = Local()
+
+
+# Function to serialize a notification
+def serialize_notification(notification: Notification) -> dict:
+    """Serialize a notification for the websocket and the JSON views.
+
+    Args:
+        notification (Notification): The notification, with its lead and actor.
+
+    Returns:
+        dict: The notification.
+    """
+
+    # Return the notification
+    return {
+        "id": str(notification.id),
+        "kind": notification.kind,
+        "message": notification.get_message(),
+        "detail": notification.detail,
+        "count": notification.count,
+        "lead": str(notification.lead.id) if notification.lead else None,
+        "read": notification.read_at is not None,
+        "updated_at": notification.updated_at.isoformat(),
+    }
+
+
+# Function to push a committed notification
+def push_notification(notification: Notification):
+    """Push a notification to the open pages of its user, with the unread count.
+
+    A burst coalescing into one notification in a transaction pushes once,
+    with its final state.
+
+    Args:
+        notification (Notification): The committed notification.
+    """
+
+    # If a later change of the transaction replaced the notification, it pushes
+    pending = getattr(_pending, "notifications", {})
+    key = (notification.user_id, notification.group)
+    if pending.get(key) is not notification:
+        return
+    del pending[key]
+
+    # Push the notification
+    push_to_user(
+        notification.user_id,
+        {
+            "type": "notification",
+            "notification": serialize_notification(notification),
+            "unread": get_unread_count(notification.user_id),
+        },
+    )
+
+
+# Function to notify a user
+def notify(
+    user_id: int,
+    kind: str,
+    group: str,
+    organization_id: int,
+    lead=None,
+    actor_id: int | None = None,
+    detail: str = "",
+    emailed: bool = False,
+    using: str | None = None,
+) -> Notification:
+    """Notify a user, coalescing into the unread notification of the group.
+
+    The notification is pushed and counted once its transaction commits.
+
+    Args:
+        user_id (int): The primary key of the notified user.
+        kind (str): The kind of the notification.
+        group (str): The key the notifications coalesce by, e.g. the kind and lead.
+        organization_id (int): The organization of the notification.
+        lead (Lead | None): The lead of the notification.
+        actor_id (int | None): The user who caused the notification.
+        detail (str): The detail of the notification, e.g. the new stage.
+        emailed (bool): Whether the user was emailed already, leaving it out of the digest.
+        using (str | None): The database of the notification, None to route it.
+
+    Returns:
+        Notification: The created or coalesced notification.
+    """
+
+    # Get the database of the organization, its dedicated schema if it has one
+    if using is None:
+        with use_organization(organization_id):
+            using = router.db_for_write(Notification)
+
+    # Set the state of the latest notification
+    now = timezone.now()
+    state = {
+        "lead": lead,
+        "actor_id": actor_id,
+        "detail": detail[:255],
+        "updated_at": now,
+        "emailed_at": now if emailed else None,
+    }
+
+    with transaction.atomic(using=using):
+        # Coalesce into the unread notification of the group, or create one. A
+        # concurrent transaction creating it first makes the insert fail, then
+        # the notification is coalesced into the one it created
+        notifications = Notification.objects.using(using).select_for_update()
+        for attempt in range(2):
+            notification = notifications.filter(
+                user_id=user_id, group=group, read_at__isnull=True
+            ).first()
+            if notification is not None:
+                for name, value in state.items():
+                    setattr(notification, name, value)
+                notification.count += 1
+                notification.save(update_fields=[*state, "count"])
+                break
+            try:
+                with transaction.atomic(using=using):
+                    notification = Notification.objects.using(using).create(
+                        user_id=user_id,
+                        organization_id=organization_id,
+                        kind=kind,
+                        group=group,
+                        **state,
+                    )
+            except IntegrityError:
+                if attempt:
+                    raise
+                continue
+
+            # Count the new notification once committed
+            transaction.on_commit(
+                lambda: change_unread_count(user_id, 1), using=using, robust=True
+            )
+            break
+
+        # Push the latest state of the group once committed
+        if not hasattr(_pending, "notifications"):
+            _pending.notifications = {}
+        _pending.notifications[(user_id, group)] = notification
+        transaction.on_commit(
+            lambda: push_notification(notification), using=using, robust=True
+        )
+
+    # Return the notification
+    return notification
+
+
+# Function to mark notifications read
+def mark_read(user_id: int, ids=None, using: str | None = None) -> int:
+    """Mark the unread notifications of a user read.
+
+    Args:
+        user_id (int): The primary key of the user.
+        ids (list[UUID] | None): The UUIDs of the notifications, all if None.
+        using (str | None): The database of the notifications, None to route it.
+
+    Returns:
+        int: The number of notifications marked read.
+    """
+
+    # Get the database of the current organization
+    if using is None:
+        using = router.db_for_write(Notification)
+
+    # Get the unread notifications
+    notifications = Notification.objects.using(using).filter(user_id=user_id).unread()
+    if ids is not None:
+        notifications = notifications.filter(id__in=ids)
+
+    with transaction.atomic(using=using):
+        # Mark them read
+        read = notifications.update(read_at=timezone.now())
+
+        # Move the counter and update the other pages of the user once committed
+        if read:
+            transaction.on_commit(
+                lambda: change_unread_count(user_id, -read), using=using, robust=True
+            )
+            transaction.on_commit(
+                lambda: push_to_user(
+                    user_id,
+                    {"type": "notifications_read", "unread": get_unread_count(user_id)},
+                ),
+                using=using,
+                robust=True,
+            )
+
+    # Return the number of notifications marked read
+    return read
@@ -0,0 +1,50 @@
+# Imports
+from django.db import models
+
+
+# NotificationQuerySet Class
+class NotificationQuerySet(models.QuerySet):
+    """NotificationQuerySet
+
+    NotificationQuerySet class for the Notification model.
+
+    Inherits:
+        models.QuerySet
+
+    Methods:
+        unread: Filter the unread notifications.
+        due_for_digest: Filter the notifications due for the email digest.
+    """
+
+    # unread Method
+    def unread(self) -> "NotificationQuerySet":
+        """unread
+
+        Filters the unread notifications.
+
+        Returns:
+            NotificationQuerySet: The filtered notifications.
+        """
+
+        return self.filter(read_at__isnull=True)
+
+    # due_for_digest Method
+    def due_for_digest(self, before) -> "NotificationQuerySet":
+        """due_for_digest
+
+        Filters the notifications of the active users left unread and not
+        emailed since their last change before a date.
+
+        Args:
+            before (datetime): The date.
+
+        Returns:
+            NotificationQuerySet: The filtered notifications.
+        """
+
+        return self.filter(
+            read_at__isnull=True,
+            emailed_at__isnull=True,
+            updated_at__lte=before,
+            user__is_active=True,
+        )
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.17 on 2026-10-19 19:55
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('leads', '0008_reminders'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0008_user_active_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('pkid', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('kind', models.CharField(choices=[('lead_assigned', 'Lead Assigned'), ('mention', 'Mention'), ('stage_changed', 'Stage Changed'), ('reminder', 'Reminder')], max_length=24, verbose_name='kind')),
+                ('group', models.CharField(max_length=64, verbose_name='group')),
+                ('detail', models.CharField(blank=True, max_length=255, verbose_name='detail')),
+                ('count', models.PositiveIntegerField(default=1, verbose_name='count')),
+                ('read_at', models.DateTimeField(blank=True, null=True, verbose_name='read at')),
+                ('emailed_at', models.DateTimeField(blank=True, null=True, verbose_name='emailed at')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('lead', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='leads.lead')),
+                ('organization', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Notification',
+                'verbose_name_plural': 'Notifications',
+                'ordering': ['-updated_at'],
+                'indexes': [models.Index(fields=['organization', 'user', 'updated_at'], name='notification_user_idx'), models.Index(condition=models.Q(('emailed_at__isnull', True), ('read_at__isnull', True)), fields=['updated_at'], name='notification_digest_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(condition=models.Q(('read_at__isnull', True)), fields=('user', 'group'), name='notification_unread_group_uniq'),
+        ),
+    ]
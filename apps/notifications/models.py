@@ -0,0 +1,131 @@
+# Imports
+import uuid
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import TenantModel
+from apps.core.tenancy import TenantManager
+from apps.notifications.constants import NOTIFICATION_KINDS, NOTIFICATION_MESSAGES
+from apps.notifications.managers import NotificationQuerySet
+
+
+# Notification Model
+class Notification(TenantModel):
+    """Notification Model
+
+    Notification model for the in-app notifications of a user. A burst of
+    notifications of one group coalesces into one row counting them, e.g.
+    "12 leads assigned to you", until the user reads it.
+
+    Inherits:
+        TenantModel
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the notification.
+        id (models.UUIDField): The UUID of the notification.
+        user (models.ForeignKey): The notified user.
+        kind (models.CharField): The kind of the notification.
+        group (models.CharField): The key the notifications coalesce by.
+        lead (models.ForeignKey): The lead of the latest notification.
+        actor (models.ForeignKey): The user who caused the latest notification.
+        detail (models.CharField): The detail of the latest notification.
+        count (models.PositiveIntegerField): The number of coalesced notifications.
+        read_at (models.DateTimeField): The date the user read the notification.
+        emailed_at (models.DateTimeField): The date the notification was emailed.
+        created_at (models.DateTimeField): The created date of the notification.
+        updated_at (models.DateTimeField): The date of the latest notification.
+
+    Managers:
+        objects (NotificationQuerySet): The notifications of the current organization.
+
+    Meta:
+        verbose_name (str): The verbose name of the notification.
+        verbose_name_plural (str): The verbose name of the notification in plural.
+        ordering (list[str]): The ordering of the notification.
+
+    Methods:
+        get_message: Get the message of the notification.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="notifications",
+    )
+    kind = models.CharField(_("kind"), max_length=24, choices=NOTIFICATION_KINDS)
+    group = models.CharField(_("group"), max_length=64)
+    lead = models.ForeignKey(
+        "leads.Lead",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    detail = models.CharField(_("detail"), max_length=255, blank=True)
+    count = models.PositiveIntegerField(_("count"), default=1)
+    read_at = models.DateTimeField(_("read at"), null=True, blank=True)
+    emailed_at = models.DateTimeField(_("emailed at"), null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    # Set object manager
+    objects = TenantManager.from_queryset(NotificationQuerySet)()
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Notification")
+        verbose_name_plural = _("Notifications")
+        ordering = ["-updated_at"]
+
+        # A group has one unread notification, the next ones coalesce into it
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "group"],
+                condition=Q(read_at__isnull=True),
+                name="notification_unread_group_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["organization", "user", "updated_at"],
+                name="notification_user_idx",
+            ),
+            models.Index(
+                fields=["updated_at"],
+                name="notification_digest_idx",
+                condition=Q(read_at__isnull=True, emailed_at__isnull=True),
+            ),
+        ]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return self.get_message()
+
+    # Method to get the message of the notification
+    def get_message(self) -> str:
+        # Get the message for one or for coalesced notifications
+        single, coalesced = NOTIFICATION_MESSAGES[self.kind]
+        message = single if self.count == 1 else coalesced
+
+        # Return the message
+        return message % {
+            "actor": self.actor or _("Someone"),
+            "lead": self.lead or _("a lead"),
+            "detail": self.detail,
+            "count": self.count,
+        }
@@ -0,0 +1,111 @@
+# Imports
+import re
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_init, post_save
+from django.dispatch import receiver
+
+from apps.core.audit import get_current_actor
+from apps.leads.models import Activity, Lead
+from apps.notifications.events import notify
+
+# User Model
+User = get_user_model()
+
+# Mention of a user in a note, e.g. @jane.doe
+MENTION = re.compile(r"(?<![\w.@+-])@([\w.@+-]*\w)")
+
+
+# Signal handler to keep the owner and status of a loaded lead
+@receiver(post_init, sender=Lead)
+def keep_lead_state(sender, instance: Lead, **kwargs):
+    """Keep the loaded owner and status of a lead to compare its next save."""
+
+    # Keep the loaded values, without loading the deferred ones
+    instance._notification_state = (
+        instance.__dict__.get("owner_id"),
+        instance.__dict__.get("status"),
+    )
+
+
+# Signal handler to notify the owner of a saved lead
+@receiver(post_save, sender=Lead)
+def notify_lead_owner(sender, instance: Lead, created: bool, using: str, **kwargs):
+    """Notify the owner of a lead assigned to them or moved to another stage."""
+
+    # If the lead is loaded from a fixture
+    if kwargs.get("raw"):
+        return
+
+    # Get the previous owner and status, and keep the saved ones
+    owner_id, status = (None, None) if created else instance._notification_state
+    instance._notification_state = (instance.owner_id, instance.status)
+
+    # If the lead has no owner, or the owner changed it
+    actor_id = get_current_actor().get("actor_id")
+    if instance.owner_id is None or instance.owner_id == actor_id:
+        return
+
+    # If the lead is assigned to the owner
+    if instance.owner_id != owner_id:
+        notify(
+            instance.owner_id,
+            "lead_assigned",
+            "lead_assigned",
+            instance.organization_id,
+            lead=instance,
+            actor_id=actor_id,
+            using=using,
+        )
+
+    # If the lead moved to another stage
+    elif status is not None and instance.status != status:
+        notify(
+            instance.owner_id,
+            "stage_changed",
+            f"stage_changed:{instance.pkid}",
+            instance.organization_id,
+            lead=instance,
+            actor_id=actor_id,
+            detail=str(instance.get_status_display()),
+            using=using,
+        )
+
+
+# Signal handler to notify the users mentioned in an activity
+@receiver(post_save, sender=Activity)
+def notify_mentioned_users(
+    sender, instance: Activity, created: bool, using: str, **kwargs
+):
+    """Notify the users of the organization mentioned in the note of a new activity."""
+
+    # If the activity is not new or mentions nobody
+    if kwargs.get("raw") or not created:
+        return
+    usernames = set(MENTION.findall(instance.note))
+    if not usernames:
+        return
+
+    # Notify the mentioned users, but the author
+    actor_id = instance.user_id or get_current_actor().get("actor_id")
+    users = (
+        User.objects.using(using)
+        .filter(
+            username__in=usernames,
+            organization_id=instance.organization_id,
+            is_active=True,
+        )
+        .exclude(pk=actor_id)
+        .values_list("pk", flat=True)
+    )
+    for user_id in users:
+        notify(
+            user_id,
+            "mention",
+            f"mention:{instance.lead_id}",
+            instance.organization_id,
+            lead=instance.lead,
+            actor_id=actor_id,
+            detail=instance.subject,
+            using=using,
+        )
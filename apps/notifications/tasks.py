@@ -0,0 +1,89 @@
+# Imports
+from collections import defaultdict
+from datetime import timedelta
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+
+from apps.core.emails import build_email
+from apps.core.tenancy import tenant_aliases
+from apps.notifications.models import Notification
+
+
+# Task to email the notification digests
+@shared_task(
+    soft_time_limit=settings.BULK_TASK_TIME_LIMIT,
+    time_limit=settings.BULK_TASK_TIME_LIMIT + 60,
+)
+def send_notification_digests() -> int:
+    """Email each user a digest of their unread notifications.
+
+    Notifications left unread for NOTIFICATIONS_DIGEST_DELAY seconds since
+    their last change are emailed once, users reading them in the app first
+    get no email. The users are handled in batches of
+    NOTIFICATIONS_DIGEST_BATCH_SIZE, their emails sent over one connection.
+
+    Returns:
+        int: The number of sent digests.
+    """
+
+    # Traverse through the shared schema and the tenant schemas
+    sent = 0
+    before = timezone.now() - timedelta(seconds=settings.NOTIFICATIONS_DIGEST_DELAY)
+    for alias in [DEFAULT_DB_ALIAS, *tenant_aliases()]:
+        due = Notification.objects.using(alias).due_for_digest(before)
+
+        # Traverse through the users with due notifications in batches
+        last_user_id = 0
+        while True:
+            user_ids = list(
+                due.filter(user_id__gt=last_user_id)
+                .order_by("user_id")
+                .values_list("user_id", flat=True)
+                .distinct()[: settings.NOTIFICATIONS_DIGEST_BATCH_SIZE]
+            )
+            if not user_ids:
+                break
+            last_user_id = user_ids[-1]
+
+            with transaction.atomic(using=alias):
+                # Get the due notifications of the users
+                notifications = defaultdict(list)
+                for notification in (
+                    due.select_for_update(skip_locked=True, of=("self",))
+                    .filter(user_id__in=user_ids)
+                    .select_related("user", "lead", "actor")
+                    .order_by("-updated_at")
+                ):
+                    notifications[notification.user].append(notification)
+
+                # Mark them emailed
+                Notification.objects.using(alias).filter(
+                    pkid__in=[
+                        notification.pkid
+                        for batch in notifications.values()
+                        for notification in batch
+                    ]
+                ).update(emailed_at=timezone.now())
+
+                # Build the digests, and send them once committed
+                emails = [
+                    build_email(
+                        "Your Unread Notifications",
+                        "notifications/emails/digest_email",
+                        {"user": user, "notifications": batch},
+                        [user.email],
+                    )
+                    for user, batch in notifications.items()
+                ]
+                transaction.on_commit(
+                    lambda emails=emails: get_connection().send_messages(emails),
+                    using=alias,
+                )
+                sent += len(emails)
+
+    # Return the number of sent digests
+    return sent
@@ -0,0 +1,13 @@
+# Imports
+from django.urls import path
+
+from apps.notifications.views import MarkReadView, NotificationListView
+
+# Set app name
+app_name = "notifications"
+
+# URL Patterns
+urlpatterns = [
+    path("", NotificationListView.as_view(), name="notification-list"),
+    path("read/", MarkReadView.as_view(), name="notification-read"),
+]
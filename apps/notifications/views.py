@@ -0,0 +1,100 @@
+# Imports
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import JsonResponse
+from django.utils.dateparse import parse_datetime
+from django.views.generic import View
+
+from apps.core.mixins import ExplicitTransactionMixin
+from apps.notifications.counters import get_unread_count
+from apps.notifications.events import mark_read, serialize_notification
+from apps.notifications.models import Notification
+
+
+# Notification List View
+class NotificationListView(LoginRequiredMixin, ExplicitTransactionMixin, View):
+    """List the latest notifications of the current user, with the unread count.
+
+    Pages of NOTIFICATIONS_PAGE_SIZE notifications, the next page starts
+    before the updated_at of the last notification of the page.
+
+    Inherits:
+        LoginRequiredMixin
+        ExplicitTransactionMixin
+        View
+
+    Attributes:
+        raise_exception (bool): Answer anonymous requests with 403.
+
+    Methods:
+        get: Method to handle get request
+    """
+
+    # Attributes
+    raise_exception = True
+
+    # Method to handle get request
+    def get(self, request):
+        # Get the notifications of the user
+        notifications = Notification.objects.filter(user=request.user).select_related(
+            "lead", "actor"
+        )
+
+        # If a page is requested
+        before = request.GET.get("before")
+        if before:
+            before = parse_datetime(before)
+            if before is None:
+                return JsonResponse(
+                    {"errors": {"before": ["Invalid date."]}}, status=400
+                )
+            notifications = notifications.filter(updated_at__lt=before)
+
+        # Return the page and the unread count
+        return JsonResponse(
+            {
+                "unread": get_unread_count(request.user.pk),
+                "notifications": [
+                    serialize_notification(notification)
+                    for notification in notifications[
+                        : settings.NOTIFICATIONS_PAGE_SIZE
+                    ]
+                ],
+            }
+        )
+
+
+# Mark Read View
+class MarkReadView(LoginRequiredMixin, ExplicitTransactionMixin, View):
+    """Mark the given notifications of the current user read, or all of them.
+
+    Inherits:
+        LoginRequiredMixin
+        ExplicitTransactionMixin
+        View
+
+    Attributes:
+        raise_exception (bool): Answer anonymous requests with 403.
+
+    Methods:
+        post: Method to handle post request
+    """
+
+    # Attributes
+    raise_exception = True
+
+    # Method to handle post request
+    def post(self, request):
+        # Get the notifications to mark, all if none is given
+        try:
+            ids = [uuid.UUID(id) for id in request.POST.getlist("id")] or None
+        except ValueError:
+            return JsonResponse({"errors": {"id": ["Invalid id."]}}, status=400)
+
+        # Mark the notifications read
+        read = mark_read(request.user.pk, ids=ids)
+
+        # Return the number of read notifications
+        return JsonResponse({"read": read})
@@ -0,0 +1,150 @@
+# Imports
+from django.contrib import admin, messages
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+
+from apps.webhooks.models import WebhookDelivery, WebhookEndpoint
+from apps.webhooks.tasks import deliver_endpoint
+
+
+# Register the WebhookEndpoint model
+@admin.register(WebhookEndpoint)
+class WebhookEndpointAdmin(admin.ModelAdmin):
+    """Webhook Endpoint Admin
+
+    Webhook Endpoint Admin for the WebhookEndpoint model.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        list_filter (list[str]): The list of fields to filter.
+        search_fields (list[str]): The list of fields to search.
+        ordering (list[str]): The list of fields to order by.
+        readonly_fields (list[str]): The list of read only fields.
+        actions (list[str]): The list of actions.
+
+    Methods:
+        reset_backoff: Retry the selected endpoints right away.
+    """
+
+    # Set model
+    model = WebhookEndpoint
+
+    # List display
+    list_display = ["name", "url", "is_active", "failure_count", "retry_at"]
+
+    # List filter
+    list_filter = ["is_active"]
+
+    # Search fields
+    search_fields = ["name", "url"]
+
+    # Ordering
+    ordering = ["name"]
+
+    # Set readonly fields
+    readonly_fields = ["failure_count", "retry_at", "created_at", "updated_at"]
+
+    # Actions
+    actions = ["reset_backoff"]
+
+    # Method to retry the selected endpoints
+    @admin.action(description=_("Retry the selected endpoints now"))
+    def reset_backoff(self, request, queryset):
+        # Clear the backoff of the endpoints
+        pkids = list(queryset.values_list("pkid", flat=True))
+        queryset.update(failure_count=0, retry_at=None)
+
+        # Start the deliveries once the transaction is committed
+        for pkid in pkids:
+            transaction.on_commit(lambda pkid=pkid: deliver_endpoint.delay(pkid))
+
+        # Show a message
+        self.message_user(
+            request, _("%d endpoint(s) retried.") % len(pkids), messages.SUCCESS
+        )
+
+
+# Register the WebhookDelivery model
+@admin.register(WebhookDelivery)
+class WebhookDeliveryAdmin(admin.ModelAdmin):
+    """Webhook Delivery Admin
+
+    Webhook Delivery Admin for the WebhookDelivery model.
+
+    Inherits:
+        admin.ModelAdmin
+
+    Attributes:
+        list_display (list[str]): The list of fields to display.
+        list_filter (list[str]): The list of fields to filter.
+        search_fields (list[str]): The list of fields to search.
+        ordering (list[str]): The list of fields to order by.
+        readonly_fields (list[str]): The list of read only fields.
+        raw_id_fields (list[str]): The list of raw id fields.
+        actions (list[str]): The list of actions.
+
+    Methods:
+        redeliver: Queue the selected dead deliveries again.
+    """
+
+    # Set model
+    model = WebhookDelivery
+
+    # List display
+    list_display = [
+        "event_type",
+        "endpoint",
+        "status",
+        "attempts",
+        "created_at",
+        "delivered_at",
+    ]
+
+    # List filter
+    list_filter = ["status", "event_type"]
+
+    # Search fields
+    search_fields = ["id", "endpoint__name"]
+
+    # Ordering
+    ordering = ["-created_at"]
+
+    # Set readonly fields
+    readonly_fields = [
+        "endpoint",
+        "event_type",
+        "payload",
+        "status",
+        "attempts",
+        "last_error",
+        "created_at",
+        "delivered_at",
+    ]
+
+    # Set raw id fields
+    raw_id_fields = ["endpoint"]
+
+    # Actions
+    actions = ["redeliver"]
+
+    # Method to queue the selected dead deliveries again
+    @admin.action(description=_("Redeliver the selected dead deliveries"))
+    def redeliver(self, request, queryset):
+        # Get the dead deliveries and their endpoints
+        dead = queryset.filter(status="dead")
+        endpoint_ids = set(dead.values_list("endpoint_id", flat=True))
+
+        # Queue the deliveries again
+        count = dead.update(status="pending", attempts=0, last_error="")
+
+        # Start the deliveries once the transaction is committed
+        for pkid in endpoint_ids:
+            transaction.on_commit(lambda pkid=pkid: deliver_endpoint.delay(pkid))
+
+        # Show a message
+        self.message_user(
+            request, _("%d delivery(ies) queued.") % count, messages.SUCCESS
+        )
@@ -0,0 +1,30 @@
+# Imports
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+# WebhooksConfig Class
+class WebhooksConfig(AppConfig):
+    """WebhooksConfig
+
+    WebhooksConfig class is used to configure the webhooks app.
+
+    Inherits:
+        AppConfig
+
+    Attributes:
+        name (str): The name of the app.
+        verbose_name (str): The verbose name of the app.
+
+    Methods:
+        ready: Register the outbox consumers of the app.
+    """
+
+    # Attributes
+    name = "apps.webhooks"
+    verbose_name = _("Webhooks")
+
+    # Method to register the outbox consumers
+    def ready(self):
+        # Import the modules that register outbox consumers
+        import apps.webhooks.consumers  # noqa: F401
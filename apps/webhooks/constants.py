@@ -0,0 +1,16 @@
+# Imports
+from django.utils.translation import gettext_lazy as _
+
+# Webhook Event Types
+WEBHOOK_EVENT_TYPES = (
+    ("lead.created", _("Lead Created")),
+    ("lead.updated", _("Lead Updated")),
+    ("lead.deleted", _("Lead Deleted")),
+)
+
+# Webhook Delivery Statuses
+DELIVERY_STATUSES = (
+    ("pending", _("Pending")),
+    ("delivered", _("Delivered")),
+    ("dead", _("Dead")),
+)
@@ -0,0 +1,56 @@
+# Imports
+from collections import defaultdict
+
+from django.db import router, transaction
+
+from apps.core.models import OutboxEvent
+from apps.core.outbox import consumer
+from apps.core.routers import use_primary
+from apps.core.tenancy import use_organization
+from apps.leads.models import Lead
+from apps.webhooks.events import enqueue_events, serialize_lead
+from apps.webhooks.models import WebhookDelivery
+
+
+# Consumer to send the webhooks of the changed leads
+@consumer("leads.lead", queue="webhooks")
+def send_lead_webhooks(events: list[OutboxEvent]):
+    """Queue the webhook events of the changed leads.
+
+    Saved leads are sent in their current state, leads deleted since are
+    skipped, their deleted event follows. The outbox event id is the webhook
+    event id, so a retried batch queues nothing twice.
+
+    Args:
+        events (list[OutboxEvent]): The outbox events of the leads.
+    """
+
+    # Get the current state of the saved leads, a replica may not have them yet
+    with use_primary():
+        leads = Lead.objects.select_related("owner").in_bulk(
+            [event.entity_id for event in events if event.action != "deleted"]
+        )
+
+    # Build the webhook events of every organization
+    webhook_events = defaultdict(list)
+    for event in events:
+        # If the lead is deleted
+        if event.action == "deleted":
+            webhook_events[event.organization_id].append(
+                (event.id, "lead.deleted", {"id": event.data["id"]})
+            )
+
+        # If the lead still exists
+        elif int(event.entity_id) in leads:
+            lead = leads[int(event.entity_id)]
+            webhook_events[lead.organization_id].append(
+                (event.id, f"lead.{event.action}", serialize_lead(lead))
+            )
+
+    # Queue the webhook events for the endpoints of their organizations
+    for organization_id, organization_events in webhook_events.items():
+        # Write to the database of the organization, its own schema if any
+        with use_organization(organization_id):
+            using = router.db_for_write(WebhookDelivery)
+        with transaction.atomic(using=using):
+            enqueue_events(organization_id, organization_events, using=using)
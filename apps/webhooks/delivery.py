@@ -0,0 +1,137 @@
+# Imports
+import hashlib
+import hmac
+import threading
+import time
+
+import urllib3
+from django.conf import settings
+
+# Name of the signature header
+SIGNATURE_HEADER = "X-LeadTrack-Signature"
+
+# HTTP connection pools of the worker process, one per endpoint host
+_pool_manager: urllib3.PoolManager | None = None
+_pool_manager_lock = threading.Lock()
+
+
+# Function to get the HTTP pool manager
+def get_pool_manager() -> urllib3.PoolManager:
+    """Get the pool manager posting the webhooks.
+
+    Connections to an endpoint are kept alive between the batches, so a busy
+    endpoint does not pay for a TCP and TLS handshake per delivery.
+
+    Returns:
+        urllib3.PoolManager: The pool manager.
+    """
+
+    # Get the global pool manager
+    global _pool_manager
+
+    # If the pool manager does not exist yet
+    if _pool_manager is None:
+        with _pool_manager_lock:
+            if _pool_manager is None:
+                # Create the pool manager
+                _pool_manager = urllib3.PoolManager(
+                    num_pools=settings.WEBHOOK_POOL_SIZE,
+                    maxsize=1,
+                    retries=False,
+                    timeout=urllib3.Timeout(
+                        connect=settings.WEBHOOK_CONNECT_TIMEOUT,
+                        read=settings.WEBHOOK_READ_TIMEOUT,
+                    ),
+                )
+
+    # Return the pool manager
+    return _pool_manager
+
+
+# Function to sign a payload
+def sign_payload(secret: str, body: bytes, timestamp: int) -> str:
+    """Sign the body of a webhook.
+
+    The receiver recomputes the HMAC-SHA256 of "<timestamp>.<body>" with the
+    secret of its endpoint and rejects old timestamps to stop replays.
+
+    Args:
+        secret (str): The secret of the endpoint.
+        body (bytes): The body of the request.
+        timestamp (int): The UNIX time of the request.
+
+    Returns:
+        str: The value of the signature header, t=<timestamp>,v1=<hex digest>.
+    """
+
+    # Compute the digest
+    digest = hmac.new(
+        secret.encode(), str(timestamp).encode() + b"." + body, hashlib.sha256
+    ).hexdigest()
+
+    # Return the header value
+    return f"t={timestamp},v1={digest}"
+
+
+# Function to verify a signature
+def verify_signature(
+    secret: str, body: bytes, header: str, tolerance: int = 5 * 60
+) -> bool:
+    """Verify the signature header of a webhook.
+
+    Args:
+        secret (str): The secret of the endpoint.
+        body (bytes): The body of the request.
+        header (str): The value of the signature header.
+        tolerance (int): The maximum age of the request in seconds.
+
+    Returns:
+        bool: True if the signature matches and the request is recent.
+    """
+
+    # Parse the header
+    values = dict(
+        part.split("=", 1) for part in header.split(",") if "=" in part.strip()
+    )
+    try:
+        timestamp = int(values.get("t", ""))
+    except ValueError:
+        return False
+
+    # If the request is too old
+    if abs(time.time() - timestamp) > tolerance:
+        return False
+
+    # Compare the signatures in constant time
+    return hmac.compare_digest(
+        sign_payload(secret, body, timestamp), f"t={timestamp},v1={values.get('v1')}"
+    )
+
+
+# Function to post a batch of events
+def post_events(url: str, secret: str, body: bytes) -> urllib3.HTTPResponse:
+    """Post a signed batch of events to an endpoint.
+
+    Args:
+        url (str): The URL of the endpoint.
+        secret (str): The secret of the endpoint.
+        body (bytes): The encoded batch.
+
+    Returns:
+        urllib3.HTTPResponse: The response, read and released to the pool.
+
+    Raises:
+        urllib3.exceptions.HTTPError: If the endpoint can not be reached in time.
+    """
+
+    # Post the signed body
+    return get_pool_manager().request(
+        "POST",
+        url,
+        body=body,
+        headers={
+            "Content-Type": "application/json",
+            "User-Agent": f"{settings.SITE_NAME}-Webhooks",
+            SIGNATURE_HEADER: sign_payload(secret, body, int(time.time())),
+        },
+    )
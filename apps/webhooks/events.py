@@ -0,0 +1,117 @@
+# Imports
+import uuid
+from functools import partial
+
+from django.db import router, transaction
+from django.utils import timezone
+
+from apps.core.tenancy import use_organization
+from apps.leads.models import Lead
+from apps.webhooks.models import WebhookDelivery, WebhookEndpoint
+from apps.webhooks.tasks import deliver_endpoint
+
+
+# Function to serialize a lead for the webhooks
+def serialize_lead(lead: Lead) -> dict:
+    """Serialize a lead into the data of its webhook events.
+
+    Args:
+        lead (Lead): The lead.
+
+    Returns:
+        dict: The data of the lead.
+    """
+
+    # Return the data
+    return {
+        "id": lead.id,
+        "owner": lead.owner.id if lead.owner_id else None,
+        "first_name": lead.first_name,
+        "last_name": lead.last_name,
+        "email": lead.email,
+        "phone": lead.phone,
+        "company": lead.company,
+        "status": lead.status,
+        "created_at": lead.created_at,
+        "updated_at": lead.updated_at,
+    }
+
+
+# Function to start the delivery of an endpoint for its organization
+def deliver_for_organization(endpoint_id: int, organization_id: int):
+    """Queue the delivery of an endpoint for the organization of the endpoint."""
+
+    # Queue the task for the organization
+    with use_organization(organization_id):
+        deliver_endpoint.delay(endpoint_id)
+
+
+# Function to enqueue events for the subscribed endpoints
+def enqueue_events(
+    organization_id: int,
+    events: list[tuple[uuid.UUID, str, dict]],
+    using: str | None = None,
+) -> int:
+    """Write events to the outbox of every endpoint subscribed to them.
+
+    An event is queued once per endpoint, queueing it again is a no-op, so
+    a retried caller sends no duplicates. The delivery of each endpoint is
+    started once the transaction commits.
+
+    Args:
+        organization_id (int): The organization of the events.
+        events (list[tuple[UUID, str, dict]]): The id, type and data of the events.
+        using (str | None): The database of the deliveries, None to route it.
+
+    Returns:
+        int: The number of endpoints receiving events.
+    """
+
+    # Get the database of the organization, its dedicated schema if it has one
+    if using is None:
+        with use_organization(organization_id):
+            using = router.db_for_write(WebhookDelivery)
+
+    # Get the active endpoints of the organization
+    endpoints = list(
+        WebhookEndpoint.objects.using(using).filter(
+            organization_id=organization_id, is_active=True
+        )
+    )
+
+    # Build the deliveries of the subscribed endpoints
+    now = timezone.now()
+    deliveries = [
+        WebhookDelivery(
+            organization_id=organization_id,
+            endpoint=endpoint,
+            event_id=event_id,
+            event_type=event_type,
+            payload={
+                "id": event_id,
+                "type": event_type,
+                "created_at": now,
+                "data": data,
+            },
+        )
+        for event_id, event_type, data in events
+        for endpoint in endpoints
+        if endpoint.subscribes_to(event_type)
+    ]
+
+    # If no endpoint is subscribed
+    if not deliveries:
+        return 0
+
+    # Write the deliveries, skipping the queued ones
+    WebhookDelivery.objects.using(using).bulk_create(deliveries, ignore_conflicts=True)
+
+    # Start the deliveries for the organization once committed
+    endpoint_ids = {delivery.endpoint_id for delivery in deliveries}
+    for pkid in endpoint_ids:
+        transaction.on_commit(
+            partial(deliver_for_organization, pkid, organization_id), using=using
+        )
+
+    # Return the number of endpoints
+    return len(endpoint_ids)
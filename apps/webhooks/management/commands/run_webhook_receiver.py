@@ -0,0 +1,131 @@
+# Imports
+import json
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+from apps.webhooks.delivery import SIGNATURE_HEADER, verify_signature
+
+
+# Stub Receiver Handler
+class StubReceiverHandler(BaseHTTPRequestHandler):
+    """Stub Receiver Handler
+
+    Answers the webhook batches posted to the stub receiver.
+
+    Inherits:
+        BaseHTTPRequestHandler
+
+    Attributes:
+        secret (str): The secret the signatures are verified with, if any.
+        delay (float): The seconds to wait before answering.
+        failure_rate (float): The share of batches answered with 503.
+        stdout (OutputWrapper): The output of the command.
+
+    Methods:
+        do_POST: Verify and print a batch.
+    """
+
+    # Attributes
+    secret = ""
+    delay = 0.0
+    failure_rate = 0.0
+    stdout = None
+
+    # Method to handle post request
+    def do_POST(self):
+        # Read the body
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        # Simulate a slow endpoint
+        if self.delay:
+            time.sleep(self.delay)
+
+        # If the signature is invalid, answer with 401
+        signature = self.headers.get(SIGNATURE_HEADER, "")
+        if self.secret and not verify_signature(self.secret, body, signature):
+            self.stdout.write(
+                f"Rejected a batch with an invalid signature: {signature}"
+            )
+            self.send_response(401)
+            self.end_headers()
+            return
+
+        # Simulate a failing endpoint
+        if random.random() < self.failure_rate:
+            self.stdout.write("Failed a batch on purpose")
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        # Print the events
+        events = json.loads(body)["events"]
+        for event in events:
+            self.stdout.write(f"{event['type']} {event['id']}")
+
+        # Answer with 204
+        self.send_response(204)
+        self.end_headers()
+
+    # Method to silence the request log
+    def log_message(self, format, *args):
+        pass
+
+
+# Command Class
+class Command(BaseCommand):
+    """Command
+
+    Runs a local stub receiver for the webhooks, to point an endpoint at
+    during development and tests.
+
+    Inherits:
+        BaseCommand
+
+    Methods:
+        add_arguments: Add the arguments of the command.
+        handle: Run the receiver.
+    """
+
+    # Attributes
+    help = "Run a local stub receiver for the webhooks."
+
+    # Method to add the arguments
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8088)
+        parser.add_argument("--secret", default="", help="Verify the signatures.")
+        parser.add_argument(
+            "--delay", type=float, default=0.0, help="Seconds to wait per batch."
+        )
+        parser.add_argument(
+            "--failure-rate", type=float, default=0.0, help="Share of batches to fail."
+        )
+
+    # Method to run the receiver
+    def handle(self, *args, **options):
+        # Configure the handler
+        handler = type(
+            "Handler",
+            (StubReceiverHandler,),
+            {
+                "secret": options["secret"],
+                "delay": options["delay"],
+                "failure_rate": options["failure_rate"],
+                "stdout": self.stdout,
+            },
+        )
+
+        # Serve until interrupted
+        server = ThreadingHTTPServer((options["host"], options["port"]), handler)
+        self.stdout.write(
+            f"Receiving webhooks on http://{options['host']}:{options['port']}/"
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
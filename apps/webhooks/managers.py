@@ -0,0 +1,36 @@
+# Imports
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+# WebhookDeliveryQuerySet Class
+class WebhookDeliveryQuerySet(models.QuerySet):
+    """WebhookDeliveryQuerySet
+
+    WebhookDeliveryQuerySet class for the WebhookDelivery model.
+
+    Inherits:
+        models.QuerySet
+
+    Methods:
+        due: Filter the pending deliveries of the endpoints ready to receive.
+    """
+
+    # due Method
+    def due(self) -> "WebhookDeliveryQuerySet":
+        """due
+
+        Filters the pending deliveries of the active endpoints that are not
+        backing off after a failure.
+
+        Returns:
+            WebhookDeliveryQuerySet: The filtered deliveries.
+        """
+
+        return self.filter(
+            Q(endpoint__retry_at__isnull=True)
+            | Q(endpoint__retry_at__lte=timezone.now()),
+            status="pending",
+            endpoint__is_active=True,
+        )
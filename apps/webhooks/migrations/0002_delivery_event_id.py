@@ -0,0 +1,36 @@
+# Generated by Django 4.2.17 on 2026-10-19 19:40
+
+from django.db import migrations, models
+
+
+def set_event_ids(apps, schema_editor):
+    # Take the event ids of the queued deliveries from their payloads
+    WebhookDelivery = apps.get_model('webhooks', 'WebhookDelivery')
+    deliveries = WebhookDelivery.objects.using(schema_editor.connection.alias)
+    for delivery in deliveries.only('pkid', 'payload').iterator():
+        deliveries.filter(pkid=delivery.pkid).update(event_id=delivery.payload['id'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webhooks', '0001_webhooks'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webhookdelivery',
+            name='event_id',
+            field=models.UUIDField(null=True, verbose_name='event id'),
+        ),
+        migrations.RunPython(set_event_ids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='webhookdelivery',
+            name='event_id',
+            field=models.UUIDField(verbose_name='event id'),
+        ),
+        migrations.AddConstraint(
+            model_name='webhookdelivery',
+            constraint=models.UniqueConstraint(fields=('endpoint', 'event_id'), name='webhook_delivery_event_unique'),
+        ),
+    ]
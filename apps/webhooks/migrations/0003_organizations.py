@@ -0,0 +1,57 @@
+# Generated by Django 4.2.17 on 2026-10-19 19:37
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def set_organizations(apps, schema_editor):
+    # Give the existing rows to the default organization
+    Organization = apps.get_model('core', 'Organization')
+    using = schema_editor.connection.alias
+    organization, _ = Organization.objects.using(using).get_or_create(
+        slug=settings.DEFAULT_ORGANIZATION_SLUG, defaults={'name': 'Default'}
+    )
+    for model_name in ['webhookendpoint', 'webhookdelivery']:
+        model = apps.get_model('webhooks', model_name)
+        model.objects.using(using).update(organization=organization)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_organizations'),
+        ('webhooks', '0002_delivery_event_id'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='webhookdelivery',
+            name='webhook_delivery_due_idx',
+        ),
+        migrations.AddField(
+            model_name='webhookdelivery',
+            name='organization',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AddField(
+            model_name='webhookendpoint',
+            name='organization',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.RunPython(set_organizations, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='webhookendpoint',
+            name='organization',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AlterField(
+            model_name='webhookdelivery',
+            name='organization',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.organization'),
+        ),
+        migrations.AddIndex(
+            model_name='webhookdelivery',
+            index=models.Index(fields=['organization', 'endpoint', 'status', 'pkid'], name='webhook_delivery_due_idx'),
+        ),
+    ]
@@ -0,0 +1,172 @@
+# Imports
+import secrets
+import uuid
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import TenantModel
+from apps.core.tenancy import TenantManager
+from apps.webhooks.constants import DELIVERY_STATUSES
+from apps.webhooks.managers import WebhookDeliveryQuerySet
+
+
+# Function to generate a signing secret
+def generate_secret() -> str:
+    """Generate the secret an endpoint verifies the signatures with.
+
+    Returns:
+        str: The secret.
+    """
+    return secrets.token_urlsafe(32)
+
+
+# Webhook Endpoint Model
+class WebhookEndpoint(TenantModel):
+    """Webhook Endpoint Model
+
+    Webhook endpoint model for a customer URL subscribed to lead events.
+
+    Inherits:
+        TenantModel
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the endpoint.
+        id (models.UUIDField): The UUID of the endpoint.
+        name (models.CharField): The name of the endpoint.
+        url (models.URLField): The URL the events are posted to.
+        secret (models.CharField): The secret the payloads are signed with.
+        event_types (models.JSONField): The subscribed event types, all if empty.
+        is_active (models.BooleanField): Whether events are delivered.
+        failure_count (models.PositiveIntegerField): The consecutive failures.
+        retry_at (models.DateTimeField): The date the endpoint is retried after a failure.
+        created_at (models.DateTimeField): The created date of the endpoint.
+        updated_at (models.DateTimeField): The updated date of the endpoint.
+
+    Meta:
+        verbose_name (str): The verbose name of the endpoint.
+        verbose_name_plural (str): The verbose name of the endpoint in plural.
+        ordering (list[str]): The ordering of the endpoint.
+
+    Methods:
+        subscribes_to: Check if the endpoint receives an event type.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    name = models.CharField(_("name"), max_length=64)
+    url = models.URLField(_("URL"), max_length=512)
+    secret = models.CharField(_("secret"), max_length=64, default=generate_secret)
+    event_types = models.JSONField(_("event types"), default=list, blank=True)
+    is_active = models.BooleanField(_("active"), default=True)
+    failure_count = models.PositiveIntegerField(_("failure count"), default=0)
+    retry_at = models.DateTimeField(_("retry at"), null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Webhook Endpoint")
+        verbose_name_plural = _("Webhook Endpoints")
+        ordering = ["name"]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return self.name
+
+    # Method to check if the endpoint receives an event type
+    def subscribes_to(self, event_type: str) -> bool:
+        """Check if the endpoint receives an event type.
+
+        Args:
+            event_type (str): The event type.
+
+        Returns:
+            bool: True if the endpoint subscribed to the event type or to all.
+        """
+        return not self.event_types or event_type in self.event_types
+
+
+# Webhook Delivery Model
+class WebhookDelivery(TenantModel):
+    """Webhook Delivery Model
+
+    Webhook delivery model for an event waiting in the outbox of an endpoint.
+    It is queued from the outbox events of committed changes, once per event
+    and endpoint.
+
+    Inherits:
+        TenantModel
+
+    Attributes:
+        pkid (models.BigAutoField): The primary key of the delivery.
+        id (models.UUIDField): The UUID of the delivery.
+        endpoint (models.ForeignKey): The endpoint of the delivery.
+        event_id (models.UUIDField): The UUID of the event, shared by its deliveries.
+        event_type (models.CharField): The type of the event.
+        payload (models.JSONField): The data of the event.
+        status (models.CharField): The status of the delivery.
+        attempts (models.PositiveIntegerField): The number of failed attempts.
+        last_error (models.TextField): The error of the last attempt.
+        created_at (models.DateTimeField): The created date of the event.
+        delivered_at (models.DateTimeField): The delivered date of the event.
+
+    Managers:
+        objects (WebhookDeliveryQuerySet): The object manager of the delivery.
+
+    Meta:
+        verbose_name (str): The verbose name of the delivery.
+        verbose_name_plural (str): The verbose name of the delivery in plural.
+        ordering (list[str]): The ordering of the delivery.
+        constraints (list[models.UniqueConstraint]): One delivery per event and endpoint.
+    """
+
+    # Attributes
+    pkid = models.BigAutoField(primary_key=True, editable=False)
+    id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    endpoint = models.ForeignKey(
+        WebhookEndpoint, on_delete=models.CASCADE, related_name="deliveries"
+    )
+    event_id = models.UUIDField(_("event id"))
+    event_type = models.CharField(_("event type"), max_length=64)
+    payload = models.JSONField(_("payload"), encoder=DjangoJSONEncoder)
+    status = models.CharField(
+        _("status"), max_length=24, choices=DELIVERY_STATUSES, default="pending"
+    )
+    attempts = models.PositiveIntegerField(_("attempts"), default=0)
+    last_error = models.TextField(_("last error"), blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    delivered_at = models.DateTimeField(null=True, blank=True)
+
+    # Set object manager
+    objects = TenantManager.from_queryset(WebhookDeliveryQuerySet)()
+
+    # Take the organization from the endpoint
+    tenant_parent = "endpoint"
+
+    # Meta class
+    class Meta:
+        # Attributes
+        verbose_name = _("Webhook Delivery")
+        verbose_name_plural = _("Webhook Deliveries")
+        ordering = ["-created_at"]
+
+        indexes = [
+            models.Index(
+                fields=["organization", "endpoint", "status", "pkid"],
+                name="webhook_delivery_due_idx",
+            ),
+        ]
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["endpoint", "event_id"], name="webhook_delivery_event_unique"
+            ),
+        ]
+
+    # Method to get the string representation
+    def __str__(self) -> str:
+        return f"{self.event_type} {self.id}"
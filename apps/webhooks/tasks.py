@@ -0,0 +1,183 @@
+# Imports
+import random
+from datetime import timedelta
+
+import orjson
+import urllib3
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.core.routers import use_primary
+from apps.core.tenancy import tenant_aliases, use_organization
+from apps.webhooks.delivery import post_events
+from apps.webhooks.models import WebhookDelivery, WebhookEndpoint
+
+
+# Function to get the backoff of an endpoint
+def get_backoff(failure_count: int) -> float:
+    """Get the seconds to wait before retrying a failing endpoint.
+
+    The backoff doubles with every consecutive failure up to
+    WEBHOOK_BACKOFF_MAX, and is jittered so endpoints failing together are not
+    retried together.
+
+    Args:
+        failure_count (int): The consecutive failures of the endpoint.
+
+    Returns:
+        float: The backoff in seconds.
+    """
+
+    # Double the base backoff per failure, up to the maximum
+    backoff = min(
+        settings.WEBHOOK_BACKOFF_MAX,
+        settings.WEBHOOK_BACKOFF_BASE * 2 ** max(0, failure_count - 1),
+    )
+
+    # Return the jittered backoff
+    return random.uniform(backoff / 2, backoff)
+
+
+# Task to deliver the pending events of an endpoint
+@shared_task
+def deliver_endpoint(endpoint_id: int):
+    """Post the pending events of an endpoint in batches.
+
+    Up to WEBHOOK_BATCH_SIZE events are posted in one signed request over a
+    pooled connection. A lock keeps one delivery per endpoint at a time, so
+    the events arrive in order and a slow endpoint holds one worker process
+    at most, for the connect and read timeouts at most. After a failure the
+    endpoint backs off exponentially and dispatch_webhooks retries it, events
+    failing WEBHOOK_MAX_ATTEMPTS times are dead lettered.
+
+    Args:
+        endpoint_id (int): The primary key of the endpoint.
+    """
+
+    # If another task delivers to the endpoint
+    lock = f"webhooks:endpoint:{endpoint_id}:lock"
+    timeout = settings.WEBHOOK_CONNECT_TIMEOUT + settings.WEBHOOK_READ_TIMEOUT + 60
+    if not cache.add(lock, 1, timeout):
+        return
+
+    try:
+        # Get the active endpoint from the primary
+        with use_primary():
+            endpoint = WebhookEndpoint.objects.filter(
+                pkid=endpoint_id, is_active=True
+            ).first()
+
+        # If the endpoint is gone or backing off
+        if endpoint is None or (
+            endpoint.retry_at is not None and endpoint.retry_at > timezone.now()
+        ):
+            return
+
+        # Get the oldest pending events, a replica may still list delivered ones
+        with use_primary():
+            batch = list(
+                endpoint.deliveries.filter(status="pending")
+                .order_by("pkid")
+                .values_list("pkid", "payload")[: settings.WEBHOOK_BATCH_SIZE]
+            )
+
+        # If nothing is pending
+        if not batch:
+            return
+
+        # Post the batch
+        pkids = [pkid for pkid, _ in batch]
+        body = orjson.dumps({"events": [payload for _, payload in batch]})
+        try:
+            response = post_events(endpoint.url, endpoint.secret, body)
+            error = "" if 200 <= response.status < 300 else f"HTTP {response.status}"
+        except urllib3.exceptions.HTTPError as exc:
+            error = str(exc) or exc.__class__.__name__
+
+        # If the endpoint accepted the batch
+        if not error:
+            with transaction.atomic():
+                # Mark the events delivered and reset the failures
+                WebhookDelivery.objects.filter(pkid__in=pkids).update(
+                    status="delivered", delivered_at=timezone.now(), last_error=""
+                )
+                WebhookEndpoint.objects.filter(pkid=endpoint.pkid).update(
+                    failure_count=0, retry_at=None
+                )
+
+            # Check if more events are pending, on the primary too
+            with use_primary():
+                has_more = endpoint.deliveries.filter(status="pending").exists()
+
+        # Otherwise back off
+        else:
+            with transaction.atomic():
+                # Count the attempt and dead letter the exhausted events
+                WebhookDelivery.objects.filter(pkid__in=pkids).update(
+                    attempts=F("attempts") + 1, last_error=error[:1000]
+                )
+                WebhookDelivery.objects.filter(
+                    pkid__in=pkids, attempts__gte=settings.WEBHOOK_MAX_ATTEMPTS
+                ).update(status="dead")
+
+                # Retry the endpoint after the backoff
+                failure_count = endpoint.failure_count + 1
+                WebhookEndpoint.objects.filter(pkid=endpoint.pkid).update(
+                    failure_count=failure_count,
+                    retry_at=timezone.now()
+                    + timedelta(seconds=get_backoff(failure_count)),
+                )
+
+            # Leave the retry to dispatch_webhooks
+            has_more = False
+
+    # Release the lock
+    finally:
+        cache.delete(lock)
+
+    # Deliver the next batch
+    if has_more:
+        deliver_endpoint.delay(endpoint_id)
+
+
+# Task to start the deliveries of the endpoints with due events
+@shared_task
+def dispatch_webhooks():
+    """Start a delivery for every endpoint with due events.
+
+    Run every minute, it retries the endpoints whose backoff ended and picks
+    up events whose delivery was never started, e.g. after a lost worker.
+    """
+
+    # Traverse through the shared schema and the tenant schemas
+    for alias in [DEFAULT_DB_ALIAS, *tenant_aliases()]:
+        # Get the endpoints with due events and their organizations
+        endpoints = (
+            WebhookDelivery.objects.using(alias)
+            .due()
+            .order_by()
+            .values_list("endpoint_id", "organization_id")
+            .distinct()
+        )
+
+        # Start the deliveries for the organizations of the endpoints
+        for endpoint_id, organization_id in endpoints:
+            with use_organization(organization_id):
+                deliver_endpoint.delay(endpoint_id)
+
+
+# Task to purge the delivered events
+@shared_task
+def purge_webhook_deliveries():
+    """Delete the events delivered more than WEBHOOK_RETENTION seconds ago."""
+
+    # Delete the delivered events of every schema
+    cutoff = timezone.now() - timedelta(seconds=settings.WEBHOOK_RETENTION)
+    for alias in [DEFAULT_DB_ALIAS, *tenant_aliases()]:
+        WebhookDelivery.objects.using(alias).filter(
+            status="delivered", delivered_at__lt=cutoff
+        ).delete()
@@ -16,8 +16,12 @@ sys.path.append(str(BASE_DIR / "apps"))
 # Add the django settings module to the environment
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
-# Initialize the WSGI application
-application = get_asgi_application()
+# Close the database connections after every request, Django 4.2 does not reuse
+# persistent connections under ASGI (ticket #33497), pgbouncer pools them instead
+os.environ.setdefault("DATABASE_CONN_MAX_AGE", "0")
+
+# Initialize the ASGI application
+django_application = get_asgi_application()
 
 
 # Import websocket application
@@ -39,8 +43,8 @@ async def application(scope, receive, send):
 
     # If the request is a http request
     if scope["type"] == "http":
-        # Call the http application
-        await application(scope, receive, send)
+        # Call the django application
+        await django_application(scope, receive, send)
 
     # If the request is a websocket request
     elif scope["type"] == "websocket":
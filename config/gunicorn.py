@@ -0,0 +1,62 @@
+# Imports
+import multiprocessing
+import os
+
+import environ
+
+# Initialize environment variables
+env = environ.Env()
+
+# Server socket
+# ------------------------------------------------------------------------------
+bind = env.str("GUNICORN_BIND", default="0.0.0.0:8000")
+backlog = env.int("GUNICORN_BACKLOG", default=2048)
+
+# Worker processes
+# ------------------------------------------------------------------------------
+# Uvicorn workers serve both the HTTP and the websocket ASGI application
+worker_class = env.str("GUNICORN_WORKER_CLASS", default="uvicorn_worker.UvicornWorker")
+workers = env.int("GUNICORN_WORKERS", default=multiprocessing.cpu_count() * 2 + 1)
+threads = env.int("GUNICORN_THREADS", default=1)
+
+# Recycle workers periodically, with jitter so they do not restart together
+max_requests = env.int("GUNICORN_MAX_REQUESTS", default=2000)
+max_requests_jitter = env.int("GUNICORN_MAX_REQUESTS_JITTER", default=200)
+
+# Load the application once in the master and fork the workers from it
+preload_app = env.bool("GUNICORN_PRELOAD_APP", default=True)
+
+# Timeouts
+# ------------------------------------------------------------------------------
+timeout = env.int("GUNICORN_TIMEOUT", default=60)
+graceful_timeout = env.int("GUNICORN_GRACEFUL_TIMEOUT", default=30)
+
+# Keep-alive must outlive the idle timeout of the nginx upstream connections
+keepalive = env.int("GUNICORN_KEEPALIVE", default=75)
+
+# Logging
+# ------------------------------------------------------------------------------
+accesslog = env.str("GUNICORN_ACCESS_LOG", default="-")
+errorlog = env.str("GUNICORN_ERROR_LOG", default="-")
+loglevel = env.str("GUNICORN_LOG_LEVEL", default="info")
+
+# Trust the forwarded headers set by nginx
+forwarded_allow_ips = env.str("GUNICORN_FORWARDED_ALLOW_IPS", default="*")
+
+
+# Server hook called when a worker exits
+def child_exit(server, worker):
+    """Remove the live gauges of a stopped worker from the Prometheus directory.
+
+    Args:
+        server (Arbiter): The gunicorn arbiter.
+        worker (Worker): The worker that exited.
+    """
+
+    # If multiprocess mode is enabled
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        # Import the prometheus multiprocess module
+        from prometheus_client import multiprocess
+
+        # Mark the worker process as dead
+        multiprocess.mark_process_dead(worker.pid)
@@ -5,6 +5,7 @@ import ssl
 from pathlib import Path
 
 import environ
+from kombu import Queue
 
 # Base directory of the Django project
 BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
@@ -49,9 +50,55 @@ DATABASES = {"default": env.db("DATABASE_URL", default="sqlite:///db.sqlite3")}
 DATABASES["default"]["ENGINE"] = env.str(
     "DATABASE_ENGINE", default="django.db.backends.sqlite3"
 )
+# Views using apps.core.mixins.ExplicitTransactionMixin opt out and scope their own writes
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
+# Persistent connections for WSGI and the Celery workers, config.asgi defaults it to 0
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("DATABASE_CONN_MAX_AGE", default=60)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool(
+    "DATABASE_CONN_HEALTH_CHECKS", default=True
+)
+# Set to "transaction" when connecting through pgbouncer in transaction pooling mode
+DATABASE_POOL_MODE = env.str("DATABASE_POOL_MODE", default="session")
+if DATABASE_POOL_MODE == "transaction":
+    # Server-side cursors do not survive across pooled transactions
+    DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Read replicas, added as the replica_<n> aliases
+DATABASE_REPLICA_URLS = env.list("DATABASE_REPLICA_URLS", default=[])
+for index, url in enumerate(DATABASE_REPLICA_URLS):
+    DATABASES[f"replica_{index}"] = {
+        **env.db_url_config(url),
+        "CONN_MAX_AGE": DATABASES["default"]["CONN_MAX_AGE"],
+        "CONN_HEALTH_CHECKS": DATABASES["default"]["CONN_HEALTH_CHECKS"],
+        "TEST": {"MIRROR": "default"},
+    }
+# Dedicated tenant schemas, added as the tenant_<schema> aliases. They connect to the
+# primary with the schema first on the search path, so the shared tables stay visible
+# and a change and its outbox event commit together. Create the schema, its tables with
+# "migrate --database tenant_<schema>", copy the rows of the organization over and set
+# the database of the organization.
+# Connect them directly or through a session pool, pgbouncer in transaction pooling
+# mode drops the search path.
+DATABASE_TENANT_SCHEMAS = env.list("DATABASE_TENANT_SCHEMAS", default=[])
+for schema in DATABASE_TENANT_SCHEMAS:
+    DATABASES[f"tenant_{schema}"] = {
+        **DATABASES["default"],
+        "OPTIONS": {
+            **DATABASES["default"].get("OPTIONS", {}),
+            "options": f"-c search_path={schema},public",
+        },
+    }
+DATABASE_ROUTERS = ["apps.core.routers.ReplicaRouter"]
+# Seconds a client keeps reading from the primary after it wrote
+DATABASE_REPLICA_STICKY_SECONDS = env.int("DATABASE_REPLICA_STICKY_SECONDS", default=15)
+# Seconds an unreachable replica is skipped before it is tried again
+DATABASE_REPLICA_RETRY_SECONDS = env.int("DATABASE_REPLICA_RETRY_SECONDS", default=30)
+# Seconds a process keeps the tenant schema of an organization
+TENANT_DATABASE_CACHE_SECONDS = 60
+# Organization the users signing up join
+DEFAULT_ORGANIZATION_SLUG = env.str("DEFAULT_ORGANIZATION_SLUG", default="default")
+
 # Urls
 # ------------------------------------------------------------------------------
 ROOT_URLCONF = "config.urls"
@@ -80,6 +127,11 @@ THIRD_PARTY_APPS = [
 LOCAL_APPS = [
     "apps.core",
     "apps.accounts",
+    "apps.leads",
+    "apps.campaigns",
+    "apps.api",
+    "apps.webhooks",
+    "apps.notifications",
 ]
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
@@ -113,6 +165,8 @@ AUTH_PASSWORD_VALIDATORS = [
 # Middleware
 # ------------------------------------------------------------------------------
 MIDDLEWARE = [
+    "apps.core.middleware.PrometheusMetricsMiddleware",
+    "apps.core.middleware.ReplicaPinningMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -120,6 +174,8 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.core.middleware.TenantMiddleware",
+    "apps.core.middleware.AuditMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -133,21 +189,32 @@ SESSION_EXPIRE_AT_BROWSER_CLOSE = env.bool(
 
 # Templates
 # ------------------------------------------------------------------------------
+# Templates are compiled once per process by the cached loader, which also
+# resets itself when a template changes under the development autoreloader.
+# Only the context the templates use is built on every render: auth and
+# messages are lazy until read, {% static %} and {% get_current_language %}
+# need no processor, and debug only runs in development.
+TEMPLATE_CONTEXT_PROCESSORS = [
+    "django.template.context_processors.request",
+    "django.contrib.auth.context_processors.auth",
+    "django.contrib.messages.context_processors.messages",
+]
+if DEBUG:
+    TEMPLATE_CONTEXT_PROCESSORS.insert(0, "django.template.context_processors.debug")
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [str(APPS_DIR / "templates")],
-        "APP_DIRS": True,
         "OPTIONS": {
-            "context_processors": [
-                "django.template.context_processors.debug",
-                "django.template.context_processors.request",
-                "django.contrib.auth.context_processors.auth",
-                "django.template.context_processors.i18n",
-                "django.template.context_processors.media",
-                "django.template.context_processors.static",
-                "django.template.context_processors.tz",
-                "django.contrib.messages.context_processors.messages",
+            "context_processors": TEMPLATE_CONTEXT_PROCESSORS,
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
             ],
         },
     },
@@ -188,11 +255,16 @@ MINIO_STORAGE_ENDPOINT = env("MINIO_STORAGE_ENDPOINT", default="localhost:9000")
 MINIO_STORAGE_ACCESS_KEY = env("MINIO_STORAGE_ACCESS_KEY")
 MINIO_STORAGE_SECRET_KEY = env("MINIO_STORAGE_SECRET_KEY")
 MINIO_STORAGE_DOMAIN = env("MINIO_STORAGE_DOMAIN", default="localhost:8080")
+# Host the browser uploads to, presigned URLs are signed for it
+MINIO_STORAGE_PUBLIC_ENDPOINT = env(
+    "MINIO_STORAGE_PUBLIC_ENDPOINT", default="localhost:9000"
+)
 MINIO_STORAGE_USE_HTTPS = False
 
 # AWS S3
 # ------------------------------------------------------------------------------
 AWS_S3_ENDPOINT_URL = f"http://{MINIO_STORAGE_ENDPOINT}"
+AWS_S3_PUBLIC_ENDPOINT_URL = f"http://{MINIO_STORAGE_PUBLIC_ENDPOINT}"
 AWS_ACCESS_KEY_ID = MINIO_STORAGE_ACCESS_KEY
 AWS_SECRET_ACCESS_KEY = MINIO_STORAGE_SECRET_KEY
 AWS_STORAGE_BUCKET_NAME = env("AWS_STORAGE_BUCKET_NAME")
@@ -202,17 +274,102 @@ AWS_DEFAULT_ACL = "private"
 AWS_S3_FILE_OVERWRITE = False
 AWS_QUERYSTRING_AUTH = True
 AWS_S3_CUSTOM_DOMAIN = f"{MINIO_STORAGE_DOMAIN}/minio/storage/{AWS_STORAGE_BUCKET_NAME}"
+AWS_S3_URL_PROTOCOL = "https:" if MINIO_STORAGE_USE_HTTPS else "http:"
+AWS_S3_SIGNED_URL_CACHE_SIZE = env.int("AWS_S3_SIGNED_URL_CACHE_SIZE", default=4096)
+AWS_S3_SIGNED_URL_CACHE_MARGIN = 60
 
 # Static files settings
 # ------------------------------------------------------------------------------
-STATIC_URL = f"http://{MINIO_STORAGE_DOMAIN}/{AWS_STORAGE_BUCKET_NAME}/static/"
-STATICFILES_STORAGE = "config.storage.static.StaticStorage"
+# "local" collects hashed, pre-compressed files into STATIC_ROOT for nginx or a CDN,
+# "minio" uploads the hashed files to the storage bucket
+STATIC_BACKEND = env.str("DJANGO_STATIC_BACKEND", default="local")
+if STATIC_BACKEND == "minio":
+    STATIC_URL = f"http://{MINIO_STORAGE_DOMAIN}/{AWS_STORAGE_BUCKET_NAME}/static/"
+    STATICFILES_STORAGE = "config.storage.static.ManifestStaticStorage"
+else:
+    STATIC_URL = env.str("DJANGO_STATIC_URL", default="/static/")
+    STATIC_ROOT = env.str("DJANGO_STATIC_ROOT", default=str(BASE_DIR / "staticfiles"))
+    STATICFILES_STORAGE = "config.storage.static.LocalStaticStorage"
 
 # Media files settings
 # ------------------------------------------------------------------------------
 MEDIA_URL = f"http://{MINIO_STORAGE_DOMAIN}/{AWS_STORAGE_BUCKET_NAME}/media/"
 DEFAULT_FILE_STORAGE = "config.storage.media.MediaStorage"
 
+# Direct uploads
+# ------------------------------------------------------------------------------
+# Files are uploaded from the browser straight to the bucket, larger files in parts
+LEADS_UPLOAD_MAX_SIZE = env.int("LEADS_UPLOAD_MAX_SIZE", default=1024 * 1024 * 1024)
+LEADS_UPLOAD_MULTIPART_THRESHOLD = env.int(
+    "LEADS_UPLOAD_MULTIPART_THRESHOLD", default=64 * 1024 * 1024
+)
+LEADS_UPLOAD_PART_SIZE = env.int("LEADS_UPLOAD_PART_SIZE", default=16 * 1024 * 1024)
+LEADS_UPLOAD_URL_EXPIRE = 60 * 60
+
+# Previews
+# ------------------------------------------------------------------------------
+# Bounding boxes of the previews rendered for uploaded images and PDFs
+LEADS_PREVIEW_SIZES = {"thumbnail": (256, 256), "preview": (1024, 1024)}
+LEADS_PREVIEW_MAX_SOURCE_SIZE = env.int(
+    "LEADS_PREVIEW_MAX_SOURCE_SIZE", default=50 * 1024 * 1024
+)
+# Seconds a preview may render before the task gives up on the file
+LEADS_PREVIEW_TIMEOUT = 60
+
+# Blobs
+# ------------------------------------------------------------------------------
+# Seconds an unreferenced blob is kept before it is purged
+LEADS_BLOB_PURGE_GRACE = env.int("LEADS_BLOB_PURGE_GRACE", default=24 * 60 * 60)
+
+# Sync
+# ------------------------------------------------------------------------------
+# On PostgreSQL syncs stop below the first version still in flight. Other databases
+# stop at the last version saved this many seconds ago, so a transaction that took an
+# earlier version but commits later is never skipped by an advanced cursor
+LEADS_SYNC_SETTLE_SECONDS = env.int("LEADS_SYNC_SETTLE_SECONDS", default=5)
+# Seconds a sync cursor is accepted, older clients start over with a full sync
+LEADS_SYNC_CURSOR_MAX_AGE = env.int(
+    "LEADS_SYNC_CURSOR_MAX_AGE", default=30 * 24 * 60 * 60
+)
+
+# Archive
+# ------------------------------------------------------------------------------
+# Seconds a won or lost lead stays active after its last change
+LEADS_ARCHIVE_CLOSED_AFTER = env.int(
+    "LEADS_ARCHIVE_CLOSED_AFTER", default=90 * 24 * 60 * 60
+)
+# Seconds any lead stays active after its last change
+LEADS_ARCHIVE_STALE_AFTER = env.int(
+    "LEADS_ARCHIVE_STALE_AFTER", default=365 * 24 * 60 * 60
+)
+# Leads archived per transaction
+LEADS_ARCHIVE_BATCH_SIZE = 500
+
+# Reminders
+# ------------------------------------------------------------------------------
+# Seconds of due reminders kept in Redis, loaded every REMINDERS_LOAD_INTERVAL seconds
+REMINDERS_WINDOW = env.int("REMINDERS_WINDOW", default=6 * 60 * 60)
+REMINDERS_LOAD_INTERVAL = 15 * 60
+# Seconds between the runs popping the due reminders
+REMINDERS_TICK = env.int("REMINDERS_TICK", default=10)
+# Reminders popped and sent per transaction
+REMINDERS_BATCH_SIZE = 500
+# Seconds a worker holds the reminders it popped before they are popped again,
+# longer than CELERY_TASK_TIME_LIMIT
+REMINDERS_CLAIM_TIMEOUT = 10 * 60
+
+# Notifications
+# ------------------------------------------------------------------------------
+# Seconds a notification stays unread before it is emailed in a digest
+NOTIFICATIONS_DIGEST_DELAY = env.int("NOTIFICATIONS_DIGEST_DELAY", default=60 * 60)
+NOTIFICATIONS_DIGEST_INTERVAL = 15 * 60
+# Users emailed a digest per transaction
+NOTIFICATIONS_DIGEST_BATCH_SIZE = 200
+# Seconds the unread counters are cached, a counter drifting apart heals on expiry
+NOTIFICATIONS_UNREAD_TIMEOUT = 24 * 60 * 60
+# Notifications per page of the notification list
+NOTIFICATIONS_PAGE_SIZE = 50
+
 # Static files finders and directories
 # ------------------------------------------------------------------------------
 STATICFILES_DIRS = [str(APPS_DIR / "static")]
@@ -247,7 +404,12 @@ if USE_TZ:
 CELERY_BROKER_URL = env("CELERY_BROKER_URL")
 CELERY_BROKER_USE_SSL = {"ssl_cert_reqs": ssl.CERT_NONE} if REDIS_SSL else None
 CELERY_RESULT_BACKEND = CELERY_BROKER_URL
-CELERY_RESULT_EXTENDED = True
+# Results are only stored for tasks declaring ignore_result=False and whose callers read
+# them, long jobs report progress through apps.core.progress.TaskProgress instead
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_RESULT_EXTENDED = False
+CELERY_RESULT_EXPIRES = env.int("CELERY_RESULT_EXPIRES", default=60 * 60)
+CELERY_PROGRESS_TIMEOUT = 60 * 60
 CELERY_RESULT_BACKEND_ALWAYS_RETRY = True
 CELERY_RESULT_BACKEND_MAX_RETRIES = 10
 CELERY_ACCEPT_CONTENT = ["json"]
@@ -255,14 +417,133 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TASK_TIME_LIMIT = 5 * 60
 CELERY_TASK_SOFT_TIME_LIMIT = 60
+# Seconds the tasks of the bulk queue may run, set on the tasks as they walk whole tables
+# in batches. The worker of the exports queue has its own limits (see docker-compose.yml)
+BULK_TASK_TIME_LIMIT = env.int("BULK_TASK_TIME_LIMIT", default=60 * 60)
 CELERY_WORKER_SEND_TASK_EVENTS = True
 CELERY_TASK_SEND_SENT_EVENT = True
 CELERY_TASK_EAGER_PROPAGATES = True
+# Queues, every queue is consumed by its own worker pool (see docker-compose.yml):
+# email is latency sensitive, media is CPU bound, bulk and exports run for minutes to hours,
+# webhooks wait on customer endpoints
+CELERY_TASK_QUEUES = (
+    Queue("email"),
+    Queue("default"),
+    Queue("media"),
+    Queue("bulk"),
+    Queue("exports"),
+    Queue("webhooks"),
+)
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_ROUTES = {
+    "djcelery_email_send_multiple": {"queue": "email", "priority": 0},
+    "apps.leads.tasks.store_blob": {"queue": "media"},
+    "apps.leads.tasks.generate_previews": {"queue": "media"},
+    "apps.leads.tasks.purge_orphaned_blobs": {"queue": "bulk"},
+    "apps.leads.tasks.purge_lead_tombstones": {"queue": "bulk"},
+    "apps.leads.tasks.archive_stale_leads": {"queue": "bulk"},
+    "apps.core.tasks.purge_outbox_events": {"queue": "bulk"},
+    "apps.core.tasks.maintain_audit_log": {"queue": "bulk"},
+    "apps.notifications.tasks.send_notification_digests": {"queue": "bulk"},
+    "apps.campaigns.tasks.*": {"queue": "bulk"},
+    "apps.webhooks.tasks.*": {"queue": "webhooks"},
+    "apps.*.tasks.import_*": {"queue": "bulk"},
+    "apps.*.tasks.export_*": {"queue": "exports"},
+}
+# Priorities go from 0 (highest) to 9 on the Redis broker
+CELERY_TASK_DEFAULT_PRIORITY = 5
+CELERY_TASK_QUEUE_MAX_PRIORITY = 9
+# Reserve one task per process and acknowledge it after it ran, so a long task never
+# holds prefetched messages back and a lost worker's task is redelivered
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_ACKS_LATE = True
+# Unacknowledged messages are redelivered after the visibility timeout, so it must
+# exceed the longest task (exports run for up to 2 hours). A worker consuming several
+# queues drains them strictly in the order given to -Q, so email always goes first.
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "visibility_timeout": env.int("CELERY_VISIBILITY_TIMEOUT", default=3 * 60 * 60),
+    "priority_steps": list(range(10)),
+    "sep": ":",
+    "queue_order_strategy": "priority",
+}
+CELERY_BEAT_SCHEDULE = {
+    "purge-orphaned-blobs": {
+        "task": "apps.leads.tasks.purge_orphaned_blobs",
+        "schedule": 60 * 60,
+    },
+    "purge-lead-tombstones": {
+        "task": "apps.leads.tasks.purge_lead_tombstones",
+        "schedule": 24 * 60 * 60,
+    },
+    "archive-stale-leads": {
+        "task": "apps.leads.tasks.archive_stale_leads",
+        "schedule": 24 * 60 * 60,
+    },
+    "load-reminders": {
+        "task": "apps.leads.tasks.load_reminders",
+        "schedule": REMINDERS_LOAD_INTERVAL,
+    },
+    "dispatch-reminders": {
+        "task": "apps.leads.tasks.dispatch_reminders",
+        "schedule": REMINDERS_TICK,
+        "options": {"expires": REMINDERS_TICK},
+    },
+    "send-notification-digests": {
+        "task": "apps.notifications.tasks.send_notification_digests",
+        "schedule": NOTIFICATIONS_DIGEST_INTERVAL,
+    },
+    "dispatch-outbox": {
+        "task": "apps.core.tasks.dispatch_outbox",
+        "schedule": 60,
+    },
+    "purge-outbox-events": {
+        "task": "apps.core.tasks.purge_outbox_events",
+        "schedule": 24 * 60 * 60,
+    },
+    "maintain-audit-log": {
+        "task": "apps.core.tasks.maintain_audit_log",
+        "schedule": 24 * 60 * 60,
+    },
+    "resume-campaigns": {
+        "task": "apps.campaigns.tasks.resume_campaigns",
+        "schedule": 5 * 60,
+    },
+    "dispatch-webhooks": {
+        "task": "apps.webhooks.tasks.dispatch_webhooks",
+        "schedule": 60,
+    },
+    "purge-webhook-deliveries": {
+        "task": "apps.webhooks.tasks.purge_webhook_deliveries",
+        "schedule": 24 * 60 * 60,
+    },
+}
 CELERY_EMAIL_TASK_CONFIG = {
     "rate_limit": "50/m",
-    "ignore_result": True,
 }
 
+# Outbox
+# ------------------------------------------------------------------------------
+# Events published per task by the outbox sweep
+OUTBOX_BATCH_SIZE = env.int("OUTBOX_BATCH_SIZE", default=500)
+# Seconds after which the sweep publishes an event missed after its commit
+OUTBOX_DISPATCH_DELAY = 60
+# Seconds dispatched events are kept
+OUTBOX_RETENTION = 3 * 24 * 60 * 60
+
+# Audit Log
+# ------------------------------------------------------------------------------
+# Entries a request or task buffers before it queues them
+AUDIT_BUFFER_SIZE = env.int("AUDIT_BUFFER_SIZE", default=200)
+# Monthly partitions created ahead of the current month
+AUDIT_PARTITIONS_AHEAD = 3
+# Months kept in the database before they are archived to the media storage
+AUDIT_RETENTION_MONTHS = env.int("AUDIT_RETENTION_MONTHS", default=12)
+
+# Prometheus
+# ------------------------------------------------------------------------------
+# Multiprocess mode is enabled by exporting PROMETHEUS_MULTIPROC_DIR before start
+PROMETHEUS_CELERY_WORKER_PORT = env.int("PROMETHEUS_CELERY_WORKER_PORT", default=9808)
+
 # Email
 # ------------------------------------------------------------------------------
 EMAIL_BACKEND = env.str(
@@ -273,6 +554,45 @@ EMAIL_PORT = env("DJANGO_EMAIL_PORT")
 DEFAULT_FROM_EMAIL = env("DJANGO_DEFAULT_FROM_EMAIL")
 EMAIL_TIMEOUT = 5
 
+# Campaigns
+# ------------------------------------------------------------------------------
+CAMPAIGN_BATCH_SIZE = env.int("CAMPAIGN_BATCH_SIZE", default=200)
+CAMPAIGN_PARALLEL_BATCHES = env.int("CAMPAIGN_PARALLEL_BATCHES", default=2)
+# Seconds after which the recipients claimed by a lost worker are recovered, a batch
+# runs for less
+CAMPAIGN_CLAIM_TIMEOUT = 15 * 60
+# Messages per minute and recipient domain, shared by all workers
+CAMPAIGN_DOMAIN_RATE_LIMIT = env.int("CAMPAIGN_DOMAIN_RATE_LIMIT", default=60)
+CAMPAIGN_DOMAIN_RATE_LIMITS = {"gmail.com": 120, "outlook.com": 60, "yahoo.com": 60}
+# Sink mode delivers every campaign message to a local SMTP sink such as mailpit
+CAMPAIGN_EMAIL_SINK = env.bool("CAMPAIGN_EMAIL_SINK", default=DEBUG)
+CAMPAIGN_SINK_HOST = env.str("CAMPAIGN_SINK_HOST", default="mailpit-service")
+CAMPAIGN_SINK_PORT = env.int("CAMPAIGN_SINK_PORT", default=1025)
+
+# API
+# ------------------------------------------------------------------------------
+API_PAGE_SIZE = env.int("API_PAGE_SIZE", default=50)
+API_MAX_PAGE_SIZE = 200
+# Seconds a verified API key is cached, revoking a key drops it right away
+API_KEY_CACHE_TIMEOUT = env.int("API_KEY_CACHE_TIMEOUT", default=5 * 60)
+
+# Webhooks
+# ------------------------------------------------------------------------------
+# Events posted per request to an endpoint
+WEBHOOK_BATCH_SIZE = env.int("WEBHOOK_BATCH_SIZE", default=100)
+# Failed attempts after which an event is dead lettered
+WEBHOOK_MAX_ATTEMPTS = env.int("WEBHOOK_MAX_ATTEMPTS", default=8)
+# Seconds a failing endpoint waits, doubled per failure up to the maximum
+WEBHOOK_BACKOFF_BASE = 30
+WEBHOOK_BACKOFF_MAX = 6 * 60 * 60
+# Seconds to connect to an endpoint and to wait for its answer
+WEBHOOK_CONNECT_TIMEOUT = 3
+WEBHOOK_READ_TIMEOUT = 10
+# Endpoint hosts kept connected per worker process
+WEBHOOK_POOL_SIZE = 50
+# Seconds delivered events are kept
+WEBHOOK_RETENTION = 7 * 24 * 60 * 60
+
 # Django CORS Headers
 # -------------------------------------------------------------------------------
 CORS_URLS_REGEX = r"^/api/.*$"
@@ -1,7 +1,162 @@
 # Imports
+import os
+import threading
+import time
+from collections import OrderedDict
+
 from django.conf import settings
 from storages.backends.s3boto3 import S3Boto3Storage
 
+# Boto3 clients shared by the storages of a process, clients are thread safe
+_shared_connections: dict[tuple, object] = {}
+_shared_connections_lock = threading.Lock()
+
+# Boto3 resources of the current thread, resources are not thread safe
+_thread_connections = threading.local()
+
+
+# Function to get a connection shared by the process
+def get_shared_connection(key: tuple, factory):
+    """Get a boto3 connection shared by the storages of the process.
+
+    Creating a session and client loads the botocore service models, so it is
+    done once per process instead of once per storage instance and thread.
+
+    Args:
+        key (tuple): The key of the connection settings.
+        factory (callable): The function creating the connection.
+
+    Returns:
+        object: The shared connection.
+    """
+
+    # Keep forked processes apart
+    key = (os.getpid(), *key)
+
+    # Get the shared connection
+    connection = _shared_connections.get(key)
+
+    # If the connection does not exist yet
+    if connection is None:
+        with _shared_connections_lock:
+            connection = _shared_connections.get(key)
+            if connection is None:
+                # Create the connection
+                connection = _shared_connections[key] = factory()
+
+    # Return the connection
+    return connection
+
+
+# Function to get a connection of the current thread
+def get_thread_connection(key: tuple, factory):
+    """Get a boto3 connection shared by the storages of the current thread.
+
+    Args:
+        key (tuple): The key of the connection settings.
+        factory (callable): The function creating the connection.
+
+    Returns:
+        object: The connection of the thread.
+    """
+
+    # Keep forked processes apart
+    key = (os.getpid(), *key)
+
+    # Get the connections of the thread
+    connections = getattr(_thread_connections, "connections", None)
+    if connections is None:
+        connections = _thread_connections.connections = {}
+
+    # If the connection does not exist yet, create it
+    connection = connections.get(key)
+    if connection is None:
+        connection = connections[key] = factory()
+
+    # Return the connection
+    return connection
+
+
+# Signed URL Cache
+class SignedUrlCache:
+    """Signed URL Cache
+
+    Process local LRU cache of presigned URLs. A URL is reused until shortly
+    before it expires, so rendering the same files again skips the signing.
+
+    Attributes:
+        maxsize (int): The maximum number of cached URLs.
+        margin (int): The seconds before expiry after which a URL is re-signed.
+
+    Methods:
+        get(key): Get a cached URL that is still valid.
+        set(key, url, expire): Cache a URL signed for expire seconds.
+    """
+
+    # Constructor
+    def __init__(self, maxsize: int = 4096, margin: int = 60):
+        # Set the attributes
+        self.maxsize = maxsize
+        self.margin = margin
+        self._urls = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Method to get a cached URL
+    def get(self, key: tuple) -> str | None:
+        """Get a cached URL that is still valid.
+
+        Args:
+            key (tuple): The cache key.
+
+        Returns:
+            str | None: The URL, or None if it is missing or about to expire.
+        """
+
+        # Get the cached entry
+        with self._lock:
+            entry = self._urls.get(key)
+
+            # If the entry is missing
+            if entry is None:
+                return None
+
+            # If the entry is about to expire
+            url, valid_until = entry
+            if valid_until <= time.monotonic():
+                del self._urls[key]
+                return None
+
+            # Mark the entry as recently used and return the URL
+            self._urls.move_to_end(key)
+            return url
+
+    # Method to cache a URL
+    def set(self, key: tuple, url: str, expire: int):
+        """Cache a URL signed for expire seconds.
+
+        Args:
+            key (tuple): The cache key.
+            url (str): The signed URL.
+            expire (int): The expiry time of the URL in seconds.
+        """
+
+        # Keep short lived URLs for at most half of their lifetime
+        margin = min(self.margin, expire // 2)
+
+        # Cache the URL and evict the least recently used entries
+        with self._lock:
+            self._urls[key] = (url, time.monotonic() + expire - margin)
+            self._urls.move_to_end(key)
+            while len(self._urls) > self.maxsize:
+                self._urls.popitem(last=False)
+
+
+# Cache of the signed URLs of the process
+signed_url_cache = SignedUrlCache(
+    maxsize=getattr(settings, "AWS_S3_SIGNED_URL_CACHE_SIZE", 4096),
+    margin=getattr(settings, "AWS_S3_SIGNED_URL_CACHE_MARGIN", 60),
+)
+
 
 # Custom S3 Boto3 Storage
 class CustomS3Boto3Storage(S3Boto3Storage):
@@ -16,8 +171,14 @@ class CustomS3Boto3Storage(S3Boto3Storage):
         endpoint_url (str): The endpoint URL of the S3 bucket.
         custom_domain (str): The custom domain of the S3 bucket.
 
+    Properties:
+        connection (ServiceResource): The boto3 resource of the current thread.
+        client (S3.Client): The boto3 client shared by the process.
+
     Methods:
-        url(name, parameters=None, expire=None): Get the URL of the file.
+        get_connection_key(kind): Get the key of the connection settings.
+        url(name, parameters=None, expire=None, http_method=None): Get the URL of the file.
+        sign_url(name, parameters, expire, http_method): Sign the URL of the file.
     """
 
     # Constructor
@@ -29,33 +190,144 @@ class CustomS3Boto3Storage(S3Boto3Storage):
         self.endpoint_url = settings.AWS_S3_ENDPOINT_URL
         self.custom_domain = settings.AWS_S3_CUSTOM_DOMAIN
 
+    # Method to get the key of the connection settings
+    def get_connection_key(self, kind: str) -> tuple:
+        """Get the key of the connection settings of the storage.
+
+        Args:
+            kind (str): The kind of connection, resource or client.
+
+        Returns:
+            tuple: The key.
+        """
+
+        # Return the key
+        return (
+            kind,
+            self.endpoint_url,
+            self.access_key,
+            self.region_name,
+            self.signature_version,
+            self.addressing_style,
+        )
+
+    # Property to get the boto3 resource of the thread
+    @property
+    def connection(self):
+        """Get the boto3 resource shared by the storages of the current thread.
+
+        Resources are not thread safe, so every thread creates its own once.
+
+        Returns:
+            ServiceResource: The boto3 S3 resource.
+        """
+
+        # Return the connection of the thread
+        return get_thread_connection(
+            self.get_connection_key("resource"),
+            lambda: self._create_session().resource(
+                "s3",
+                region_name=self.region_name,
+                use_ssl=self.use_ssl,
+                endpoint_url=self.endpoint_url,
+                config=self.client_config,
+                verify=self.verify,
+            ),
+        )
+
+    # Property to get the shared boto3 client
+    @property
+    def client(self):
+        """Get the boto3 client shared by the storages of the process.
+
+        Returns:
+            S3.Client: The boto3 S3 client.
+        """
+
+        # Return the shared client
+        return get_shared_connection(
+            self.get_connection_key("client"),
+            lambda: self._create_session().client(
+                "s3",
+                region_name=self.region_name,
+                use_ssl=self.use_ssl,
+                endpoint_url=self.endpoint_url,
+                config=self.client_config,
+                verify=self.verify,
+            ),
+        )
+
     # Method to return the URL of the file
     def url(
         self,
         name: str | None,
         parameters: dict | None = None,
         expire: int | None = None,
+        http_method: str | None = None,
     ):
         """Get the URL of the file.
 
-        This method returns the URL of the file.
+        Presigned URLs are cached per process and reused until shortly before
+        they expire.
 
         Args:
             name (str | None): The name of the file.
             parameters (dict | None): The parameters of the URL.
             expire (int | None): The expiry time of the URL.
+            http_method (str | None): The HTTP method the URL is signed for.
 
         Returns:
             str: The URL of the file.
         """
 
-        # Get the URL
-        url = super().url(name, parameters, expire)
+        # If the URL is not signed by boto3, building it is cheap
+        if not self.querystring_auth or self.custom_domain:
+            return super().url(name, parameters, expire, http_method)
+
+        # Get the expiry time of the URL
+        expire = self.querystring_expire if expire is None else expire
+
+        # Build the cache key
+        key = (
+            self.bucket_name,
+            self.location,
+            name,
+            tuple(sorted((parameters or {}).items())),
+            expire,
+            http_method,
+        )
 
-        # If the urls starts with https
-        if url.startswith("https"):
-            # Replace https with http
-            url = "http" + url[5:]
+        # Get the cached URL
+        url = signed_url_cache.get(key)
+
+        # If the URL is not cached
+        if url is None:
+            # Sign and cache the URL
+            url = self.sign_url(name, parameters, expire, http_method)
+            signed_url_cache.set(key, url, expire)
 
         # Return the URL
         return url
+
+    # Method to sign the URL of the file
+    def sign_url(
+        self,
+        name: str | None,
+        parameters: dict | None,
+        expire: int,
+        http_method: str | None,
+    ) -> str:
+        """Sign the URL of the file with the storage connection.
+
+        Args:
+            name (str | None): The name of the file.
+            parameters (dict | None): The parameters of the URL.
+            expire (int): The expiry time of the URL.
+            http_method (str | None): The HTTP method the URL is signed for.
+
+        Returns:
+            str: The presigned URL.
+        """
+
+        # Return the URL signed by boto3
+        return super().url(name, parameters, expire, http_method)
@@ -1,5 +1,9 @@
 # Imports
-from config.storage.base import CustomS3Boto3Storage
+from botocore.exceptions import ClientError
+from django.conf import settings
+from storages.utils import clean_name
+
+from config.storage.base import CustomS3Boto3Storage, get_shared_connection
 
 
 # Custom storage backend for media files
@@ -8,6 +12,9 @@ class MediaStorage(CustomS3Boto3Storage):
 
     CustomMediaStorage class is used to create a custom storage backend for media files.
 
+    Besides the regular storage API, it issues presigned POST and multipart URLs
+    so browsers upload straight to the bucket without passing through Django.
+
     Extends:
         CustomS3Boto3Storage
 
@@ -15,9 +22,357 @@ class MediaStorage(CustomS3Boto3Storage):
         location (str): The location of the media files.
         default_acl (str): The default ACL for the media files.
         file_overwrite (bool): Whether to overwrite the file if it already exists.
+
+    Properties:
+        public_client (S3.Client): The client signing URLs for the browser.
+
+    Methods:
+        sign_url(name, parameters, expire, http_method): Sign the URL of the file.
+        presigned_post(name, content_type, max_size, expire=None): Get a presigned POST form.
+        create_multipart_upload(name, content_type): Start a multipart upload.
+        presigned_part_url(name, upload_id, part_number, expire=None): Get a part upload URL.
+        list_parts(name, upload_id): List the uploaded parts.
+        complete_multipart_upload(name, upload_id): Complete a multipart upload.
+        abort_multipart_upload(name, upload_id): Abort a multipart upload.
+        head(name): Get the metadata of a file.
+        iter_chunks(name, chunk_size): Stream the content of a file.
+        copy(source, target): Copy a file inside the bucket.
     """
 
     # Attributes
     location = "media"
     default_acl = "private"
     file_overwrite = False
+
+    # Constructor
+    def __init__(self, *args, **kwargs):
+        # Call the parent constructor
+        super().__init__(*args, **kwargs)
+
+        # Media files are private, their URLs are signed instead of served by the domain
+        self.custom_domain = None
+
+    # Property to get the client signing URLs for the browser
+    @property
+    def public_client(self):
+        """Get the client signing URLs for the browser.
+
+        The signature of a presigned URL covers the host, so the URLs handed to
+        the browser are signed for the public MinIO endpoint.
+
+        Returns:
+            S3.Client: The boto3 S3 client.
+        """
+
+        # Return the shared client
+        return get_shared_connection(
+            (
+                "public_client",
+                settings.AWS_S3_PUBLIC_ENDPOINT_URL,
+                self.access_key,
+                self.region_name,
+                self.signature_version,
+            ),
+            lambda: self._create_session().client(
+                "s3",
+                region_name=self.region_name,
+                endpoint_url=settings.AWS_S3_PUBLIC_ENDPOINT_URL,
+                config=self.client_config,
+                verify=self.verify,
+            ),
+        )
+
+    # Method to get the key of a file
+    def get_key(self, name: str) -> str:
+        """Get the bucket key of a file.
+
+        Args:
+            name (str): The name of the file.
+
+        Returns:
+            str: The bucket key.
+        """
+
+        # Return the normalized key
+        return self._normalize_name(clean_name(name))
+
+    # Method to sign the URL of the file
+    def sign_url(
+        self,
+        name: str | None,
+        parameters: dict | None,
+        expire: int,
+        http_method: str | None,
+    ) -> str:
+        """Sign the URL of the file for the browser.
+
+        Args:
+            name (str | None): The name of the file.
+            parameters (dict | None): The parameters of the URL.
+            expire (int): The expiry time of the URL.
+            http_method (str | None): The HTTP method the URL is signed for.
+
+        Returns:
+            str: The presigned GET URL on the public endpoint.
+        """
+
+        # Return the presigned URL
+        return self.public_client.generate_presigned_url(
+            "get_object",
+            Params={
+                **(parameters or {}),
+                "Bucket": self.bucket_name,
+                "Key": self.get_key(name),
+            },
+            ExpiresIn=expire,
+            HttpMethod=http_method,
+        )
+
+    # Method to get a presigned POST form
+    def presigned_post(
+        self, name: str, content_type: str, max_size: int, expire: int | None = None
+    ) -> dict:
+        """Get a presigned POST form to upload a file from the browser.
+
+        Args:
+            name (str): The name of the file.
+            content_type (str): The content type of the file.
+            max_size (int): The maximum size of the file in bytes.
+            expire (int | None): The expiry time of the form in seconds.
+
+        Returns:
+            dict: The URL and the fields of the form.
+        """
+
+        # Return the presigned form
+        return self.public_client.generate_presigned_post(
+            Bucket=self.bucket_name,
+            Key=self.get_key(name),
+            Fields={"Content-Type": content_type, "acl": self.default_acl},
+            Conditions=[
+                {"Content-Type": content_type},
+                {"acl": self.default_acl},
+                ["content-length-range", 1, max_size],
+            ],
+            ExpiresIn=expire or self.querystring_expire,
+        )
+
+    # Method to start a multipart upload
+    def create_multipart_upload(self, name: str, content_type: str) -> str:
+        """Start a multipart upload.
+
+        Args:
+            name (str): The name of the file.
+            content_type (str): The content type of the file.
+
+        Returns:
+            str: The upload id.
+        """
+
+        # Start the upload and return its id
+        response = self.client.create_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=self.get_key(name),
+            ContentType=content_type,
+            ACL=self.default_acl,
+        )
+        return response["UploadId"]
+
+    # Method to get a part upload URL
+    def presigned_part_url(
+        self, name: str, upload_id: str, part_number: int, expire: int | None = None
+    ) -> str:
+        """Get a presigned URL to upload a part from the browser.
+
+        Args:
+            name (str): The name of the file.
+            upload_id (str): The upload id.
+            part_number (int): The number of the part, starting at 1.
+            expire (int | None): The expiry time of the URL in seconds.
+
+        Returns:
+            str: The presigned PUT URL.
+        """
+
+        # Return the presigned URL
+        return self.public_client.generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": self.bucket_name,
+                "Key": self.get_key(name),
+                "UploadId": upload_id,
+                "PartNumber": part_number,
+            },
+            ExpiresIn=expire or self.querystring_expire,
+        )
+
+    # Method to list the uploaded parts
+    def list_parts(self, name: str, upload_id: str) -> list[dict]:
+        """List the parts uploaded so far.
+
+        Args:
+            name (str): The name of the file.
+            upload_id (str): The upload id.
+
+        Returns:
+            list[dict]: The PartNumber, ETag and Size of every uploaded part.
+        """
+
+        # Traverse through the pages of parts
+        paginator = self.client.get_paginator("list_parts")
+        pages = paginator.paginate(
+            Bucket=self.bucket_name, Key=self.get_key(name), UploadId=upload_id
+        )
+
+        # Return the parts
+        return [
+            {
+                "PartNumber": part["PartNumber"],
+                "ETag": part["ETag"],
+                "Size": part["Size"],
+            }
+            for page in pages
+            for part in page.get("Parts", ())
+        ]
+
+    # Method to complete a multipart upload
+    def complete_multipart_upload(self, name: str, upload_id: str):
+        """Complete a multipart upload with the parts uploaded so far.
+
+        Args:
+            name (str): The name of the file.
+            upload_id (str): The upload id.
+        """
+
+        # Get the uploaded parts
+        parts = [
+            {"PartNumber": part["PartNumber"], "ETag": part["ETag"]}
+            for part in self.list_parts(name, upload_id)
+        ]
+
+        # Complete the upload
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=self.get_key(name),
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+    # Method to abort a multipart upload
+    def abort_multipart_upload(self, name: str, upload_id: str):
+        """Abort a multipart upload and drop its parts.
+
+        Args:
+            name (str): The name of the file.
+            upload_id (str): The upload id.
+        """
+
+        # Abort the upload
+        self.client.abort_multipart_upload(
+            Bucket=self.bucket_name, Key=self.get_key(name), UploadId=upload_id
+        )
+
+    # Method to get the metadata of a file
+    def head(self, name: str) -> dict | None:
+        """Get the metadata of a file.
+
+        Args:
+            name (str): The name of the file.
+
+        Returns:
+            dict | None: The object metadata, or None if the file does not exist.
+        """
+
+        # Get the metadata
+        try:
+            return self.client.head_object(
+                Bucket=self.bucket_name, Key=self.get_key(name)
+            )
+
+        # If the file does not exist
+        except ClientError as error:
+            if error.response["ResponseMetadata"]["HTTPStatusCode"] == 404:
+                return None
+            raise
+
+    # Method to stream the content of a file
+    def iter_chunks(self, name: str, chunk_size: int = 1024 * 1024):
+        """Stream the content of a file without buffering it on disk.
+
+        Args:
+            name (str): The name of the file.
+            chunk_size (int): The size of the chunks in bytes.
+
+        Yields:
+            bytes: The chunks of the file.
+        """
+
+        # Get the object body
+        response = self.client.get_object(
+            Bucket=self.bucket_name, Key=self.get_key(name)
+        )
+
+        # Yield the chunks
+        yield from response["Body"].iter_chunks(chunk_size)
+
+    # Method to copy a file inside the bucket
+    def copy(self, source: str, target: str):
+        """Copy a file inside the bucket, without downloading it.
+
+        Args:
+            source (str): The name of the file to copy.
+            target (str): The name of the copy.
+        """
+
+        # Copy the object, in parts for large files
+        self.client.copy(
+            {"Bucket": self.bucket_name, "Key": self.get_key(source)},
+            self.bucket_name,
+            self.get_key(target),
+            ExtraArgs={"ACL": self.default_acl},
+        )
+
+
+# Content addressed storage backend for media files
+class BlobStorage(MediaStorage):
+    """Blob Storage
+
+    Stores files under the SHA-256 of their content. A name always holds the
+    same content, so saving a file that already exists skips the upload.
+
+    Extends:
+        MediaStorage
+
+    Attributes:
+        file_overwrite (bool): Whether to overwrite the file if it already exists.
+
+    Methods:
+        blob_name(sha256): Get the name of a blob.
+    """
+
+    # Attributes
+    file_overwrite = True
+
+    # Method to get the name of a blob
+    @staticmethod
+    def blob_name(sha256: str) -> str:
+        """Get the name of a blob, fanned out over nested folders.
+
+        Args:
+            sha256 (str): The SHA-256 of the content.
+
+        Returns:
+            str: The name of the blob.
+        """
+
+        # Return the name
+        return f"blobs/{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+    # Method to save a file
+    def _save(self, name, content):
+        # If the content is stored already
+        if self.exists(name):
+            return name
+
+        # Upload the content
+        return super()._save(name, content)
@@ -1,8 +1,21 @@
 # Imports
+import gzip
 import mimetypes
 
+from django.contrib.staticfiles.storage import (
+    ManifestFilesMixin,
+    ManifestStaticFilesStorage,
+)
+from django.core.files.base import ContentFile
+
 from config.storage.base import CustomS3Boto3Storage
 
+# Brotli is optional, without it only gzip copies are written
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
 
 # Custom storage backend for static files
 class StaticStorage(CustomS3Boto3Storage):
@@ -26,3 +39,120 @@ class StaticStorage(CustomS3Boto3Storage):
     location = "static"
     default_acl = "private"
     file_overwrite = False
+
+
+# Hashed storage backend for static files on MinIO
+class ManifestStaticStorage(ManifestFilesMixin, StaticStorage):
+    """Manifest Static Storage
+
+    Stores the static files on MinIO under content-hashed names, so they can be
+    cached by browsers and CDNs forever.
+
+    Extends:
+        ManifestFilesMixin
+        StaticStorage
+    """
+
+
+# Mixin to pre-compress the static files
+class CompressedStaticFilesMixin:
+    """Compressed Static Files Mixin
+
+    Writes .gz and .br copies of the hashed text assets during collectstatic, so
+    nginx serves them with gzip_static/brotli_static without compressing on every
+    request. Hashed names change with the content, so an existing copy is never
+    compressed twice.
+
+    Attributes:
+        compressible_types (tuple[str]): The content types to compress.
+        min_compress_size (int): The minimum size of a file to compress.
+
+    Methods:
+        post_process: Compress the hashed files after they are written.
+        compress: Write the compressed copies of a file.
+    """
+
+    # Attributes
+    compressible_types = (
+        "text/",
+        "application/javascript",
+        "application/json",
+        "application/xml",
+        "image/svg+xml",
+        "image/vnd.microsoft.icon",
+    )
+    min_compress_size = 256
+
+    # Method to compress the hashed files
+    def post_process(self, *args, **kwargs):
+        """Compress the hashed files after they are written.
+
+        Yields:
+            tuple: The original name, hashed name and processed status.
+        """
+
+        # Traverse through the processed files
+        for name, hashed_name, processed in super().post_process(*args, **kwargs):
+            # If the file was hashed successfully
+            if hashed_name and not isinstance(processed, Exception):
+                # Compress the hashed file
+                self.compress(hashed_name)
+
+            # Yield the processed file
+            yield name, hashed_name, processed
+
+    # Method to write the compressed copies of a file
+    def compress(self, name: str):
+        """Write the compressed copies of a file.
+
+        Args:
+            name (str): The name of the file.
+        """
+
+        # If the file type is not compressible
+        content_type, _ = mimetypes.guess_type(name)
+        if not content_type or not content_type.startswith(self.compressible_types):
+            return
+
+        # Get the encoders to use
+        encoders = {"gz": lambda data: gzip.compress(data, mtime=0)}
+        if brotli is not None:
+            encoders["br"] = brotli.compress
+
+        # Skip the encoders that already wrote a copy
+        encoders = {
+            suffix: encode
+            for suffix, encode in encoders.items()
+            if not self.exists(f"{name}.{suffix}")
+        }
+        if not encoders:
+            return
+
+        # Read the file
+        with self.open(name) as file:
+            data = file.read()
+
+        # If the file is too small to benefit from compression
+        if len(data) < self.min_compress_size:
+            return
+
+        # Traverse through the encoders
+        for suffix, encode in encoders.items():
+            # Save the compressed copy if it is smaller
+            compressed = encode(data)
+            if len(compressed) < len(data):
+                self._save(f"{name}.{suffix}", ContentFile(compressed))
+
+
+# Hashed and compressed storage backend for static files on local disk
+class LocalStaticStorage(CompressedStaticFilesMixin, ManifestStaticFilesStorage):
+    """Local Static Storage
+
+    Stores the static files in STATIC_ROOT under content-hashed names with
+    pre-compressed copies, to be served by nginx or a CDN with far-future
+    cache headers.
+
+    Extends:
+        CompressedStaticFilesMixin
+        ManifestStaticFilesStorage
+    """
@@ -11,6 +11,12 @@ urlpatterns = [path(settings.ADMIN_URL, admin.site.urls)]
 urlpatterns += [
     path("", include("apps.core.urls", namespace="core")),
     path("accounts/", include("apps.accounts.urls", namespace="accounts")),
+    path("leads/", include("apps.leads.urls", namespace="leads")),
+    path(
+        "notifications/",
+        include("apps.notifications.urls", namespace="notifications"),
+    ),
+    path("api/", include("apps.api.urls", namespace="api")),
 ]
 
 # If the project is in debug mode
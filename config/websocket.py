@@ -1,31 +1,180 @@
+# Imports
+import asyncio
+from http.cookies import SimpleCookie
+from importlib import import_module
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.db import close_old_connections
+from django.http.request import validate_host
+from redis import asyncio as aioredis
+
+from apps.core.push import USER_CHANNEL
+
+# Redis client of the process, shared by the connections
+_redis: aioredis.Redis | None = None
+
+
+# Function to get the redis client
+def get_redis() -> aioredis.Redis:
+    """Function to get the Redis client of the process
+
+    Returns:
+        aioredis.Redis: The Redis client.
+    """
+
+    # If the client is not created yet
+    global _redis
+    if _redis is None:
+        _redis = aioredis.Redis.from_url(
+            settings.REDIS_URL,
+            **({"ssl_cert_reqs": None} if settings.REDIS_SSL else {}),
+        )
+
+    # Return the client
+    return _redis
+
+
+# Function to get a header of the connection
+def get_header(scope: dict, name: bytes) -> str:
+    """Function to get a header of the connection
+
+    Args:
+        scope (dict): Scope of the connection.
+        name (bytes): Lowercase name of the header.
+
+    Returns:
+        str: The value of the header, empty if missing.
+    """
+
+    # Return the first matching header
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+# Function to check the origin of the connection
+def is_allowed_origin(scope: dict) -> bool:
+    """Function to check that the connection comes from a page of the site
+
+    Browsers send the session cookie with websocket connections from any
+    site, so connections from other origins are refused.
+
+    Args:
+        scope (dict): Scope of the connection.
+
+    Returns:
+        bool: Whether the origin is allowed, clients without one are.
+    """
+
+    # If the client is not a browser
+    origin = get_header(scope, b"origin")
+    if not origin:
+        return True
+
+    # Check the origin against the trusted origins and the allowed hosts
+    if origin in settings.CSRF_TRUSTED_ORIGINS:
+        return True
+    return validate_host(urlsplit(origin).hostname or "", settings.ALLOWED_HOSTS)
+
+
+# Function to get the user of the connection
+@sync_to_async
+def get_scope_user(scope: dict):
+    """Function to get the user from the session cookie of the connection
+
+    Args:
+        scope (dict): Scope of the connection.
+
+    Returns:
+        User | AnonymousUser: The user of the session.
+    """
+
+    # Read the session cookie
+    cookies = SimpleCookie(get_header(scope, b"cookie"))
+    morsel = cookies.get(settings.SESSION_COOKIE_NAME)
+    session_key = morsel.value if morsel else None
+
+    # Load the user of the session, like the authentication middleware
+    close_old_connections()
+    try:
+        session = import_module(settings.SESSION_ENGINE).SessionStore(session_key)
+        return get_user(SimpleNamespace(session=session))
+    finally:
+        close_old_connections()
+
+
+# Function to relay the messages of a user
+async def relay_messages(pubsub, send):
+    """Function to send the messages pushed to a user to the connection
+
+    Args:
+        pubsub (PubSub): Subscription to the channel of the user.
+        send (function): Function to send events.
+    """
+
+    # Loop over the messages of the channel
+    async for message in pubsub.listen():
+        # If the message is pushed to the user
+        if message["type"] == "message":
+            # Send the message
+            await send({"type": "websocket.send", "text": message["data"].decode()})
+
+
 # Function to handle websocket connections
 async def websocket_application(scope, receive, send):
     """Function to handle websocket connections
 
+    Only users logged in to the site may connect. Each connection subscribes
+    to the Redis channel of its user and receives the messages pushed to it
+    (see apps.core.push).
+
     Args:
         scope (dict): Scope of the connection.
         receive (function): Function to receive events.
         send (function): Function to send events.
     """
 
+    # Wait for the connection event
+    event = await receive()
+    if event["type"] != "websocket.connect":
+        return
+
+    # If the connection is not from a logged in user of the site, refuse it
+    user = await get_scope_user(scope) if is_allowed_origin(scope) else None
+    if user is None or not user.is_authenticated:
+        await send({"type": "websocket.close", "code": 4403})
+        return
+
+    # Accept the connection and subscribe to the channel of the user
+    await send({"type": "websocket.accept"})
+    pubsub = get_redis().pubsub()
+    await pubsub.subscribe(USER_CHANNEL.format(user.pk))
+    relay = asyncio.create_task(relay_messages(pubsub, send))
+
     # Loop to handle websocket events
-    while True:
-        # Receive event
-        event = await receive()
-
-        # If event is connection event
-        if event["type"] == "websocket.connect":
-            # Accept the connection
-            await send({"type": "websocket.accept"})
-
-        # If event is disconnect event
-        if event["type"] == "websocket.disconnect":
-            # Break the loop
-            break
-
-        # If event is receive event
-        if event["type"] == "websocket.receive":
-            # If text is ping
-            if event["text"] == "ping":
-                # Send pong
-                await send({"type": "websocket.send", "text": "pong!"})
+    try:
+        while True:
+            # Receive event
+            event = await receive()
+
+            # If event is disconnect event
+            if event["type"] == "websocket.disconnect":
+                # Break the loop
+                break
+
+            # If event is receive event
+            if event["type"] == "websocket.receive":
+                # If text is ping
+                if event.get("text") == "ping":
+                    # Send pong
+                    await send({"type": "websocket.send", "text": "pong!"})
+
+    # Stop relaying and unsubscribe
+    finally:
+        relay.cancel()
+        await pubsub.aclose()